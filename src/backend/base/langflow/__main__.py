@@ -1,10 +1,18 @@
+# ruff: noqa: E402
+import sys
+
+from langflow.utils.startup_profile import PROFILE_STARTUP_FLAG, start_startup_profiling
+
+if PROFILE_STARTUP_FLAG in sys.argv:
+    # Started before the imports below so that they are part of the startup profile
+    start_startup_profiling()
+
 import asyncio
 import inspect
 import os
 import platform
 import signal
 import socket
-import sys
 import time
 import warnings
 from contextlib import suppress
@@ -90,6 +98,16 @@ def run(
     host: str | None = typer.Option(None, help="Host to bind the server to.", show_default=False),
     workers: int | None = typer.Option(None, help="Number of worker processes.", show_default=False),
     worker_timeout: int | None = typer.Option(None, help="Worker timeout in seconds.", show_default=False),
+    profile_startup: bool | None = typer.Option(  # noqa: ARG001
+        None,
+        help="Time the startup phases, imports and component builds, and write them to a JSON report.",
+        show_default=False,
+    ),
+    preload_app: bool | None = typer.Option(  # noqa: ARG001
+        None,
+        help="Run the startup steps once in the master process before forking the workers.",
+        show_default=False,
+    ),
     port: int | None = typer.Option(None, help="Port to listen on.", show_default=False),
     components_path: Path | None = typer.Option(
         Path(__file__).parent / "components",
@@ -222,6 +240,7 @@ def run(
         "timeout": worker_timeout,
         "certfile": ssl_cert_file_path,
         "keyfile": ssl_key_file_path,
+        "preload_app": settings_service.settings.preload_app,
     }
     protocol = "https" if options["keyfile"] and options["certfile"] else "http"
 
@@ -415,12 +434,9 @@ def print_banner(host: str, port: int, protocol: str) -> None:
             "To contribute, set: [bold]DO_NOT_TRACK=false[/bold] in your environment."
         )
     )
-<<<<<<< HEAD
-    access_link = f"[bold]🟢 Open Sochflow →[/bold] [link={protocol}://{host}:{port}]{protocol}://{host}:{port}[/link]"
-=======
     access_host = host if host != "0.0.0.0" else "localhost"  # noqa: S104
-    access_link = f"[bold]🟢 Open Langflow →[/bold] [link={protocol}://{access_host}:{port}]{protocol}://{access_host}:{port}[/link]"
->>>>>>> upstream/main
+    access_url = f"{protocol}://{access_host}:{port}"
+    access_link = f"[bold]🟢 Open Sochflow →[/bold] [link={access_url}]{access_url}[/link]"
 
     message = f"{title}\n{info_text}\n\n{telemetry_text}\n\n{access_link}"
 
@@ -0,0 +1,42 @@
+"""Add content hash to file
+
+Revision ID: c4e8f1a2b9d3
+Revises: a3c9d7e41b52
+Create Date: 2026-10-19 15:42:08.730516
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = "c4e8f1a2b9d3"
+down_revision: Union[str, None] = "a3c9d7e41b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("file")]
+    indexes_names = [index["name"] for index in inspector.get_indexes("file")]
+    with op.batch_alter_table("file", schema=None) as batch_op:
+        if "content_hash" not in column_names:
+            batch_op.add_column(sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        if "ix_file_content_hash" not in indexes_names:
+            batch_op.create_index("ix_file_content_hash", ["content_hash"], unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("file")]
+    indexes_names = [index["name"] for index in inspector.get_indexes("file")]
+    with op.batch_alter_table("file", schema=None) as batch_op:
+        if "ix_file_content_hash" in indexes_names:
+            batch_op.drop_index("ix_file_content_hash")
+        if "content_hash" in column_names:
+            batch_op.drop_column("content_hash")
@@ -433,7 +433,8 @@ async def generate_flow_events(
                         next_vertex_id,
                         graph,
                         event_manager,
-                    )
+                    ),
+                    name=next_vertex_id,
                 )
                 tasks.append(task)
             await asyncio.gather(*tasks)
@@ -452,7 +453,7 @@ async def generate_flow_events(
 
     tasks = []
     for vertex_id in ids:
-        task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager))
+        task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager), name=vertex_id)
         tasks.append(task)
     try:
         await asyncio.gather(*tasks)
@@ -3,10 +3,13 @@ from __future__ import annotations
 import uuid
 from ast import literal_eval
 from datetime import timedelta
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import Depends, HTTPException, Query
+import anyio
+from fastapi import Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse
 from fastapi_pagination import Params
 from loguru import logger
 from sqlalchemy import delete
@@ -23,6 +26,9 @@ from langflow.services.deps import get_session, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
     from langflow.services.chat.service import ChatService
     from langflow.services.store.schema import StoreComponentCreate
 
@@ -378,3 +384,47 @@ async def verify_public_flow_and_get_user(flow_id: uuid.UUID, client_id: str | N
         raise HTTPException(status_code=403, detail=msg)
 
     return user, new_flow_id
+
+
+def is_not_modified(request_headers: Mapping[str, str], response_headers: Mapping[str, str]) -> bool:
+    """Whether a conditional GET can be answered with 304 Not Modified (RFC 9110, section 13.2.2)."""
+    if if_none_match := request_headers.get("if-none-match"):
+        etag = response_headers.get("etag")
+        if etag is None:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        # If-Modified-Since is ignored when If-None-Match is sent
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request_headers.get("if-modified-since")
+    last_modified = response_headers.get("last-modified")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+async def local_file_response(
+    request: Request,
+    path: Path,
+    *,
+    media_type: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Serve a file of the local filesystem, letting the server send it with `sendfile` where it can.
+
+    The response carries the `ETag` and `Last-Modified` of the file, and a conditional GET that matches them gets
+    an empty 304 instead. Raises `FileNotFoundError` if the file does not exist.
+    """
+    file_path = anyio.Path(path)
+    if not await file_path.is_file():
+        msg = f"File {path} not found"
+        raise FileNotFoundError(msg)
+    stat_result = await file_path.stat()
+    response = FileResponse(path, stat_result=stat_result, media_type=media_type, headers=headers)
+    if is_not_modified(request.headers, response.headers):
+        validators = {key: response.headers[key] for key in ("etag", "last-modified") if key in response.headers}
+        return Response(status_code=304, headers=validators)
+    return response
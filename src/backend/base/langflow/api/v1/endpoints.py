@@ -47,7 +47,7 @@ from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import precompressed_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -58,22 +58,36 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    The payload is compressed once per change of the types dictionary. Each encoding carries its own strong ETag,
+    so clients revalidating with `If-None-Match` get a `304 Not Modified` instead of the full body.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.interface.components import aget_all_types_payload
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        payload = await aget_all_types_payload(settings_service=get_settings_service())
+        return precompressed_response(payload, request)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.get("/all/{component_name}", dependencies=[Depends(get_current_active_user)])
+async def get_component(component_name: str):
+    """Retrieve the full template of a single component.
+
+    When components are loaded lazily, this builds the template the first time the component is opened.
+    """
+    from langflow.interface.components import get_component_template
+
+    template = await get_component_template(component_name, get_settings_service())
+    if template is None:
+        raise HTTPException(status_code=404, detail=f"Component {component_name} not found")
+    return template
+
+
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
     # If the input_value is not None and the input_type is "chat"
     # then we need to check the tweaks if the ChatInput component is present
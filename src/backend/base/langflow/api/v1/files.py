@@ -6,10 +6,10 @@ from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from fastapi.responses import StreamingResponse
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, local_file_response
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -73,7 +73,10 @@ async def upload_file(
 
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
-    file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
+    request: Request,
+    file_name: str,
+    flow_id: UUID,
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
 ):
     flow_id_str = str(flow_id)
     extension = file_name.split(".")[-1]
@@ -89,19 +92,21 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
         }
+        if (local_path := storage_service.get_local_path(flow_id_str, file_name)) is not None:
+            return await local_file_response(request, local_path, media_type=content_type, headers=headers)
+        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
+        headers["Content-Length"] = str(len(file_content))
         return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @router.get("/images/{flow_id}/{file_name}")
-async def download_image(file_name: str, flow_id: UUID):
+async def download_image(request: Request, file_name: str, flow_id: UUID):
     storage_service = get_storage_service()
     extension = file_name.split(".")[-1]
     flow_id_str = str(flow_id)
@@ -119,6 +124,8 @@ async def download_image(file_name: str, flow_id: UUID):
         raise HTTPException(status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
+        if (local_path := storage_service.get_local_path(flow_id_str, file_name)) is not None:
+            return await local_file_response(request, local_path, media_type=content_type)
         file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         return StreamingResponse(BytesIO(file_content), media_type=content_type)
     except Exception as e:
@@ -127,6 +134,7 @@ async def download_image(file_name: str, flow_id: UUID):
 
 @router.get("/profile_pictures/{folder_name}/{file_name}")
 async def download_profile_picture(
+    request: Request,
     folder_name: str,
     file_name: str,
 ):
@@ -137,6 +145,8 @@ async def download_profile_picture(
         config_path = Path(config_dir)  # type: ignore[arg-type]
         folder_path = config_path / "profile_pictures" / folder_name
         content_type = build_content_type_from_extension(extension)
+        if (local_path := storage_service.get_local_path(folder_path, file_name)) is not None:  # type: ignore[arg-type]
+            return await local_file_response(request, local_path, media_type=content_type)
         file_content = await storage_service.get_file(flow_id=folder_path, file_name=file_name)  # type: ignore[arg-type]
         return StreamingResponse(BytesIO(file_content), media_type=content_type)
 
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
-import io
 import json
 import re
-import zipfile
 from datetime import datetime, timezone
-from typing import Annotated
+from functools import partial
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 import orjson
 from aiofile import async_open
 from anyio import Path
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
@@ -23,15 +22,24 @@ from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
+from langflow.initial_setup.flow_sync import track_flow_file
 from langflow.logging import logger
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
 from langflow.services.database.models.flow.model import AccessTypeEnum, FlowHeader
-from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
+from langflow.services.database.models.flow.utils import (
+    get_webhook_component_in_flow,
+    select_flow_headers,
+    to_flow_header,
+)
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.services.settings.service import SettingsService
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import compress_response, streaming_json_response
+from langflow.utils.zip_stream import ZipEntry, zip_streaming_response
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
 
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
@@ -51,6 +59,8 @@ async def _save_flow_to_fs(flow: Flow) -> None:
                 await f.write(flow.model_dump_json())
             except OSError:
                 logger.exception("Failed to write flow %s to path %s", flow.name, flow.fs_path)
+                return
+        await track_flow_file(flow)
 
 
 async def _new_flow(
@@ -71,17 +81,17 @@ async def _new_flow(
         # so we need to check if the name is unique with `like` operator
         # if we find a flow with the same name, we add a number to the end of the name
         # based on the highest number found
-        if (await session.exec(select(Flow).where(Flow.name == flow.name).where(Flow.user_id == user_id))).first():
-            flows = (
+        if (await session.exec(select(Flow.id).where(Flow.name == flow.name).where(Flow.user_id == user_id))).first():
+            flow_names = (
                 await session.exec(
-                    select(Flow).where(Flow.name.like(f"{flow.name} (%")).where(Flow.user_id == user_id)  # type: ignore[attr-defined]
+                    select(Flow.name).where(Flow.name.like(f"{flow.name} (%")).where(Flow.user_id == user_id)  # type: ignore[attr-defined]
                 )
             ).all()
-            if flows:
+            if flow_names:
                 extract_number = re.compile(r"\((\d+)\)$")
                 numbers = []
-                for _flow in flows:
-                    result = extract_number.search(_flow.name)
+                for flow_name in flow_names:
+                    result = extract_number.search(flow_name)
                     if result:
                         numbers.append(int(result.groups(1)[0]))
                 if numbers:
@@ -93,22 +103,22 @@ async def _new_flow(
             flow.endpoint_name
             and (
                 await session.exec(
-                    select(Flow).where(Flow.endpoint_name == flow.endpoint_name).where(Flow.user_id == user_id)
+                    select(Flow.id).where(Flow.endpoint_name == flow.endpoint_name).where(Flow.user_id == user_id)
                 )
             ).first()
         ):
-            flows = (
+            endpoint_names = (
                 await session.exec(
-                    select(Flow)
+                    select(Flow.endpoint_name)
                     .where(Flow.endpoint_name.like(f"{flow.endpoint_name}-%"))  # type: ignore[union-attr]
                     .where(Flow.user_id == user_id)
                 )
             ).all()
-            if flows:
+            if endpoint_names:
                 # The endpoint name is like "my-endpoint","my-endpoint-1", "my-endpoint-2"
                 # so we need to get the highest number and add 1
                 # we need to get the last part of the endpoint name
-                numbers = [int(flow.endpoint_name.split("-")[-1]) for flow in flows]
+                numbers = [int(endpoint_name.split("-")[-1]) for endpoint_name in endpoint_names]
                 flow.endpoint_name = f"{flow.endpoint_name}-{max(numbers) + 1}"
             else:
                 flow.endpoint_name = f"{flow.endpoint_name}-1"
@@ -136,6 +146,91 @@ async def _new_flow(
     return db_flow
 
 
+class _UniqueNames:
+    """Resolves collisions of flow or endpoint names with the ones taken, as `_new_flow` does.
+
+    A taken name gets the number after the highest one in use, e.g. "My Flow (3)" or "my-endpoint-3". The names
+    claimed are taken in turn, so that the flows of a batch do not collide with each other either.
+    """
+
+    def __init__(self, taken: Iterable[str], template: str) -> None:
+        self.taken = set(taken)
+        self.template = template
+        self._next_numbers: dict[str, int] = {}
+
+    def _first_number(self, name: str) -> int:
+        prefix, suffix = self.template.format(name=name, number="\0").split("\0")
+        numbers = [
+            int(middle)
+            for taken in self.taken
+            if taken.startswith(prefix)
+            and taken.endswith(suffix)
+            and (middle := taken[len(prefix) : len(taken) - len(suffix)]).isdigit()
+        ]
+        return max(numbers, default=0) + 1
+
+    def claim(self, name: str) -> str:
+        if name in self.taken:
+            number = self._next_numbers.get(name) or self._first_number(name)
+            while (candidate := self.template.format(name=name, number=number)) in self.taken:
+                number += 1
+            self._next_numbers[name] = number + 1
+            name = candidate
+        self.taken.add(name)
+        return name
+
+
+async def _new_flows(
+    *,
+    session: AsyncSession,
+    flows: list[FlowCreate],
+    user_id: UUID,
+) -> list[Flow]:
+    """Build many new flows at once, resolving the name and endpoint collisions as `_new_flow` does.
+
+    The names and endpoints in use are read with a single query, instead of several queries per flow. The flows are
+    returned to be added by the caller, which SQLAlchemy then inserts with multi-row INSERT statements.
+    """
+    try:
+        taken = (await session.exec(select(Flow.name, Flow.endpoint_name).where(Flow.user_id == user_id))).all()
+        names = _UniqueNames((name for name, _ in taken), "{name} ({number})")
+        endpoint_names = _UniqueNames((endpoint_name for _, endpoint_name in taken if endpoint_name), "{name}-{number}")
+
+        default_folder_id = None
+        if any(flow.folder_id is None for flow in flows):
+            # Make sure flows always have a folder
+            default_folder_id = (
+                await session.exec(
+                    select(Folder.id).where(Folder.name == DEFAULT_FOLDER_NAME, Folder.user_id == user_id)
+                )
+            ).first()
+
+        updated_at = datetime.now(timezone.utc)
+        db_flows = []
+        for flow in flows:
+            await _verify_fs_path(flow.fs_path)
+            if flow.user_id is None:
+                flow.user_id = user_id
+            flow.name = names.claim(flow.name)
+            if flow.endpoint_name:
+                flow.endpoint_name = endpoint_names.claim(flow.endpoint_name)
+
+            db_flow = Flow.model_validate(flow, from_attributes=True)
+            db_flow.updated_at = updated_at
+            if db_flow.folder_id is None:
+                db_flow.folder_id = default_folder_id
+            db_flows.append(db_flow)
+    except Exception as e:
+        # If it is a validation error, return the error message
+        if hasattr(e, "errors"):
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return db_flows
+
+
 @router.post("/", response_model=FlowRead, status_code=201)
 async def create_flow(
     *,
@@ -168,6 +263,29 @@ async def create_flow(
     return db_flow
 
 
+# Number of flows fetched from the database at a time when streaming them
+FLOW_STREAM_BATCH_SIZE = 50
+# Flows inserted per flush when importing flows
+FLOW_IMPORT_BATCH_SIZE = 500
+
+
+async def _stream_flows(
+    stmt, *, header_flows: bool, components_only: bool, excluded_folder_id: UUID | None
+) -> AsyncIterator[Flow | FlowHeader]:
+    async with session_scope() as session:
+        result = await session.stream(stmt.execution_options(yield_per=FLOW_STREAM_BATCH_SIZE))
+        async for row in result:
+            if header_flows:
+                flow = to_flow_header(row)
+            else:
+                flow = validate_is_component([row[0]])[0]
+                if excluded_folder_id and flow.folder_id == excluded_folder_id:
+                    continue
+            if components_only and not flow.is_component:
+                continue
+            yield flow
+
+
 @router.get("/", response_model=list[FlowRead] | Page[FlowRead] | list[FlowHeader], status_code=200)
 async def read_flows(
     *,
@@ -179,9 +297,12 @@ async def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    request: Request,
 ):
     """Retrieve a list of flows with pagination support.
 
+    With `get_all`, the flows are streamed, so that the response is never built in memory as a whole.
+
     Args:
         current_user (User): The current authenticated user.
         session (Session): The database session.
@@ -195,6 +316,7 @@ async def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+        request (Request): The request, whose `Accept-Encoding` tells whether the streamed flows are gzipped.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
@@ -218,12 +340,14 @@ async def read_flows(
         if not folder_id:
             folder_id = default_folder_id
 
+        # Headers are read with a projection, so that the data of the flows is not loaded
+        stmt = select_flow_headers() if get_all and header_flows else select(Flow)
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
+            stmt = stmt.where(
                 (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
             )
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            stmt = stmt.where(Flow.user_id == current_user.id)
 
         if remove_example_flows:
             stmt = stmt.where(Flow.folder_id != starter_folder_id)
@@ -232,19 +356,14 @@ async def read_flows(
             stmt = stmt.where(Flow.is_component == True)  # noqa: E712
 
         if get_all:
-            flows = (await session.exec(stmt)).all()
-            flows = validate_is_component(flows)
-            if components_only:
-                flows = [flow for flow in flows if flow.is_component]
-            if remove_example_flows and starter_folder_id:
-                flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
-
-            # Compress the full flows response
-            return compress_response(flows)
+            # Streamed from a session of its own, as the request's session is closed before the body is sent
+            flows = _stream_flows(
+                stmt,
+                header_flows=header_flows,
+                components_only=components_only,
+                excluded_folder_id=starter_folder_id if remove_example_flows else None,
+            )
+            return streaming_json_response(flows, request, offload_batch_size=FLOW_STREAM_BATCH_SIZE)
 
         stmt = stmt.where(Flow.folder_id == folder_id)
 
@@ -403,19 +522,29 @@ async def create_flows(
     flow_list: FlowListCreate,
     current_user: CurrentActiveUser,
 ):
-    """Create multiple new flows."""
-    db_flows = []
+    """Create multiple new flows, in a single transaction."""
     for flow in flow_list.flows:
         flow.user_id = current_user.id
-        db_flow = Flow.model_validate(flow, from_attributes=True)
-        session.add(db_flow)
-        db_flows.append(db_flow)
+    db_flows = await _new_flows(session=session, flows=flow_list.flows, user_id=current_user.id)
+    session.add_all(db_flows)
     await session.commit()
     for db_flow in db_flows:
-        await session.refresh(db_flow)
+        await _save_flow_to_fs(db_flow)
     return db_flows
 
 
+async def _read_flow_list(file: UploadFile, user_id: UUID, folder_id: UUID | None) -> FlowListCreate:
+    contents = await file.read()
+    data = orjson.loads(contents)
+    flow_list = FlowListCreate(**data) if "flows" in data else FlowListCreate(flows=[FlowCreate(**data)])
+    # Now we set the user_id for all flows
+    for flow in flow_list.flows:
+        flow.user_id = user_id
+        if folder_id:
+            flow.folder_id = folder_id
+    return flow_list
+
+
 @router.post("/upload/", response_model=list[FlowRead], status_code=201)
 async def upload_file(
     *,
@@ -425,22 +554,13 @@ async def upload_file(
     folder_id: UUID | None = None,
 ):
     """Upload flows from a file."""
-    contents = await file.read()
-    data = orjson.loads(contents)
-    response_list = []
-    flow_list = FlowListCreate(**data) if "flows" in data else FlowListCreate(flows=[FlowCreate(**data)])
-    # Now we set the user_id for all flows
-    for flow in flow_list.flows:
-        flow.user_id = current_user.id
-        if folder_id:
-            flow.folder_id = folder_id
-        response = await _new_flow(session=session, flow=flow, user_id=current_user.id)
-        response_list.append(response)
+    flow_list = await _read_flow_list(file, current_user.id, folder_id)
+    response_list = await _new_flows(session=session, flows=flow_list.flows, user_id=current_user.id)
+    session.add_all(response_list)
 
     try:
         await session.commit()
         for db_flow in response_list:
-            await session.refresh(db_flow)
             await _save_flow_to_fs(db_flow)
     except Exception as e:
         if "UNIQUE constraint failed" in str(e):
@@ -461,6 +581,47 @@ async def upload_file(
     return response_list
 
 
+def _import_event(event: str, **data) -> bytes:
+    return orjson.dumps({"event": event, "data": data}) + b"\n"
+
+
+async def _import_flows(flows: list[FlowCreate], user_id: UUID) -> AsyncIterator[bytes]:
+    total = len(flows)
+    try:
+        async with session_scope() as session:
+            db_flows = await _new_flows(session=session, flows=flows, user_id=user_id)
+            for start in range(0, total, FLOW_IMPORT_BATCH_SIZE):
+                session.add_all(db_flows[start : start + FLOW_IMPORT_BATCH_SIZE])
+                await session.flush()
+                yield _import_event("progress", imported=min(start + FLOW_IMPORT_BATCH_SIZE, total), total=total)
+            headers = [{"id": str(db_flow.id), "name": db_flow.name} for db_flow in db_flows]
+        # The flows are committed when the session scope exits
+        for db_flow in db_flows:
+            await _save_flow_to_fs(db_flow)
+    except Exception as e:  # noqa: BLE001
+        logger.exception("Error importing flows")
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        yield _import_event("error", detail=detail)
+        return
+    yield _import_event("end", flows=headers)
+
+
+@router.post("/import/", status_code=200)
+async def import_flows(
+    *,
+    file: Annotated[UploadFile, File(...)],
+    current_user: CurrentActiveUser,
+    folder_id: UUID | None = None,
+):
+    """Import flows from a file, as `/upload/` does, streaming the progress as newline-delimited JSON events.
+
+    The flows are inserted in a single transaction: a `progress` event is sent after each batch of rows, then an
+    `end` event with the ids and names of the flows, or an `error` event if nothing was imported.
+    """
+    flow_list = await _read_flow_list(file, current_user.id, folder_id)
+    return StreamingResponse(_import_flows(flow_list.flows, current_user.id), media_type="application/x-ndjson")
+
+
 @router.delete("/")
 async def delete_multiple_flows(
     flow_ids: list[UUID],
@@ -491,6 +652,10 @@ async def delete_multiple_flows(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+async def _flow_json_chunks(flow: dict) -> AsyncIterator[bytes]:
+    yield json.dumps(jsonable_encoder(flow)).encode()
+
+
 @router.post("/download/", status_code=200)
 async def download_multiple_file(
     flow_ids: list[UUID],
@@ -506,30 +671,17 @@ async def download_multiple_file(
     flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in flows]
 
     if len(flows_without_api_keys) > 1:
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for flow in flows_without_api_keys:
-                # Convert the flow object to JSON
-                flow_json = json.dumps(jsonable_encoder(flow))
-
-                # Write the JSON to the ZIP file
-                zip_file.writestr(f"{flow['name']}.json", flow_json)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # Each flow is serialized only when it is written to the archive
+        entries = [
+            ZipEntry(name=f"{flow['name']}.json", open=partial(_flow_json_chunks, flow))
+            for flow in flows_without_api_keys
+        ]
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_flows.zip"
 
-        return StreamingResponse(
-            zip_stream,
-            media_type="application/x-zip-compressed",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+        return zip_streaming_response(entries, filename)
     return flows_without_api_keys[0]
 
 
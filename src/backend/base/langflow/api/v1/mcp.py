@@ -15,7 +15,7 @@ from loguru import logger
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
@@ -106,7 +106,7 @@ async def handle_list_resources():
         base_url = f"http://{host}:{port}".rstrip("/")
 
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
+            flows = (await session.exec(select(Flow.id, Flow.name))).all()
 
             for flow in flows:
                 if flow.id:
@@ -177,12 +177,10 @@ async def handle_list_tools():
     try:
         db_service = get_db_service()
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
+            # The input schemas of the tools are built from the data of the flows
+            flows = (await session.exec(select(Flow).where(col(Flow.user_id).is_not(None)))).all()
 
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 flow_name = "_".join(flow.name.lower().split())
                 try:
                     tool = types.Tool(
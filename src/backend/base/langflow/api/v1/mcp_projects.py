@@ -19,7 +19,6 @@ from fastapi.responses import HTMLResponse
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
-from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from langflow.api.v1.endpoints import simple_run_flow
@@ -35,6 +34,7 @@ from langflow.helpers.flow import json_schema_from_flow
 from langflow.schema.message import Message
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import Flow, Folder, User
+from langflow.services.database.models.flow.utils import without_flow_data
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 from langflow.services.storage.utils import build_content_type_from_extension
 
@@ -70,18 +70,16 @@ async def list_project_tools(
         async with session_scope() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder.id).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
             # Query flows in the project
-            flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+            flows_query = without_flow_data(
+                select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+            )
 
             # Optionally filter for MCP-enabled flows only
             if mcp_enabled:
@@ -233,18 +231,14 @@ async def update_project_mcp_settings(
         async with session_scope() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder.id).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
             # Query flows in the project
-            flows = (await session.exec(select(Flow).where(Flow.folder_id == project_id))).all()
+            flows = (await session.exec(without_flow_data(select(Flow).where(Flow.folder_id == project_id)))).all()
             flows_to_update = {x.id: x for x in settings}
 
             updated_flows = []
@@ -559,7 +553,7 @@ class ProjectMCPServer:
                 base_url = f"http://{host}:{port}".rstrip("/")
 
                 async with session_scope() as session:
-                    flows = (await session.exec(select(Flow))).all()
+                    flows = (await session.exec(select(Flow.id, Flow.name))).all()
 
                     for flow in flows:
                         if flow.id:
@@ -1,15 +1,18 @@
-from typing import Annotated
+from functools import partial
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.memory import encode_message_cursor, order_messages
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
+from langflow.services.cache.metrics import get_cache_metrics
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,19 +21,38 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_loop_monitor_service
+from langflow.utils.offload import model_json_response, rows_json_response
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
-@router.get("/builds")
-async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
+
+@router.get("/builds", response_model=VertexBuildMapModel)
+async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> Response:
     try:
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
-        return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
+        # The builds are grouped and serialized off the event loop
+        return await model_json_response(
+            partial(VertexBuildMapModel.from_list_of_dicts, vertex_builds), rows=len(vertex_builds)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/cache", dependencies=[Depends(get_current_active_superuser)])
+async def get_cache_stats() -> dict[str, dict[str, dict]]:
+    """Return hit/miss, eviction, latency and size statistics per cache and key namespace."""
+    return get_cache_metrics().snapshot()
+
+
+@router.get("/loop", dependencies=[Depends(get_current_active_superuser)])
+async def get_loop_lag() -> dict[str, Any]:
+    """Return the lag of the event loop and the latest callbacks that blocked it, with their stack."""
+    return get_loop_monitor_service().snapshot()
+
+
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
@@ -40,7 +62,7 @@ async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSes
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.get("/messages")
+@router.get("/messages", response_model=list[MessageResponse])
 async def get_messages(
     session: DbSession,
     flow_id: Annotated[UUID | None, Query()] = None,
@@ -48,9 +70,17 @@ async def get_messages(
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
-) -> list[MessageResponse]:
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    cursor: Annotated[str | None, Query()] = None,
+) -> Response:
+    """List messages, oldest first.
+
+    With `limit`, the messages are paginated: the `X-Next-Cursor` response header holds the cursor to pass back to
+    get the next page, and is omitted on the last page.
+    """
     try:
-        stmt = select(MessageTable)
+        # Plain rows, validated and serialized off the event loop
+        stmt = select(*MessageTable.__table__.columns)  # type: ignore[attr-defined]
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
         if session_id:
@@ -59,11 +89,19 @@ async def get_messages(
             stmt = stmt.where(MessageTable.sender == sender)
         if sender_name:
             stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        messages = await session.exec(stmt)
-        return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
+        try:
+            stmt = order_messages(stmt, order_by, "ASC", cursor=cursor, paginated=limit is not None)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if limit:
+            stmt = stmt.limit(limit)
+        messages = list(await session.exec(stmt))
+        headers = {}
+        if limit and len(messages) == limit:
+            headers[NEXT_CURSOR_HEADER] = encode_message_cursor(messages[-1])
+        return await rows_json_response(MessageResponse, [message._mapping for message in messages], headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
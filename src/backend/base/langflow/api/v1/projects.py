@@ -1,14 +1,13 @@
-import io
 import json
-import zipfile
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from functools import partial
 from typing import Annotated
 from uuid import UUID
 
 import orjson
 from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import StreamingResponse
 from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import or_, update
@@ -18,7 +17,6 @@ from sqlmodel import select
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, custom_params, remove_api_keys
 from langflow.api.v1.flows import create_flows
 from langflow.api.v1.schemas import FlowListCreate
-from langflow.helpers.flow import generate_unique_flow_name
 from langflow.helpers.folders import generate_unique_folder_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.database.models.flow.model import Flow, FlowCreate, FlowRead
@@ -31,6 +29,8 @@ from langflow.services.database.models.folder.model import (
     FolderUpdate,
 )
 from langflow.services.database.models.folder.pagination_model import FolderWithPaginatedFlows
+from langflow.services.deps import session_scope
+from langflow.utils.zip_stream import ZipEntry, zip_streaming_response
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -125,14 +125,13 @@ async def read_project(
     is_flow: bool = False,
     search: str = "",
 ):
+    paginated = bool(params and params.page and params.size)
     try:
-        project = (
-            await session.exec(
-                select(Folder)
-                .options(selectinload(Folder.flows))
-                .where(Folder.id == project_id, Folder.user_id == current_user.id)
-            )
-        ).first()
+        stmt = select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id)
+        if not paginated:
+            # Only the unpaginated response includes the flows
+            stmt = stmt.options(selectinload(Folder.flows))
+        project = (await session.exec(stmt)).first()
     except Exception as e:
         if "No result found" in str(e):
             raise HTTPException(status_code=404, detail="Project not found") from e
@@ -142,7 +141,7 @@ async def read_project(
         raise HTTPException(status_code=404, detail="Project not found")
 
     try:
-        if params and params.page and params.size:
+        if paginated:
             stmt = select(Flow).where(Flow.folder_id == project_id)
 
             if Flow.updated_at is not None:
@@ -240,12 +239,11 @@ async def delete_project(
     current_user: CurrentActiveUser,
 ):
     try:
-        flows = (
-            await session.exec(select(Flow).where(Flow.folder_id == project_id, Flow.user_id == current_user.id))
+        flow_ids = (
+            await session.exec(select(Flow.id).where(Flow.folder_id == project_id, Flow.user_id == current_user.id))
         ).all()
-        if len(flows) > 0:
-            for flow in flows:
-                await cascade_delete_flow(session, flow.id)
+        for flow_id in flow_ids:
+            await cascade_delete_flow(session, flow_id)
 
         project = (
             await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
@@ -264,6 +262,17 @@ async def delete_project(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _flow_json_chunks(flow_id: UUID) -> AsyncIterator[bytes]:
+    # The archive is sent after the request's session is closed, so the flow is read in a session of its own
+    async with session_scope() as session:
+        flow = await session.get(Flow, flow_id)
+        if flow is None:
+            msg = f"Flow {flow_id} not found"
+            raise ValueError(msg)
+        flow_without_api_keys = remove_api_keys(FlowRead.model_validate(flow, from_attributes=True).model_dump())
+    yield json.dumps(jsonable_encoder(flow_without_api_keys)).encode()
+
+
 @router.get("/download/{project_id}", status_code=200)
 async def download_file(
     *,
@@ -280,31 +289,21 @@ async def download_file(
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        flows_query = select(Flow).where(Flow.folder_id == project_id)
-        flows_result = await session.exec(flows_query)
-        flows = [FlowRead.model_validate(flow, from_attributes=True) for flow in flows_result.all()]
+        # Only the names are read here: each flow is read when it is written to the archive
+        flows_query = select(Flow.id, Flow.name).where(Flow.folder_id == project_id)
+        flows = (await session.exec(flows_query)).all()
 
         if not flows:
             raise HTTPException(status_code=404, detail="No flows found in project")
 
-        flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in flows]
-        zip_stream = io.BytesIO()
-
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for flow in flows_without_api_keys:
-                flow_json = json.dumps(jsonable_encoder(flow))
-                zip_file.writestr(f"{flow['name']}.json", flow_json)
-
-        zip_stream.seek(0)
+        entries = [
+            ZipEntry(name=f"{flow_name}.json", open=partial(_flow_json_chunks, flow_id)) for flow_id, flow_name in flows
+        ]
 
         current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_{project.name}_flows.zip"
 
-        return StreamingResponse(
-            zip_stream,
-            media_type="application/x-zip-compressed",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+        return zip_streaming_response(entries, filename)
 
     except Exception as e:
         if "No result found" in str(e):
@@ -346,10 +345,8 @@ async def upload_file(
         flow_list = FlowListCreate(flows=[FlowCreate(**flow) for flow in data["flows"]])
     else:
         raise HTTPException(status_code=400, detail="No flows found in the data")
-    # Now we set the user_id for all flows
+    # Now we set the user_id for all flows; their names are made unique by `create_flows` in bulk
     for flow in flow_list.flows:
-        flow_name = await generate_unique_flow_name(flow.name, current_user.id, session)
-        flow.name = flow_name
         flow.user_id = current_user.id
         flow.folder_id = new_project.id
 
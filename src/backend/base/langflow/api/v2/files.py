@@ -1,23 +1,35 @@
-import io
 import re
 import uuid
-import zipfile
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Request, Response, UploadFile
 from fastapi.responses import StreamingResponse
+from loguru import logger
 from sqlmodel import String, cast, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.api.schemas import UploadFileResponse
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, local_file_response
 from langflow.services.database.models.file import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.content_addressed import (
+    BLOB_FOLDER,
+    blob_lock,
+    blob_path,
+    hash_chunks,
+    release_blob,
+    save_blob,
+    split_file_path,
+)
+from langflow.services.storage.service import STREAM_CHUNK_SIZE, StorageService
+from langflow.services.storage.utils import RangeNotSatisfiableError, parse_range_header
+from langflow.utils.zip_stream import ZipEntry, zip_streaming_response
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -28,6 +40,31 @@ async def byte_stream_generator(file_bytes: bytes, chunk_size: int = 8192) -> As
         yield file_bytes[i : i + chunk_size]
 
 
+async def upload_file_chunks(file: UploadFile, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncGenerator[bytes, None]:
+    """Read an upload (spooled to disk by Starlette beyond 1 MB) in chunks."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def delete_stored_files(files: list[UserFile], session: AsyncSession, storage_service: StorageService) -> None:
+    """Delete the stored content of files whose rows were just deleted (and flushed), and commit the deletion.
+
+    Blobs of the content-addressed storage are released once the deletion is committed: `release_blob` only deletes
+    those that no file references anymore.
+    """
+    paths = {file.path for file in files}
+    blob_paths = {path for path in paths if path.startswith(f"{BLOB_FOLDER}/")}
+    for path in paths - blob_paths:
+        await storage_service.delete_file(*split_file_path(path))
+    await session.commit()
+    for path in blob_paths:
+        try:
+            await release_blob(session, storage_service, path)
+        except Exception:  # noqa: BLE001
+            # The files are deleted already; the blob is left to the collection of unreferenced blobs
+            logger.opt(exception=True).warning(f"Could not release the blob {path}")
+
+
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -76,16 +113,23 @@ async def upload_user_file(
     try:
         # Create a unique file name
         file_id = uuid.uuid4()
-        file_content = await file.read()
 
         # Get file extension of the file
         file_extension = "." + file.filename.split(".")[-1] if file.filename and "." in file.filename else ""
         anonymized_file_name = f"{file_id!s}{file_extension}"
 
-        # Here we use the current user's id as the folder name
-        folder = str(current_user.id)
-        # Save the file using the storage service.
-        await storage_service.save_file(flow_id=folder, file_name=anonymized_file_name, data=file_content)
+        content_hash = None
+        if settings_service.settings.content_addressed_storage:
+            # Files of the same content share a blob named after their hash, written along with the file record
+            content_hash, file_size = await hash_chunks(upload_file_chunks(file))
+            await file.seek(0)
+            file_path = blob_path(content_hash, file_extension)
+        else:
+            # Here we use the current user's id as the folder name
+            folder = str(current_user.id)
+            file_path = f"{folder}/{anonymized_file_name}"
+            # Stream the upload into the storage service, so that it is never held in memory as a whole
+            file_size = await storage_service.save_file_stream(folder, anonymized_file_name, upload_file_chunks(file))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
@@ -121,12 +165,6 @@ async def upload_user_file(
             # Split the extension from the filename
             root_filename = f"{root_filename} ({count + 1})"
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(flow_id=folder, file_name=anonymized_file_name)
-
-        # Compute the file path
-        file_path = f"{folder}/{anonymized_file_name}"
-
         # Create a new file record
         new_file = UserFile(
             id=file_id,
@@ -134,10 +172,17 @@ async def upload_user_file(
             name=root_filename,
             path=file_path,
             size=file_size,
+            content_hash=content_hash,
         )
-        session.add(new_file)
-
-        await session.commit()
+        if content_hash is None:
+            session.add(new_file)
+            await session.commit()
+        else:
+            # The blob is written, unless already referenced, and its new reference committed under its lock
+            async with blob_lock(session, file_path):
+                await save_blob(session, storage_service, file_path, upload_file_chunks(file))
+                session.add(new_file)
+                await session.commit()
         await session.refresh(new_file)
     except Exception as e:
         # Optionally, you could also delete the file from disk if the DB insert fails.
@@ -180,14 +225,11 @@ async def delete_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Delete all files from the storage service
+        # Delete all files from the database, then from the storage service
         for file in files:
-            await storage_service.delete_file(flow_id=str(current_user.id), file_name=file.path)
             await session.delete(file)
-
-        # Delete all files from the database
         await session.flush()  # Ensures delete is staged
-        await session.commit()  # Commit deletion
+        await delete_stored_files(files, session, storage_service)  # Commits the deletion
 
     except Exception as e:
         await session.rollback()  # Rollback on failure
@@ -213,37 +255,22 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # The files are read from the storage while the archive is being sent
+        entries = [
+            ZipEntry(
+                # Name each file after its original name, with its extension
+                name=f"{file.name}{Path(file.path).suffix}",
+                open=partial(storage_service.get_file_stream, *split_file_path(file.path)),
+                size=file.size,
+            )
+            for file in files
+        ]
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
-        return StreamingResponse(
-            zip_stream,
-            media_type="application/x-zip-compressed",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+        return zip_streaming_response(entries, filename)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading files: {e}") from e
@@ -255,32 +282,55 @@ async def download_file(
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    request: Request,
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
-    """Download a file by its ID."""
+    """Download a file by its ID, streamed from the storage. A single byte range can be requested with `Range`."""
     try:
         # Fetch the file from the DB
         file = await fetch_file_object(file_id, current_user, session)
 
-        # Get the basename of the file path
-        file_name = file.path.split("/")[-1]
-
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+        # The folder and the basename of the file path
+        folder, file_name = split_file_path(file.path)
+        file_size = await storage_service.get_file_size(folder, file_name)
 
         file_extension = Path(file.path).suffix
         # Create the filename with extension
         filename_with_extension = f"{file.name}{file_extension}"
-
-        # Ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename_with_extension}"',
+        "Accept-Ranges": "bytes",
+    }
+    try:
+        byte_range = parse_range_header(range_header, file_size)
+    except RangeNotSatisfiableError:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{file_size}"})
+
+    local_path = storage_service.get_local_path(folder, file_name)
+    if byte_range is None and local_path is not None:
+        # Plain downloads of local files are sent by the server with sendfile
+        return await local_file_response(request, local_path, media_type="application/octet-stream", headers=headers)
+    if byte_range is None:
+        byte_stream = storage_service.get_file_stream(folder, file_name)
+        headers["Content-Length"] = str(file_size)
+        status_code = 200
+    else:
+        byte_stream = storage_service.get_file_stream(folder, file_name, start=byte_range.start, end=byte_range.end)
+        headers["Content-Length"] = str(byte_range.length)
+        headers["Content-Range"] = f"bytes {byte_range.start}-{byte_range.end}/{file_size}"
+        status_code = 206
+
     # Return the file as a streaming response
     return StreamingResponse(
         byte_stream,
+        status_code=status_code,
         media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
+        headers=headers,
     )
 
 
@@ -319,13 +369,10 @@ async def delete_file(
         if not file:
             raise HTTPException(status_code=404, detail="File not found")
 
-        # Delete the file from the storage service
-        await storage_service.delete_file(flow_id=str(current_user.id), file_name=file.path)
-
-        # Delete from the database
+        # Delete from the database, then from the storage service
         await session.delete(file)
         await session.flush()  # Ensures delete is staged
-        await session.commit()  # Commit deletion
+        await delete_stored_files([file], session, storage_service)  # Commits the deletion
 
     except Exception as e:
         await session.rollback()  # Rollback on failure
@@ -348,14 +395,11 @@ async def delete_all_files(
         results = await session.exec(stmt)
         files = results.all()
 
-        # Delete all files from the storage service
+        # Delete all files from the database, then from the storage service
         for file in files:
-            await storage_service.delete_file(flow_id=str(current_user.id), file_name=file.path)
             await session.delete(file)
-
-        # Delete all files from the database
         await session.flush()  # Ensures delete is staged
-        await session.commit()  # Commit deletion
+        await delete_stored_files(files, session, storage_service)  # Commits the deletion
 
     except Exception as e:
         await session.rollback()  # Rollback on failure
@@ -1,5 +1,16 @@
-from .base_file import BaseFileComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .base_file import BaseFileComponent
+
+_dynamic_imports = {"BaseFileComponent": "base_file"}
 
 __all__ = [
     "BaseFileComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
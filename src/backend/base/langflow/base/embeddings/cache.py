@@ -0,0 +1,167 @@
+"""Content-addressed cache for embedding vectors.
+
+Vectors are keyed by the embedding model identity and a hash of the normalized text, and stored as float32
+blobs in SQLite. `CachedEmbeddings` wraps any LangChain `Embeddings` so that re-embedding unchanged chunks
+is served from the store and only new texts reach the provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# SQLite limits the number of bound parameters per statement
+FETCH_BATCH_SIZE = 500
+_MODEL_ATTRIBUTES = ("model", "model_name", "model_id", "deployment", "dimensions")
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def embedding_model_id(embeddings: Embeddings) -> str:
+    """Identify the provider, model and output size an `Embeddings` instance produces vectors for."""
+    cls = type(embeddings)
+    parts = [f"{cls.__module__}.{cls.__qualname__}"]
+    for attribute in _MODEL_ATTRIBUTES:
+        value = getattr(embeddings, attribute, None)
+        if isinstance(value, str | int) and not isinstance(value, bool):
+            parts.append(f"{attribute}={value}")
+    return ";".join(parts)
+
+
+class EmbeddingStore:
+    """A SQLite table of float32 vectors keyed by `(model_id, text_hash)`."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model_id TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model_id, text_hash)) WITHOUT ROWID"
+            )
+
+    def get_many(self, model_id: str, hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return the stored vectors for `hashes`, omitting the ones that are not cached."""
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for start in range(0, len(unique), FETCH_BATCH_SIZE):
+                batch = unique[start : start + FETCH_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embeddings "  # noqa: S608
+                    f"WHERE model_id = ? AND text_hash IN ({placeholders})",
+                    (model_id, *batch),
+                ).fetchall()
+                for hash_, blob in rows:
+                    found[hash_] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def set_many(self, model_id: str, items: Iterable[tuple[str, Sequence[float]]]) -> None:
+        rows = [(model_id, hash_, np.asarray(vector, dtype=np.float32).tobytes()) for hash_, vector in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model_id, text_hash, vector) VALUES (?, ?, ?)", rows
+            )
+
+    def clear(self, model_id: str | None = None) -> None:
+        with self._lock, self._conn:
+            if model_id is None:
+                self._conn.execute("DELETE FROM embeddings")
+            else:
+                self._conn.execute("DELETE FROM embeddings WHERE model_id = ?", (model_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache
+def get_embedding_store(path: str) -> EmbeddingStore:
+    """Return the store at `path`, shared by every wrapper in the process."""
+    return EmbeddingStore(path)
+
+
+class CachedEmbeddings(Embeddings):
+    """Serve embeddings from an `EmbeddingStore`, calling the wrapped model only for cache misses.
+
+    Queries are cached separately from documents because some providers embed them differently.
+    """
+
+    def __init__(self, embeddings: Embeddings, store: EmbeddingStore, model_id: str | None = None) -> None:
+        self.embeddings = embeddings
+        self.store = store
+        self.model_id = model_id or embedding_model_id(embeddings)
+
+    @property
+    def _query_model_id(self) -> str:
+        return f"{self.model_id};query"
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        """Hash `texts`, fetch the cached vectors in one pass and collect the distinct texts still to embed."""
+        hashes = [text_hash(text) for text in texts]
+        cached = self.store.get_many(self.model_id, hashes)
+        missing: dict[str, str] = {}
+        for hash_, text in zip(hashes, texts, strict=True):
+            if hash_ not in cached:
+                missing.setdefault(hash_, text)
+        return hashes, cached, missing
+
+    def _merge(
+        self, hashes: list[str], cached: dict[str, list[float]], missing: dict[str, str], vectors: list[list[float]]
+    ) -> list[list[float]]:
+        new = dict(zip(missing, vectors, strict=True))
+        if new:
+            self.store.set_many(self.model_id, new.items())
+        cached.update(new)
+        return [cached[hash_] for hash_ in hashes]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        hashes, cached, missing = self._lookup(texts)
+        vectors = self.embeddings.embed_documents(list(missing.values())) if missing else []
+        return self._merge(hashes, cached, missing, vectors)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        hashes, cached, missing = await asyncio.to_thread(self._lookup, texts)
+        vectors = await self.embeddings.aembed_documents(list(missing.values())) if missing else []
+        return await asyncio.to_thread(self._merge, hashes, cached, missing, vectors)
+
+    def embed_query(self, text: str) -> list[float]:
+        hash_ = text_hash(text)
+        cached = self.store.get_many(self._query_model_id, [hash_])
+        if hash_ in cached:
+            return cached[hash_]
+        vector = self.embeddings.embed_query(text)
+        self.store.set_many(self._query_model_id, [(hash_, vector)])
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        hash_ = text_hash(text)
+        cached = await asyncio.to_thread(self.store.get_many, self._query_model_id, [hash_])
+        if hash_ in cached:
+            return cached[hash_]
+        vector = await self.embeddings.aembed_query(text)
+        await asyncio.to_thread(self.store.set_many, self._query_model_id, [(hash_, vector)])
+        return vector
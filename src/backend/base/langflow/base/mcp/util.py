@@ -77,13 +77,16 @@ def create_tool_func(tool_name: str, arg_schema: type[BaseModel], session) -> Ca
 
 async def get_flow_snake_case(flow_name: str, user_id: str, session, is_action: bool | None = None) -> Flow | None:
     uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
-    stmt = select(Flow).where(Flow.user_id == uuid_user_id).where(Flow.is_component == False)  # noqa: E712
-    flows = (await session.exec(stmt)).all()
-
-    for flow in flows:
-        this_flow_name = flow.action_name if is_action and flow.action_name else "_".join(flow.name.lower().split())
+    # Match the names first, so that only the data of the matching flow is loaded
+    stmt = (
+        select(Flow.id, Flow.name, Flow.action_name)
+        .where(Flow.user_id == uuid_user_id)
+        .where(Flow.is_component == False)  # noqa: E712
+    )
+    for flow_id, name, action_name in (await session.exec(stmt)).all():
+        this_flow_name = action_name if is_action and action_name else "_".join(name.lower().split())
         if this_flow_name == flow_name:
-            return flow
+            return await session.get(Flow, flow_id)
     return None
 
 
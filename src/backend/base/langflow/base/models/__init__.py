@@ -1,3 +1,14 @@
-from .model import LCModelComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .model import LCModelComponent
+
+_dynamic_imports = {"LCModelComponent": "model"}
 
 __all__ = ["LCModelComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -3,7 +3,7 @@ import json
 import warnings
 from abc import abstractmethod
 
-from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models import BaseChatModel, BaseLanguageModel
 from langchain_core.language_models.llms import LLM
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.output_parsers import BaseOutputParser
@@ -12,7 +12,7 @@ from langflow.base.constants import STREAM_INFO_TEXT
 from langflow.custom import Component
 from langflow.field_typing import LanguageModel
 from langflow.inputs import MessageInput
-from langflow.inputs.inputs import BoolInput, InputTypes, MultilineInput
+from langflow.inputs.inputs import BoolInput, FloatInput, HandleInput, InputTypes, MultilineInput
 from langflow.schema.message import Message
 from langflow.template.field.base import Output
 
@@ -47,6 +47,30 @@ class LCModelComponent(Component):
             advanced=False,
         ),
         BoolInput(name="stream", display_name="Stream", info=STREAM_INFO_TEXT, advanced=True),
+        BoolInput(
+            name="cache_response",
+            display_name="Cache Response",
+            info="Reuse the response to an identical prompt with identical model parameters in this flow "
+            "instead of calling the model again. Streamed responses are not cached.",
+            value=False,
+            advanced=True,
+        ),
+        HandleInput(
+            name="cache_embedding_model",
+            display_name="Cache Embedding Model",
+            input_types=["Embeddings"],
+            info="When response caching is enabled, also reuse the response to a previous prompt whose embedding "
+            "is similar enough to the current one.",
+            required=False,
+            advanced=True,
+        ),
+        FloatInput(
+            name="cache_similarity_threshold",
+            display_name="Cache Similarity Threshold",
+            info="Minimum cosine similarity between prompts for a cached response to be reused.",
+            value=0.95,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -198,6 +222,8 @@ class LCModelComponent(Component):
         if not input_value and not system_message:
             msg = "The message you want to send to the model is empty."
             raise ValueError(msg)
+        if getattr(self, "cache_response", False):
+            runnable = self._with_response_cache(runnable)
         system_message_added = False
         if input_value:
             if isinstance(input_value, Message):
@@ -251,6 +277,24 @@ class LCModelComponent(Component):
 
         return result
 
+    def _with_response_cache(self, runnable: LanguageModel) -> LanguageModel:
+        """Return a copy of the model that reads and writes the LLM response cache of this flow."""
+        if not isinstance(runnable, BaseLanguageModel):
+            return runnable
+        from langflow.services.deps import get_llm_cache_service
+
+        flow_id = self.graph.flow_id if self._vertex is not None else None
+        namespace = str(flow_id) if flow_id else None
+        llm_cache_service = get_llm_cache_service()
+        if embedding := getattr(self, "cache_embedding_model", None):
+            threshold = getattr(self, "cache_similarity_threshold", None)
+            if threshold is None:
+                threshold = 0.95
+            llm_cache = llm_cache_service.get_semantic_cache(embedding, namespace=namespace, threshold=threshold)
+        else:
+            llm_cache = llm_cache_service.get_langchain_cache(namespace=namespace)
+        return runnable.model_copy(update={"cache": llm_cache})
+
     @abstractmethod
     def build_model(self) -> LanguageModel:  # type: ignore[type-var]
         """Implement this method to build the model."""
@@ -1,11 +1,29 @@
-from .add_content_to_page import AddContentToPage
-from .create_page import NotionPageCreator
-from .list_database_properties import NotionDatabaseProperties
-from .list_pages import NotionListPages
-from .list_users import NotionUserList
-from .page_content_viewer import NotionPageContent
-from .search import NotionSearch
-from .update_page_property import NotionPageUpdate
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .add_content_to_page import AddContentToPage
+    from .create_page import NotionPageCreator
+    from .list_database_properties import NotionDatabaseProperties
+    from .list_pages import NotionListPages
+    from .list_users import NotionUserList
+    from .page_content_viewer import NotionPageContent
+    from .search import NotionSearch
+    from .update_page_property import NotionPageUpdate
+
+_dynamic_imports = {
+    "AddContentToPage": "add_content_to_page",
+    "NotionPageCreator": "create_page",
+    "NotionDatabaseProperties": "list_database_properties",
+    "NotionListPages": "list_pages",
+    "NotionUserList": "list_users",
+    "NotionPageContent": "page_content_viewer",
+    "NotionSearch": "search",
+    "NotionPageUpdate": "update_page_property",
+}
 
 __all__ = [
     "AddContentToPage",
@@ -17,3 +35,5 @@ __all__ = [
     "NotionSearch",
     "NotionUserList",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,3 +1,16 @@
-from .agentql_api import AgentQL
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .agentql_api import AgentQL
+
+_dynamic_imports = {
+    "AgentQL": "agentql_api",
+}
 
 __all__ = ["AgentQL"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
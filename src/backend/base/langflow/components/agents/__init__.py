@@ -1,3 +1,16 @@
-from .agent import AgentComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .agent import AgentComponent
+
+_dynamic_imports = {
+    "AgentComponent": "agent",
+}
 
 __all__ = ["AgentComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
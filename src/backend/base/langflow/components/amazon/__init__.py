@@ -1,5 +1,20 @@
-from .amazon_bedrock_embedding import AmazonBedrockEmbeddingsComponent
-from .amazon_bedrock_model import AmazonBedrockComponent
-from .s3_bucket_uploader import S3BucketUploaderComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .amazon_bedrock_embedding import AmazonBedrockEmbeddingsComponent
+    from .amazon_bedrock_model import AmazonBedrockComponent
+    from .s3_bucket_uploader import S3BucketUploaderComponent
+
+_dynamic_imports = {
+    "AmazonBedrockEmbeddingsComponent": "amazon_bedrock_embedding",
+    "AmazonBedrockComponent": "amazon_bedrock_model",
+    "S3BucketUploaderComponent": "s3_bucket_uploader",
+}
 
 __all__ = ["AmazonBedrockComponent", "AmazonBedrockEmbeddingsComponent", "S3BucketUploaderComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,5 +1,18 @@
-from .apify_actor import ApifyActorsComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .apify_actor import ApifyActorsComponent
+
+_dynamic_imports = {
+    "ApifyActorsComponent": "apify_actor",
+}
 
 __all__ = [
     "ApifyActorsComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,8 +1,23 @@
-from .assemblyai_get_subtitles import AssemblyAIGetSubtitles
-from .assemblyai_lemur import AssemblyAILeMUR
-from .assemblyai_list_transcripts import AssemblyAIListTranscripts
-from .assemblyai_poll_transcript import AssemblyAITranscriptionJobPoller
-from .assemblyai_start_transcript import AssemblyAITranscriptionJobCreator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .assemblyai_get_subtitles import AssemblyAIGetSubtitles
+    from .assemblyai_lemur import AssemblyAILeMUR
+    from .assemblyai_list_transcripts import AssemblyAIListTranscripts
+    from .assemblyai_poll_transcript import AssemblyAITranscriptionJobPoller
+    from .assemblyai_start_transcript import AssemblyAITranscriptionJobCreator
+
+_dynamic_imports = {
+    "AssemblyAIGetSubtitles": "assemblyai_get_subtitles",
+    "AssemblyAILeMUR": "assemblyai_lemur",
+    "AssemblyAIListTranscripts": "assemblyai_list_transcripts",
+    "AssemblyAITranscriptionJobPoller": "assemblyai_poll_transcript",
+    "AssemblyAITranscriptionJobCreator": "assemblyai_start_transcript",
+}
 
 __all__ = [
     "AssemblyAIGetSubtitles",
@@ -11,3 +26,5 @@ __all__ = [
     "AssemblyAITranscriptionJobCreator",
     "AssemblyAITranscriptionJobPoller",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,3 +1,16 @@
-from .cohere_rerank import CohereRerankComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .cohere_rerank import CohereRerankComponent
+
+_dynamic_imports = {
+    "CohereRerankComponent": "cohere_rerank",
+}
 
 __all__ = ["CohereRerankComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
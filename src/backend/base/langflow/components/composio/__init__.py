@@ -1,9 +1,25 @@
-from .composio_api import ComposioAPIComponent
-from .github_composio import ComposioGitHubAPIComponent
-from .gmail_composio import ComposioGmailAPIComponent
-from .googlecalendar_composio import ComposioGoogleCalendarAPIComponent
-from .outlook_composio import ComposioOutlookAPIComponent
-from .slack_composio import ComposioSlackAPIComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .composio_api import ComposioAPIComponent
+    from .github_composio import ComposioGitHubAPIComponent
+    from .gmail_composio import ComposioGmailAPIComponent
+    from .googlecalendar_composio import ComposioGoogleCalendarAPIComponent
+    from .outlook_composio import ComposioOutlookAPIComponent
+    from .slack_composio import ComposioSlackAPIComponent
+
+_dynamic_imports = {
+    "ComposioAPIComponent": "composio_api",
+    "ComposioGitHubAPIComponent": "github_composio",
+    "ComposioGmailAPIComponent": "gmail_composio",
+    "ComposioGoogleCalendarAPIComponent": "googlecalendar_composio",
+    "ComposioOutlookAPIComponent": "outlook_composio",
+    "ComposioSlackAPIComponent": "slack_composio",
+}
 
 __all__ = [
     "ComposioAPIComponent",
@@ -13,3 +29,5 @@ __all__ = [
     "ComposioOutlookAPIComponent",
     "ComposioSlackAPIComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
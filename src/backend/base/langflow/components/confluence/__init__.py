@@ -1,3 +1,16 @@
-from .confluence import ConfluenceComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .confluence import ConfluenceComponent
+
+_dynamic_imports = {
+    "ConfluenceComponent": "confluence",
+}
 
 __all__ = ["ConfluenceComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
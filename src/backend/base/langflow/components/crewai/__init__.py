@@ -1,9 +1,25 @@
-from .crewai import CrewAIAgentComponent
-from .hierarchical_crew import HierarchicalCrewComponent
-from .hierarchical_task import HierarchicalTaskComponent
-from .sequential_crew import SequentialCrewComponent
-from .sequential_task import SequentialTaskComponent
-from .sequential_task_agent import SequentialTaskAgentComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .crewai import CrewAIAgentComponent
+    from .hierarchical_crew import HierarchicalCrewComponent
+    from .hierarchical_task import HierarchicalTaskComponent
+    from .sequential_crew import SequentialCrewComponent
+    from .sequential_task import SequentialTaskComponent
+    from .sequential_task_agent import SequentialTaskAgentComponent
+
+_dynamic_imports = {
+    "CrewAIAgentComponent": "crewai",
+    "HierarchicalCrewComponent": "hierarchical_crew",
+    "HierarchicalTaskComponent": "hierarchical_task",
+    "SequentialCrewComponent": "sequential_crew",
+    "SequentialTaskComponent": "sequential_task",
+    "SequentialTaskAgentComponent": "sequential_task_agent",
+}
 
 __all__ = [
     "CrewAIAgentComponent",
@@ -13,3 +29,5 @@ __all__ = [
     "SequentialTaskAgentComponent",
     "SequentialTaskComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
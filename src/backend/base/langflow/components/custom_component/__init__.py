@@ -1,5 +1,18 @@
-from .custom_component import CustomComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .custom_component import CustomComponent
+
+_dynamic_imports = {
+    "CustomComponent": "custom_component",
+}
 
 __all__ = [
     "CustomComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
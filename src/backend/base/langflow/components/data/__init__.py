@@ -1,15 +1,37 @@
-from .api_request import APIRequestComponent
-from .csv_to_data import CSVToDataComponent
-from .directory import DirectoryComponent
-from .file import FileComponent
-from .json_to_data import JSONToDataComponent
-from .mcp_component import MCPToolsComponent
-from .news_search import NewsSearchComponent
-from .rss import RSSReaderComponent
-from .sql_executor import SQLComponent
-from .url import URLComponent
-from .web_search import WebSearchComponent
-from .webhook import WebhookComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .api_request import APIRequestComponent
+    from .csv_to_data import CSVToDataComponent
+    from .directory import DirectoryComponent
+    from .file import FileComponent
+    from .json_to_data import JSONToDataComponent
+    from .mcp_component import MCPToolsComponent
+    from .news_search import NewsSearchComponent
+    from .rss import RSSReaderComponent
+    from .sql_executor import SQLComponent
+    from .url import URLComponent
+    from .web_search import WebSearchComponent
+    from .webhook import WebhookComponent
+
+_dynamic_imports = {
+    "APIRequestComponent": "api_request",
+    "CSVToDataComponent": "csv_to_data",
+    "DirectoryComponent": "directory",
+    "FileComponent": "file",
+    "JSONToDataComponent": "json_to_data",
+    "MCPToolsComponent": "mcp_component",
+    "NewsSearchComponent": "news_search",
+    "RSSReaderComponent": "rss",
+    "SQLComponent": "sql_executor",
+    "URLComponent": "url",
+    "WebSearchComponent": "web_search",
+    "WebhookComponent": "webhook",
+}
 
 __all__ = [
     "APIRequestComponent",
@@ -25,3 +47,5 @@ __all__ = [
     "WebSearchComponent",
     "WebhookComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
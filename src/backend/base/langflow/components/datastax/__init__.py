@@ -1,13 +1,33 @@
-from .astra_assistant_manager import AstraAssistantManager
-from .astradb_cql import AstraDBCQLToolComponent
-from .astradb_tool import AstraDBToolComponent
-from .create_assistant import AssistantsCreateAssistant
-from .create_thread import AssistantsCreateThread
-from .dotenv import Dotenv
-from .get_assistant import AssistantsGetAssistantName
-from .getenvvar import GetEnvVar
-from .list_assistants import AssistantsListAssistants
-from .run import AssistantsRun
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .astra_assistant_manager import AstraAssistantManager
+    from .astradb_cql import AstraDBCQLToolComponent
+    from .astradb_tool import AstraDBToolComponent
+    from .create_assistant import AssistantsCreateAssistant
+    from .create_thread import AssistantsCreateThread
+    from .dotenv import Dotenv
+    from .get_assistant import AssistantsGetAssistantName
+    from .getenvvar import GetEnvVar
+    from .list_assistants import AssistantsListAssistants
+    from .run import AssistantsRun
+
+_dynamic_imports = {
+    "AstraAssistantManager": "astra_assistant_manager",
+    "AstraDBCQLToolComponent": "astradb_cql",
+    "AstraDBToolComponent": "astradb_tool",
+    "AssistantsCreateAssistant": "create_assistant",
+    "AssistantsCreateThread": "create_thread",
+    "Dotenv": "dotenv",
+    "AssistantsGetAssistantName": "get_assistant",
+    "GetEnvVar": "getenvvar",
+    "AssistantsListAssistants": "list_assistants",
+    "AssistantsRun": "run",
+}
 
 __all__ = [
     "AssistantsCreateAssistant",
@@ -21,3 +41,5 @@ __all__ = [
     "Dotenv",
     "GetEnvVar",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,9 +1,25 @@
-from .extract_key_from_data import ExtractKeyFromDataComponent
-from .list_flows import ListFlowsComponent
-from .merge_data import MergeDataComponent
-from .selective_passthrough import SelectivePassThroughComponent
-from .split_text import SplitTextComponent
-from .sub_flow import SubFlowComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .extract_key_from_data import ExtractKeyFromDataComponent
+    from .list_flows import ListFlowsComponent
+    from .merge_data import MergeDataComponent
+    from .selective_passthrough import SelectivePassThroughComponent
+    from .split_text import SplitTextComponent
+    from .sub_flow import SubFlowComponent
+
+_dynamic_imports = {
+    "ExtractKeyFromDataComponent": "extract_key_from_data",
+    "ListFlowsComponent": "list_flows",
+    "MergeDataComponent": "merge_data",
+    "SelectivePassThroughComponent": "selective_passthrough",
+    "SplitTextComponent": "split_text",
+    "SubFlowComponent": "sub_flow",
+}
 
 __all__ = [
     "ExtractKeyFromDataComponent",
@@ -19,3 +35,5 @@ __all__ = [
     "SplitTextComponent",
     "SubFlowComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,19 +1,47 @@
-from .aiml import AIMLEmbeddingsComponent
-from .astra_vectorize import AstraVectorizeComponent
-from .azure_openai import AzureOpenAIEmbeddingsComponent
-from .cloudflare import CloudflareWorkersAIEmbeddingsComponent
-from .cohere import CohereEmbeddingsComponent
-from .google_generative_ai import GoogleGenerativeAIEmbeddingsComponent
-from .huggingface_inference_api import HuggingFaceInferenceAPIEmbeddingsComponent
-from .lmstudioembeddings import LMStudioEmbeddingsComponent
-from .mistral import MistralAIEmbeddingsComponent
-from .nvidia import NVIDIAEmbeddingsComponent
-from .ollama import OllamaEmbeddingsComponent
-from .openai import OpenAIEmbeddingsComponent
-from .similarity import EmbeddingSimilarityComponent
-from .text_embedder import TextEmbedderComponent
-from .vertexai import VertexAIEmbeddingsComponent
-from .watsonx import WatsonxEmbeddingsComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .aiml import AIMLEmbeddingsComponent
+    from .astra_vectorize import AstraVectorizeComponent
+    from .azure_openai import AzureOpenAIEmbeddingsComponent
+    from .cloudflare import CloudflareWorkersAIEmbeddingsComponent
+    from .cohere import CohereEmbeddingsComponent
+    from .embedding_cache import EmbeddingCacheComponent
+    from .google_generative_ai import GoogleGenerativeAIEmbeddingsComponent
+    from .huggingface_inference_api import HuggingFaceInferenceAPIEmbeddingsComponent
+    from .lmstudioembeddings import LMStudioEmbeddingsComponent
+    from .mistral import MistralAIEmbeddingsComponent
+    from .nvidia import NVIDIAEmbeddingsComponent
+    from .ollama import OllamaEmbeddingsComponent
+    from .openai import OpenAIEmbeddingsComponent
+    from .similarity import EmbeddingSimilarityComponent
+    from .text_embedder import TextEmbedderComponent
+    from .vertexai import VertexAIEmbeddingsComponent
+    from .watsonx import WatsonxEmbeddingsComponent
+
+_dynamic_imports = {
+    "AIMLEmbeddingsComponent": "aiml",
+    "AstraVectorizeComponent": "astra_vectorize",
+    "AzureOpenAIEmbeddingsComponent": "azure_openai",
+    "CloudflareWorkersAIEmbeddingsComponent": "cloudflare",
+    "CohereEmbeddingsComponent": "cohere",
+    "EmbeddingCacheComponent": "embedding_cache",
+    "GoogleGenerativeAIEmbeddingsComponent": "google_generative_ai",
+    "HuggingFaceInferenceAPIEmbeddingsComponent": "huggingface_inference_api",
+    "LMStudioEmbeddingsComponent": "lmstudioembeddings",
+    "MistralAIEmbeddingsComponent": "mistral",
+    "NVIDIAEmbeddingsComponent": "nvidia",
+    "OllamaEmbeddingsComponent": "ollama",
+    "OpenAIEmbeddingsComponent": "openai",
+    "EmbeddingSimilarityComponent": "similarity",
+    "TextEmbedderComponent": "text_embedder",
+    "VertexAIEmbeddingsComponent": "vertexai",
+    "WatsonxEmbeddingsComponent": "watsonx",
+}
 
 __all__ = [
     "AIMLEmbeddingsComponent",
@@ -21,6 +49,7 @@ __all__ = [
     "AzureOpenAIEmbeddingsComponent",
     "CloudflareWorkersAIEmbeddingsComponent",
     "CohereEmbeddingsComponent",
+    "EmbeddingCacheComponent",
     "EmbeddingSimilarityComponent",
     "GoogleGenerativeAIEmbeddingsComponent",
     "HuggingFaceInferenceAPIEmbeddingsComponent",
@@ -33,3 +62,5 @@ __all__ = [
     "VertexAIEmbeddingsComponent",
     "WatsonxEmbeddingsComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
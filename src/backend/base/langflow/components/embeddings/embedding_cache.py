@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from langflow.base.embeddings.cache import CachedEmbeddings, get_embedding_store
+from langflow.base.embeddings.model import LCEmbeddingsModel
+from langflow.field_typing import Embeddings
+from langflow.io import HandleInput
+from langflow.services.deps import get_settings_service
+
+
+class EmbeddingCacheComponent(LCEmbeddingsModel):
+    display_name = "Embedding Cache"
+    description = (
+        "Store the vectors produced by an embedding model so that texts embedded before are not sent to the "
+        "provider again."
+    )
+    icon = "binary"
+    name = "EmbeddingCache"
+
+    inputs = [
+        HandleInput(
+            name="embedding_model",
+            display_name="Embedding Model",
+            info="The embedding model whose vectors should be cached.",
+            input_types=["Embeddings"],
+            required=True,
+        ),
+    ]
+
+    def build_embeddings(self) -> Embeddings:
+        config_dir = get_settings_service().settings.config_dir
+        store = get_embedding_store(str(Path(config_dir) / "embedding_cache.db"))
+        return CachedEmbeddings(self.embedding_model, store)
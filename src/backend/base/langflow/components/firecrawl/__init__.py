@@ -1,6 +1,22 @@
-from .firecrawl_crawl_api import FirecrawlCrawlApi
-from .firecrawl_extract_api import FirecrawlExtractApi
-from .firecrawl_map_api import FirecrawlMapApi
-from .firecrawl_scrape_api import FirecrawlScrapeApi
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .firecrawl_crawl_api import FirecrawlCrawlApi
+    from .firecrawl_extract_api import FirecrawlExtractApi
+    from .firecrawl_map_api import FirecrawlMapApi
+    from .firecrawl_scrape_api import FirecrawlScrapeApi
+
+_dynamic_imports = {
+    "FirecrawlCrawlApi": "firecrawl_crawl_api",
+    "FirecrawlExtractApi": "firecrawl_extract_api",
+    "FirecrawlMapApi": "firecrawl_map_api",
+    "FirecrawlScrapeApi": "firecrawl_scrape_api",
+}
 
 __all__ = ["FirecrawlCrawlApi", "FirecrawlExtractApi", "FirecrawlMapApi", "FirecrawlScrapeApi"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,4 +1,18 @@
-from .git import GitLoaderComponent
-from .gitextractor import GitExtractorComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .git import GitLoaderComponent
+    from .gitextractor import GitExtractorComponent
+
+_dynamic_imports = {
+    "GitLoaderComponent": "git",
+    "GitExtractorComponent": "gitextractor",
+}
 
 __all__ = ["GitExtractorComponent", "GitLoaderComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,8 +1,23 @@
-from .gmail import GmailLoaderComponent
-from .google_bq_sql_executor import BigQueryExecutorComponent
-from .google_drive import GoogleDriveComponent
-from .google_drive_search import GoogleDriveSearchComponent
-from .google_oauth_token import GoogleOAuthToken
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .gmail import GmailLoaderComponent
+    from .google_bq_sql_executor import BigQueryExecutorComponent
+    from .google_drive import GoogleDriveComponent
+    from .google_drive_search import GoogleDriveSearchComponent
+    from .google_oauth_token import GoogleOAuthToken
+
+_dynamic_imports = {
+    "GmailLoaderComponent": "gmail",
+    "BigQueryExecutorComponent": "google_bq_sql_executor",
+    "GoogleDriveComponent": "google_drive",
+    "GoogleDriveSearchComponent": "google_drive_search",
+    "GoogleOAuthToken": "google_oauth_token",
+}
 
 __all__ = [
     "BigQueryExecutorComponent",
@@ -11,3 +26,5 @@ __all__ = [
     "GoogleDriveSearchComponent",
     "GoogleOAuthToken",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
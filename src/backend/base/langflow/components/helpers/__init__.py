@@ -1,10 +1,27 @@
-from .calculator_core import CalculatorComponent
-from .create_list import CreateListComponent
-from .current_date import CurrentDateComponent
-from .id_generator import IDGeneratorComponent
-from .memory import MemoryComponent
-from .output_parser import OutputParserComponent
-from .store_message import MessageStoreComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .calculator_core import CalculatorComponent
+    from .create_list import CreateListComponent
+    from .current_date import CurrentDateComponent
+    from .id_generator import IDGeneratorComponent
+    from .memory import MemoryComponent
+    from .output_parser import OutputParserComponent
+    from .store_message import MessageStoreComponent
+
+_dynamic_imports = {
+    "CalculatorComponent": "calculator_core",
+    "CreateListComponent": "create_list",
+    "CurrentDateComponent": "current_date",
+    "IDGeneratorComponent": "id_generator",
+    "MemoryComponent": "memory",
+    "OutputParserComponent": "output_parser",
+    "MessageStoreComponent": "store_message",
+}
 
 __all__ = [
     "CalculatorComponent",
@@ -15,3 +32,5 @@ __all__ = [
     "MessageStoreComponent",
     "OutputParserComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,7 +1,21 @@
-from .home_assistant_control import HomeAssistantControl
-from .list_home_assistant_states import ListHomeAssistantStates
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .home_assistant_control import HomeAssistantControl
+    from .list_home_assistant_states import ListHomeAssistantStates
+
+_dynamic_imports = {
+    "HomeAssistantControl": "home_assistant_control",
+    "ListHomeAssistantStates": "list_home_assistant_states",
+}
 
 __all__ = [
     "HomeAssistantControl",
     "ListHomeAssistantStates",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
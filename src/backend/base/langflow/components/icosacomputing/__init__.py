@@ -1,5 +1,18 @@
-from .combinatorial_reasoner import CombinatorialReasonerComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .combinatorial_reasoner import CombinatorialReasonerComponent
+
+_dynamic_imports = {
+    "CombinatorialReasonerComponent": "combinatorial_reasoner",
+}
 
 __all__ = [
     "CombinatorialReasonerComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,6 +1,22 @@
-from .chat import ChatInput
-from .chat_output import ChatOutput
-from .text import TextInputComponent
-from .text_output import TextOutputComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .chat import ChatInput
+    from .chat_output import ChatOutput
+    from .text import TextInputComponent
+    from .text_output import TextOutputComponent
+
+_dynamic_imports = {
+    "ChatInput": "chat",
+    "ChatOutput": "chat_output",
+    "TextInputComponent": "text",
+    "TextOutputComponent": "text_output",
+}
 
 __all__ = ["ChatInput", "ChatOutput", "TextInputComponent", "TextOutputComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
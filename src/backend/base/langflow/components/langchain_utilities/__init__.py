@@ -1,32 +1,71 @@
-from .character import CharacterTextSplitterComponent
-from .conversation import ConversationChainComponent
-from .csv_agent import CSVAgentComponent
-from .fake_embeddings import FakeEmbeddingsComponent
-from .html_link_extractor import HtmlLinkExtractorComponent
-from .json_agent import JsonAgentComponent
-from .json_document_builder import JSONDocumentBuilder
-from .langchain_hub import LangChainHubPromptComponent
-from .language_recursive import LanguageRecursiveTextSplitterComponent
-from .language_semantic import SemanticTextSplitterComponent
-from .llm_checker import LLMCheckerChainComponent
-from .llm_math import LLMMathChainComponent
-from .natural_language import NaturalLanguageTextSplitterComponent
-from .openai_tools import OpenAIToolsAgentComponent
-from .openapi import OpenAPIAgentComponent
-from .recursive_character import RecursiveCharacterTextSplitterComponent
-from .retrieval_qa import RetrievalQAComponent
-from .retriever import RetrieverToolComponent
-from .runnable_executor import RunnableExecComponent
-from .self_query import SelfQueryRetrieverComponent
-from .spider import SpiderTool
-from .sql import SQLAgentComponent
-from .sql_database import SQLDatabaseComponent
-from .sql_generator import SQLGeneratorComponent
-from .tool_calling import ToolCallingAgentComponent
-from .vector_store import VectoStoreRetrieverComponent
-from .vector_store_info import VectorStoreInfoComponent
-from .vector_store_router import VectorStoreRouterAgentComponent
-from .xml_agent import XMLAgentComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .character import CharacterTextSplitterComponent
+    from .conversation import ConversationChainComponent
+    from .csv_agent import CSVAgentComponent
+    from .fake_embeddings import FakeEmbeddingsComponent
+    from .html_link_extractor import HtmlLinkExtractorComponent
+    from .json_agent import JsonAgentComponent
+    from .json_document_builder import JSONDocumentBuilder
+    from .langchain_hub import LangChainHubPromptComponent
+    from .language_recursive import LanguageRecursiveTextSplitterComponent
+    from .language_semantic import SemanticTextSplitterComponent
+    from .llm_checker import LLMCheckerChainComponent
+    from .llm_math import LLMMathChainComponent
+    from .natural_language import NaturalLanguageTextSplitterComponent
+    from .openai_tools import OpenAIToolsAgentComponent
+    from .openapi import OpenAPIAgentComponent
+    from .recursive_character import RecursiveCharacterTextSplitterComponent
+    from .retrieval_qa import RetrievalQAComponent
+    from .retriever import RetrieverToolComponent
+    from .runnable_executor import RunnableExecComponent
+    from .self_query import SelfQueryRetrieverComponent
+    from .spider import SpiderTool
+    from .sql import SQLAgentComponent
+    from .sql_database import SQLDatabaseComponent
+    from .sql_generator import SQLGeneratorComponent
+    from .tool_calling import ToolCallingAgentComponent
+    from .vector_store import VectoStoreRetrieverComponent
+    from .vector_store_info import VectorStoreInfoComponent
+    from .vector_store_router import VectorStoreRouterAgentComponent
+    from .xml_agent import XMLAgentComponent
+
+_dynamic_imports = {
+    "CharacterTextSplitterComponent": "character",
+    "ConversationChainComponent": "conversation",
+    "CSVAgentComponent": "csv_agent",
+    "FakeEmbeddingsComponent": "fake_embeddings",
+    "HtmlLinkExtractorComponent": "html_link_extractor",
+    "JsonAgentComponent": "json_agent",
+    "JSONDocumentBuilder": "json_document_builder",
+    "LangChainHubPromptComponent": "langchain_hub",
+    "LanguageRecursiveTextSplitterComponent": "language_recursive",
+    "SemanticTextSplitterComponent": "language_semantic",
+    "LLMCheckerChainComponent": "llm_checker",
+    "LLMMathChainComponent": "llm_math",
+    "NaturalLanguageTextSplitterComponent": "natural_language",
+    "OpenAIToolsAgentComponent": "openai_tools",
+    "OpenAPIAgentComponent": "openapi",
+    "RecursiveCharacterTextSplitterComponent": "recursive_character",
+    "RetrievalQAComponent": "retrieval_qa",
+    "RetrieverToolComponent": "retriever",
+    "RunnableExecComponent": "runnable_executor",
+    "SelfQueryRetrieverComponent": "self_query",
+    "SpiderTool": "spider",
+    "SQLAgentComponent": "sql",
+    "SQLDatabaseComponent": "sql_database",
+    "SQLGeneratorComponent": "sql_generator",
+    "ToolCallingAgentComponent": "tool_calling",
+    "VectoStoreRetrieverComponent": "vector_store",
+    "VectorStoreInfoComponent": "vector_store_info",
+    "VectorStoreRouterAgentComponent": "vector_store_router",
+    "XMLAgentComponent": "xml_agent",
+}
 
 __all__ = [
     "CSVAgentComponent",
@@ -59,3 +98,5 @@ __all__ = [
     "VectorStoreRouterAgentComponent",
     "XMLAgentComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,25 +1,57 @@
-from .aiml import AIMLModelComponent
-from .anthropic import AnthropicModelComponent
-from .azure_openai import AzureChatOpenAIComponent
-from .baidu_qianfan_chat import QianfanChatEndpointComponent
-from .cohere import CohereComponent
-from .deepseek import DeepSeekModelComponent
-from .google_generative_ai import GoogleGenerativeAIComponent
-from .groq import GroqModel
-from .huggingface import HuggingFaceEndpointsComponent
-from .lmstudiomodel import LMStudioModelComponent
-from .maritalk import MaritalkModelComponent
-from .mistral import MistralAIModelComponent
-from .novita import NovitaModelComponent
-from .nvidia import NVIDIAModelComponent
-from .ollama import ChatOllamaComponent
-from .openai_chat_model import OpenAIModelComponent
-from .openrouter import OpenRouterComponent
-from .perplexity import PerplexityComponent
-from .sambanova import SambaNovaComponent
-from .vertexai import ChatVertexAIComponent
-from .watsonx import WatsonxAIComponent
-from .xai import XAIModelComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .aiml import AIMLModelComponent
+    from .anthropic import AnthropicModelComponent
+    from .azure_openai import AzureChatOpenAIComponent
+    from .baidu_qianfan_chat import QianfanChatEndpointComponent
+    from .cohere import CohereComponent
+    from .deepseek import DeepSeekModelComponent
+    from .google_generative_ai import GoogleGenerativeAIComponent
+    from .groq import GroqModel
+    from .huggingface import HuggingFaceEndpointsComponent
+    from .lmstudiomodel import LMStudioModelComponent
+    from .maritalk import MaritalkModelComponent
+    from .mistral import MistralAIModelComponent
+    from .novita import NovitaModelComponent
+    from .nvidia import NVIDIAModelComponent
+    from .ollama import ChatOllamaComponent
+    from .openai_chat_model import OpenAIModelComponent
+    from .openrouter import OpenRouterComponent
+    from .perplexity import PerplexityComponent
+    from .sambanova import SambaNovaComponent
+    from .vertexai import ChatVertexAIComponent
+    from .watsonx import WatsonxAIComponent
+    from .xai import XAIModelComponent
+
+_dynamic_imports = {
+    "AIMLModelComponent": "aiml",
+    "AnthropicModelComponent": "anthropic",
+    "AzureChatOpenAIComponent": "azure_openai",
+    "QianfanChatEndpointComponent": "baidu_qianfan_chat",
+    "CohereComponent": "cohere",
+    "DeepSeekModelComponent": "deepseek",
+    "GoogleGenerativeAIComponent": "google_generative_ai",
+    "GroqModel": "groq",
+    "HuggingFaceEndpointsComponent": "huggingface",
+    "LMStudioModelComponent": "lmstudiomodel",
+    "MaritalkModelComponent": "maritalk",
+    "MistralAIModelComponent": "mistral",
+    "NovitaModelComponent": "novita",
+    "NVIDIAModelComponent": "nvidia",
+    "ChatOllamaComponent": "ollama",
+    "OpenAIModelComponent": "openai_chat_model",
+    "OpenRouterComponent": "openrouter",
+    "PerplexityComponent": "perplexity",
+    "SambaNovaComponent": "sambanova",
+    "ChatVertexAIComponent": "vertexai",
+    "WatsonxAIComponent": "watsonx",
+    "XAIModelComponent": "xai",
+}
 
 __all__ = [
     "AIMLModelComponent",
@@ -45,3 +77,5 @@ __all__ = [
     "WatsonxAIComponent",
     "XAIModelComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,3 +1,16 @@
-from .langwatch import LangWatchComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .langwatch import LangWatchComponent
+
+_dynamic_imports = {
+    "LangWatchComponent": "langwatch",
+}
 
 __all__ = ["LangWatchComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,8 +1,23 @@
-from .astra_db import AstraDBChatMemory
-from .cassandra import CassandraChatMemory
-from .mem0_chat_memory import Mem0MemoryComponent
-from .redis import RedisIndexChatMemory
-from .zep import ZepChatMemory
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .astra_db import AstraDBChatMemory
+    from .cassandra import CassandraChatMemory
+    from .mem0_chat_memory import Mem0MemoryComponent
+    from .redis import RedisIndexChatMemory
+    from .zep import ZepChatMemory
+
+_dynamic_imports = {
+    "AstraDBChatMemory": "astra_db",
+    "CassandraChatMemory": "cassandra",
+    "Mem0MemoryComponent": "mem0_chat_memory",
+    "RedisIndexChatMemory": "redis",
+    "ZepChatMemory": "zep",
+}
 
 __all__ = [
     "AstraDBChatMemory",
@@ -11,3 +26,5 @@ __all__ = [
     "RedisIndexChatMemory",
     "ZepChatMemory",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
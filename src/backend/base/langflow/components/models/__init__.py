@@ -1,4 +1,18 @@
-from .embedding_model import EmbeddingModelComponent
-from .language_model import LanguageModelComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .embedding_model import EmbeddingModelComponent
+    from .language_model import LanguageModelComponent
+
+_dynamic_imports = {
+    "EmbeddingModelComponent": "embedding_model",
+    "LanguageModelComponent": "language_model",
+}
 
 __all__ = ["EmbeddingModelComponent", "LanguageModelComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,3 +1,16 @@
-from .needle import NeedleComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .needle import NeedleComponent
+
+_dynamic_imports = {
+    "NeedleComponent": "needle",
+}
 
 __all__ = ["NeedleComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
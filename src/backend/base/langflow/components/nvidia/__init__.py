@@ -1,11 +1,25 @@
+from __future__ import annotations
+
 import sys
+from typing import TYPE_CHECKING
 
-from .nvidia_ingest import NvidiaIngestComponent
-from .nvidia_rerank import NvidiaRerankComponent
+from langflow.utils.lazy_imports import lazy_imports
 
-if sys.platform == "win32":
+if TYPE_CHECKING:
+    from .nvidia_ingest import NvidiaIngestComponent
+    from .nvidia_rerank import NvidiaRerankComponent
     from .system_assist import NvidiaSystemAssistComponent
 
+_dynamic_imports = {
+    "NvidiaIngestComponent": "nvidia_ingest",
+    "NvidiaRerankComponent": "nvidia_rerank",
+}
+
+if sys.platform == "win32":
+    _dynamic_imports["NvidiaSystemAssistComponent"] = "system_assist"
+
     __all__ = ["NvidiaIngestComponent", "NvidiaRerankComponent", "NvidiaSystemAssistComponent"]
 else:
     __all__ = ["NvidiaIngestComponent", "NvidiaRerankComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
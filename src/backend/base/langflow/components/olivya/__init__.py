@@ -1,3 +1,16 @@
-from .olivya import OlivyaComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .olivya import OlivyaComponent
+
+_dynamic_imports = {
+    "OlivyaComponent": "olivya",
+}
 
 __all__ = ["OlivyaComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
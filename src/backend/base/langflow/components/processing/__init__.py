@@ -1,25 +1,57 @@
-from .alter_metadata import AlterMetadataComponent
-from .batch_run import BatchRunComponent
-from .combine_text import CombineTextComponent
-from .converter import TypeConverterComponent
-from .create_data import CreateDataComponent
-from .data_operations import DataOperationsComponent
-from .extract_key import ExtractDataKeyComponent
-from .filter_data_values import DataFilterComponent
-from .json_cleaner import JSONCleaner
-from .lambda_filter import LambdaFilterComponent
-from .llm_router import LLMRouterComponent
-from .merge_data import MergeDataComponent
-from .message_to_data import MessageToDataComponent
-from .parse_data import ParseDataComponent
-from .parse_json_data import ParseJSONDataComponent
-from .parser import ParserComponent
-from .python_repl_core import PythonREPLComponent
-from .regex import RegexExtractorComponent
-from .select_data import SelectDataComponent
-from .split_text import SplitTextComponent
-from .structured_output import StructuredOutputComponent
-from .update_data import UpdateDataComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .alter_metadata import AlterMetadataComponent
+    from .batch_run import BatchRunComponent
+    from .combine_text import CombineTextComponent
+    from .converter import TypeConverterComponent
+    from .create_data import CreateDataComponent
+    from .data_operations import DataOperationsComponent
+    from .extract_key import ExtractDataKeyComponent
+    from .filter_data_values import DataFilterComponent
+    from .json_cleaner import JSONCleaner
+    from .lambda_filter import LambdaFilterComponent
+    from .llm_router import LLMRouterComponent
+    from .merge_data import MergeDataComponent
+    from .message_to_data import MessageToDataComponent
+    from .parse_data import ParseDataComponent
+    from .parse_json_data import ParseJSONDataComponent
+    from .parser import ParserComponent
+    from .python_repl_core import PythonREPLComponent
+    from .regex import RegexExtractorComponent
+    from .select_data import SelectDataComponent
+    from .split_text import SplitTextComponent
+    from .structured_output import StructuredOutputComponent
+    from .update_data import UpdateDataComponent
+
+_dynamic_imports = {
+    "AlterMetadataComponent": "alter_metadata",
+    "BatchRunComponent": "batch_run",
+    "CombineTextComponent": "combine_text",
+    "TypeConverterComponent": "converter",
+    "CreateDataComponent": "create_data",
+    "DataOperationsComponent": "data_operations",
+    "ExtractDataKeyComponent": "extract_key",
+    "DataFilterComponent": "filter_data_values",
+    "JSONCleaner": "json_cleaner",
+    "LambdaFilterComponent": "lambda_filter",
+    "LLMRouterComponent": "llm_router",
+    "MergeDataComponent": "merge_data",
+    "MessageToDataComponent": "message_to_data",
+    "ParseDataComponent": "parse_data",
+    "ParseJSONDataComponent": "parse_json_data",
+    "ParserComponent": "parser",
+    "PythonREPLComponent": "python_repl_core",
+    "RegexExtractorComponent": "regex",
+    "SelectDataComponent": "select_data",
+    "SplitTextComponent": "split_text",
+    "StructuredOutputComponent": "structured_output",
+    "UpdateDataComponent": "update_data",
+}
 
 __all__ = [
     "AlterMetadataComponent",
@@ -46,3 +78,5 @@ __all__ = [
     "TypeConverterComponent",
     "UpdateDataComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,3 +1,16 @@
-from .prompt import PromptComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .prompt import PromptComponent
+
+_dynamic_imports = {
+    "PromptComponent": "prompt",
+}
 
 __all__ = ["PromptComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
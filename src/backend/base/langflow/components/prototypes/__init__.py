@@ -1,5 +1,18 @@
-from .python_function import PythonFunctionComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .python_function import PythonFunctionComponent
+
+_dynamic_imports = {
+    "PythonFunctionComponent": "python_function",
+}
 
 __all__ = [
     "PythonFunctionComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
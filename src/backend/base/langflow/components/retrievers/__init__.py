@@ -1,7 +1,21 @@
-from .amazon_kendra import AmazonKendraRetrieverComponent
-from .metal import MetalRetrieverComponent
-from .multi_query import MultiQueryRetrieverComponent
-from .needle import NeedleRetriever
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .amazon_kendra import AmazonKendraRetrieverComponent
+    from .metal import MetalRetrieverComponent
+    from .multi_query import MultiQueryRetrieverComponent
+    from .needle import NeedleRetriever
+
+_dynamic_imports = {
+    "AmazonKendraRetrieverComponent": "amazon_kendra",
+    "MetalRetrieverComponent": "metal",
+    "MultiQueryRetrieverComponent": "multi_query",
+    "NeedleRetriever": "needle",
+}
 
 __all__ = [
     "AmazonKendraRetrieverComponent",
@@ -9,3 +23,5 @@ __all__ = [
     "MultiQueryRetrieverComponent",
     "NeedleRetriever",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
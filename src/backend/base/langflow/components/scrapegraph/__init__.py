@@ -1,5 +1,20 @@
-from .scrapegraph_markdownify_api import ScrapeGraphMarkdownifyApi
-from .scrapegraph_search_api import ScrapeGraphSearchApi
-from .scrapegraph_smart_scraper_api import ScrapeGraphSmartScraperApi
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .scrapegraph_markdownify_api import ScrapeGraphMarkdownifyApi
+    from .scrapegraph_search_api import ScrapeGraphSearchApi
+    from .scrapegraph_smart_scraper_api import ScrapeGraphSmartScraperApi
+
+_dynamic_imports = {
+    "ScrapeGraphMarkdownifyApi": "scrapegraph_markdownify_api",
+    "ScrapeGraphSearchApi": "scrapegraph_search_api",
+    "ScrapeGraphSmartScraperApi": "scrapegraph_smart_scraper_api",
+}
 
 __all__ = ["ScrapeGraphMarkdownifyApi", "ScrapeGraphSearchApi", "ScrapeGraphSmartScraperApi"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,16 +1,39 @@
-from .arxiv import ArXivComponent
-from .bing_search_api import BingSearchAPIComponent
-from .duck_duck_go_search_run import DuckDuckGoSearchComponent
-from .exa_search import ExaSearchToolkit
-from .glean_search_api import GleanSearchAPISchema
-from .google_search_api_core import GoogleSearchAPICore
-from .google_serper_api_core import GoogleSerperAPICore
-from .search import SearchComponent
-from .serp import SerpComponent
-from .wikidata import WikidataComponent
-from .wikipedia import WikipediaComponent
-from .wolfram_alpha_api import WolframAlphaAPIComponent
-from .yahoo import YahooFinanceSchema
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .arxiv import ArXivComponent
+    from .bing_search_api import BingSearchAPIComponent
+    from .duck_duck_go_search_run import DuckDuckGoSearchComponent
+    from .exa_search import ExaSearchToolkit
+    from .glean_search_api import GleanSearchAPISchema
+    from .google_search_api_core import GoogleSearchAPICore
+    from .google_serper_api_core import GoogleSerperAPICore
+    from .search import SearchComponent
+    from .serp import SerpComponent
+    from .wikidata import WikidataComponent
+    from .wikipedia import WikipediaComponent
+    from .wolfram_alpha_api import WolframAlphaAPIComponent
+    from .yahoo import YahooFinanceSchema
+
+_dynamic_imports = {
+    "ArXivComponent": "arxiv",
+    "BingSearchAPIComponent": "bing_search_api",
+    "DuckDuckGoSearchComponent": "duck_duck_go_search_run",
+    "ExaSearchToolkit": "exa_search",
+    "GleanSearchAPISchema": "glean_search_api",
+    "GoogleSearchAPICore": "google_search_api_core",
+    "GoogleSerperAPICore": "google_serper_api_core",
+    "SearchComponent": "search",
+    "SerpComponent": "serp",
+    "WikidataComponent": "wikidata",
+    "WikipediaComponent": "wikipedia",
+    "WolframAlphaAPIComponent": "wolfram_alpha_api",
+    "YahooFinanceSchema": "yahoo",
+}
 
 __all__ = [
     "ArXivComponent",
@@ -27,3 +50,5 @@ __all__ = [
     "WolframAlphaAPIComponent",
     "YahooFinanceSchema",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,4 +1,18 @@
-from .tavily_extract import TavilyExtractComponent
-from .tavily_search import TavilySearchComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .tavily_extract import TavilyExtractComponent
+    from .tavily_search import TavilySearchComponent
+
+_dynamic_imports = {
+    "TavilyExtractComponent": "tavily_extract",
+    "TavilySearchComponent": "tavily_search",
+}
 
 __all__ = ["TavilyExtractComponent", "TavilySearchComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
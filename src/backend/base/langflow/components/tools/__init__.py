@@ -1,22 +1,39 @@
-import warnings
+from __future__ import annotations
 
-from langchain_core._api.deprecation import LangChainDeprecationWarning
+from typing import TYPE_CHECKING
 
-from .calculator import CalculatorToolComponent
-from .google_search_api import GoogleSearchAPIComponent
-from .google_serper_api import GoogleSerperAPIComponent
-from .python_code_structured_tool import PythonCodeStructuredTool
-from .python_repl import PythonREPLToolComponent
-from .search_api import SearchAPIComponent
-from .searxng import SearXNGToolComponent
-from .serp_api import SerpAPIComponent
-from .wikidata_api import WikidataAPIComponent
-from .wikipedia_api import WikipediaAPIComponent
-from .yahoo_finance import YfinanceToolComponent
-from .note_taking import NoteTakingToolComponent
-from .reminder_tool import ReminderToolComponent
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore", LangChainDeprecationWarning)
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .calculator import CalculatorToolComponent
+    from .google_search_api import GoogleSearchAPIComponent
+    from .google_serper_api import GoogleSerperAPIComponent
+    from .python_code_structured_tool import PythonCodeStructuredTool
+    from .python_repl import PythonREPLToolComponent
+    from .search_api import SearchAPIComponent
+    from .searxng import SearXNGToolComponent
+    from .serp_api import SerpAPIComponent
+    from .wikidata_api import WikidataAPIComponent
+    from .wikipedia_api import WikipediaAPIComponent
+    from .yahoo_finance import YfinanceToolComponent
+    from .note_taking import NoteTakingToolComponent
+    from .reminder_tool import ReminderToolComponent
+
+_dynamic_imports = {
+    "CalculatorToolComponent": "calculator",
+    "GoogleSearchAPIComponent": "google_search_api",
+    "GoogleSerperAPIComponent": "google_serper_api",
+    "PythonCodeStructuredTool": "python_code_structured_tool",
+    "PythonREPLToolComponent": "python_repl",
+    "SearchAPIComponent": "search_api",
+    "SearXNGToolComponent": "searxng",
+    "SerpAPIComponent": "serp_api",
+    "WikidataAPIComponent": "wikidata_api",
+    "WikipediaAPIComponent": "wikipedia_api",
+    "YfinanceToolComponent": "yahoo_finance",
+    "NoteTakingToolComponent": "note_taking",
+    "ReminderToolComponent": "reminder_tool",
+}
 
 __all__ = [
     "AstraDBCQLToolComponent",
@@ -38,3 +55,5 @@ __all__ = [
     "NoteTakingToolComponent",
     "ReminderToolComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
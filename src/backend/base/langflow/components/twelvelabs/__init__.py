@@ -1,10 +1,27 @@
-from .convert_astra_results import ConvertAstraToTwelveLabs
-from .pegasus_index import PegasusIndexVideo
-from .split_video import SplitVideoComponent
-from .text_embeddings import TwelveLabsTextEmbeddingsComponent
-from .twelvelabs_pegasus import TwelveLabsPegasus
-from .video_embeddings import TwelveLabsVideoEmbeddingsComponent
-from .video_file import VideoFileComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .convert_astra_results import ConvertAstraToTwelveLabs
+    from .pegasus_index import PegasusIndexVideo
+    from .split_video import SplitVideoComponent
+    from .text_embeddings import TwelveLabsTextEmbeddingsComponent
+    from .twelvelabs_pegasus import TwelveLabsPegasus
+    from .video_embeddings import TwelveLabsVideoEmbeddingsComponent
+    from .video_file import VideoFileComponent
+
+_dynamic_imports = {
+    "ConvertAstraToTwelveLabs": "convert_astra_results",
+    "PegasusIndexVideo": "pegasus_index",
+    "SplitVideoComponent": "split_video",
+    "TwelveLabsTextEmbeddingsComponent": "text_embeddings",
+    "TwelveLabsPegasus": "twelvelabs_pegasus",
+    "TwelveLabsVideoEmbeddingsComponent": "video_embeddings",
+    "VideoFileComponent": "video_file",
+}
 
 __all__ = [
     "ConvertAstraToTwelveLabs",
@@ -15,3 +32,5 @@ __all__ = [
     "TwelveLabsVideoEmbeddingsComponent",
     "VideoFileComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,3 +1,16 @@
-from .unstructured import UnstructuredComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .unstructured import UnstructuredComponent
+
+_dynamic_imports = {
+    "UnstructuredComponent": "unstructured",
+}
 
 __all__ = ["UnstructuredComponent"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,28 +1,63 @@
-from .astradb import AstraDBVectorStoreComponent
-from .astradb_graph import AstraDBGraphVectorStoreComponent
-from .cassandra import CassandraVectorStoreComponent
-from .cassandra_graph import CassandraGraphVectorStoreComponent
-from .chroma import ChromaVectorStoreComponent
-from .clickhouse import ClickhouseVectorStoreComponent
-from .couchbase import CouchbaseVectorStoreComponent
-from .elasticsearch import ElasticsearchVectorStoreComponent
-from .faiss import FaissVectorStoreComponent
-from .graph_rag import GraphRAGComponent
-from .hcd import HCDVectorStoreComponent
-from .local_db import LocalDBComponent
-from .milvus import MilvusVectorStoreComponent
-from .mongodb_atlas import MongoVectorStoreComponent
-from .opensearch import OpenSearchVectorStoreComponent
-from .pgvector import PGVectorStoreComponent
-from .pinecone import PineconeVectorStoreComponent
-from .qdrant import QdrantVectorStoreComponent
-from .redis import RedisVectorStoreComponent
-from .supabase import SupabaseVectorStoreComponent
-from .upstash import UpstashVectorStoreComponent
-from .vectara import VectaraVectorStoreComponent
-from .vectara_rag import VectaraRagComponent
-from .vectara_self_query import VectaraSelfQueryRetriverComponent
-from .weaviate import WeaviateVectorStoreComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .astradb import AstraDBVectorStoreComponent
+    from .astradb_graph import AstraDBGraphVectorStoreComponent
+    from .cassandra import CassandraVectorStoreComponent
+    from .cassandra_graph import CassandraGraphVectorStoreComponent
+    from .chroma import ChromaVectorStoreComponent
+    from .clickhouse import ClickhouseVectorStoreComponent
+    from .couchbase import CouchbaseVectorStoreComponent
+    from .elasticsearch import ElasticsearchVectorStoreComponent
+    from .faiss import FaissVectorStoreComponent
+    from .graph_rag import GraphRAGComponent
+    from .hcd import HCDVectorStoreComponent
+    from .local_db import LocalDBComponent
+    from .milvus import MilvusVectorStoreComponent
+    from .mongodb_atlas import MongoVectorStoreComponent
+    from .opensearch import OpenSearchVectorStoreComponent
+    from .pgvector import PGVectorStoreComponent
+    from .pinecone import PineconeVectorStoreComponent
+    from .qdrant import QdrantVectorStoreComponent
+    from .redis import RedisVectorStoreComponent
+    from .supabase import SupabaseVectorStoreComponent
+    from .upstash import UpstashVectorStoreComponent
+    from .vectara import VectaraVectorStoreComponent
+    from .vectara_rag import VectaraRagComponent
+    from .vectara_self_query import VectaraSelfQueryRetriverComponent
+    from .weaviate import WeaviateVectorStoreComponent
+
+_dynamic_imports = {
+    "AstraDBVectorStoreComponent": "astradb",
+    "AstraDBGraphVectorStoreComponent": "astradb_graph",
+    "CassandraVectorStoreComponent": "cassandra",
+    "CassandraGraphVectorStoreComponent": "cassandra_graph",
+    "ChromaVectorStoreComponent": "chroma",
+    "ClickhouseVectorStoreComponent": "clickhouse",
+    "CouchbaseVectorStoreComponent": "couchbase",
+    "ElasticsearchVectorStoreComponent": "elasticsearch",
+    "FaissVectorStoreComponent": "faiss",
+    "GraphRAGComponent": "graph_rag",
+    "HCDVectorStoreComponent": "hcd",
+    "LocalDBComponent": "local_db",
+    "MilvusVectorStoreComponent": "milvus",
+    "MongoVectorStoreComponent": "mongodb_atlas",
+    "OpenSearchVectorStoreComponent": "opensearch",
+    "PGVectorStoreComponent": "pgvector",
+    "PineconeVectorStoreComponent": "pinecone",
+    "QdrantVectorStoreComponent": "qdrant",
+    "RedisVectorStoreComponent": "redis",
+    "SupabaseVectorStoreComponent": "supabase",
+    "UpstashVectorStoreComponent": "upstash",
+    "VectaraVectorStoreComponent": "vectara",
+    "VectaraRagComponent": "vectara_rag",
+    "VectaraSelfQueryRetriverComponent": "vectara_self_query",
+    "WeaviateVectorStoreComponent": "weaviate",
+}
 
 __all__ = [
     "AstraDBGraphVectorStoreComponent",
@@ -51,3 +86,5 @@ __all__ = [
     "VectaraVectorStoreComponent",
     "WeaviateVectorStoreComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
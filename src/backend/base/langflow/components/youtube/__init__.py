@@ -1,10 +1,27 @@
-from .channel import YouTubeChannelComponent
-from .comments import YouTubeCommentsComponent
-from .playlist import YouTubePlaylistComponent
-from .search import YouTubeSearchComponent
-from .trending import YouTubeTrendingComponent
-from .video_details import YouTubeVideoDetailsComponent
-from .youtube_transcripts import YouTubeTranscriptsComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .channel import YouTubeChannelComponent
+    from .comments import YouTubeCommentsComponent
+    from .playlist import YouTubePlaylistComponent
+    from .search import YouTubeSearchComponent
+    from .trending import YouTubeTrendingComponent
+    from .video_details import YouTubeVideoDetailsComponent
+    from .youtube_transcripts import YouTubeTranscriptsComponent
+
+_dynamic_imports = {
+    "YouTubeChannelComponent": "channel",
+    "YouTubeCommentsComponent": "comments",
+    "YouTubePlaylistComponent": "playlist",
+    "YouTubeSearchComponent": "search",
+    "YouTubeTrendingComponent": "trending",
+    "YouTubeVideoDetailsComponent": "video_details",
+    "YouTubeTranscriptsComponent": "youtube_transcripts",
+}
 
 __all__ = [
     "YouTubeChannelComponent",
@@ -15,3 +32,5 @@ __all__ = [
     "YouTubeTrendingComponent",
     "YouTubeVideoDetailsComponent",
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
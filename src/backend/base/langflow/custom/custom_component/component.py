@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
 from uuid import UUID
 
 import nanoid
-import pandas as pd
 import yaml
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, ValidationError
@@ -36,6 +35,7 @@ from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
 from langflow.utils.async_helpers import run_until_complete
+from langflow.utils.lazy_imports import is_instance_of
 from langflow.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -1210,7 +1210,7 @@ class Component(CustomComponent):
         # Use set comparison for O(n) average case complexity, earlier the old_tags.sort() != new_tags.sort() was used
         return set(old_tags) != set(new_tags)
 
-    def _filter_tools_by_status(self, tools: list[Tool], metadata: pd.DataFrame | None) -> list[Tool]:
+    def _filter_tools_by_status(self, tools: list[Tool], metadata: DataFrame | None) -> list[Tool]:
         """Filter tools based on their status in metadata.
 
         Args:
@@ -1222,7 +1222,7 @@ class Component(CustomComponent):
         """
         # Convert metadata to a list of dicts if it's a DataFrame
         metadata_dict = None  # Initialize as None to avoid lint issues with empty dict
-        if isinstance(metadata, pd.DataFrame):
+        if is_instance_of(metadata, "pandas", "DataFrame"):
             metadata_dict = metadata.to_dict(orient="records")
 
         # If metadata is None or empty, use enabled_tools
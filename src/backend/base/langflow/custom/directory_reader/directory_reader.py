@@ -8,6 +8,7 @@ from aiofile import async_open
 from loguru import logger
 
 from langflow.custom import Component
+from langflow.utils.startup_profile import component_build_timer
 
 MAX_DEPTH = 2
 
@@ -70,7 +71,8 @@ class DirectoryReader:
             for component in menu["components"]:
                 try:
                     if component["error"] if with_errors else not component["error"]:
-                        component_tuple = (*build_component(component), component)
+                        with component_build_timer(f"{menu['name']}/{component['file']}"):
+                            component_tuple = (*build_component(component), component)
                         components.append(component_tuple)
                 except Exception:  # noqa: BLE001
                     logger.debug(f"Error while loading component {component['name']} from {component['file']}")
@@ -0,0 +1,138 @@
+"""On-disk manifest of built component templates.
+
+Building a component template reads, validates, parses and executes the component's file. The manifest
+stores the result of that work per file, keyed by the file's content hash, so that startup only rebuilds
+the templates of new or modified files. The whole manifest is discarded when the Langflow or Python version,
+the sources of the Langflow modules components build their templates from, or the installed distributions
+change, since templates also depend on the base classes and packages the components import.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+MANIFEST_FILENAME = "component_templates.pkl"
+MANIFEST_FORMAT = 2
+# Langflow packages whose classes end up in the built templates
+TEMPLATE_SOURCE_PACKAGES = ("base", "custom", "field_typing", "inputs", "io", "schema", "template")
+
+
+def sources_fingerprint(root: Path | None = None) -> str:
+    """Hash the sources of the template-building packages, which change without a version bump in dev installs."""
+    root = root or Path(__file__).resolve().parents[2]
+    digest = hashlib.sha256()
+    for package in TEMPLATE_SOURCE_PACKAGES:
+        for file_path in sorted((root / package).rglob("*.py")):
+            digest.update(file_path.relative_to(root).as_posix().encode())
+            digest.update(b"\x00")
+            digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def distributions_fingerprint() -> str:
+    """Hash the names and versions of the installed distributions the components may import."""
+    installed = sorted(
+        f"{dist.metadata['Name']}=={dist.version}".lower() for dist in importlib.metadata.distributions()
+    )
+    return hashlib.sha256("\n".join(installed).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def manifest_version() -> str:
+    from langflow.utils.version import get_version_info
+
+    version = (get_version_info() or {}).get("version", "unknown")
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return f"{MANIFEST_FORMAT}:{version}:{python_version}:{sources_fingerprint()}:{distributions_fingerprint()}"
+
+
+def hash_file(file_path: str) -> str | None:
+    try:
+        return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class ComponentTemplateManifest:
+    """Built menu entries of each component file, reused while the file's content hash is unchanged.
+
+    An entry holds the `valid` items `DirectoryReader.filter_loaded_components` produced for the file, i.e.
+    `(component_name, template, component_info)` tuples. Files with invalid components are not stored: they
+    typically fail on an import that installing a package later fixes, without changing the file.
+    """
+
+    def __init__(self, path: str | Path, version: str | None = None) -> None:
+        self.path = Path(path)
+        self.version = version or manifest_version()
+        self.files: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> ComponentTemplateManifest:
+        if not self.path.exists():
+            return self
+        try:
+            with self.path.open("rb") as f:
+                data = pickle.load(f)  # noqa: S301
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Ignoring unreadable component manifest {self.path}")
+            return self
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            logger.debug("Component manifest was written by another version, rebuilding all templates")
+            self._dirty = True
+            return self
+        self.files = data.get("files", {})
+        return self
+
+    def get(self, file_path: str, content_hash: str | None) -> dict[str, Any] | None:
+        self._seen.add(file_path)
+        entry = self.files.get(file_path)
+        if content_hash is None or entry is None or entry["hash"] != content_hash:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, file_path: str, content_hash: str | None, valid: list, invalid: list) -> None:
+        self._seen.add(file_path)
+        if content_hash is None:
+            return
+        if invalid:
+            self._dirty |= self.files.pop(file_path, None) is not None
+            return
+        self.files[file_path] = {"hash": content_hash, "valid": valid, "invalid": []}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Drop the entries of files that no longer exist and atomically rewrite the manifest if it changed."""
+        removed = [file_path for file_path in self.files if file_path not in self._seen]
+        for file_path in removed:
+            del self.files[file_path]
+        if not (self._dirty or removed):
+            return
+        tmp_path: Path | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{MANIFEST_FILENAME}.")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": self.version, "files": self.files}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(self.path)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not write component manifest {self.path}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            return
+        self._dirty = False
@@ -0,0 +1,119 @@
+"""Static index of component files.
+
+Extracts what the component sidebar needs (name, display name, description, icon, inputs and outputs) from a
+component file's AST, without importing or executing it. Values that are not literals, such as inputs
+inherited from a base class or computed options, are left out until the full template is built.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import Any
+
+CLASS_ATTRIBUTES = ("display_name", "description", "icon", "name", "documentation", "beta", "legacy")
+_MISSING = object()
+
+
+def _literal(node: ast.AST) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return _MISSING
+
+
+def _call_name(node: ast.Call) -> str:
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return ""
+
+
+def _literal_kwargs(node: ast.Call) -> dict[str, Any]:
+    kwargs = {}
+    for keyword in node.keywords:
+        if keyword.arg is not None and (value := _literal(keyword.value)) is not _MISSING:
+            kwargs[keyword.arg] = value
+    return kwargs
+
+
+def _find_component_class(module: ast.Module) -> ast.ClassDef | None:
+    # Same rule as `langflow.utils.validate.extract_class_name`, which the full build uses
+    for node in module.body:
+        if isinstance(node, ast.ClassDef) and any(
+            isinstance(base, ast.Name) and any(pattern in base.id for pattern in ["Component", "LC"])
+            for base in node.bases
+        ):
+            return node
+    return None
+
+
+def _class_assignments(class_node: ast.ClassDef) -> dict[str, ast.AST]:
+    assignments: dict[str, ast.AST] = {}
+    for statement in class_node.body:
+        if isinstance(statement, ast.Assign):
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    assignments[target.id] = statement.value
+        elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name) and statement.value:
+            assignments[statement.target.id] = statement.value
+    return assignments
+
+
+def _calls(node: ast.AST | None) -> list[ast.Call]:
+    if not isinstance(node, ast.List | ast.Tuple):
+        return []
+    return [element for element in node.elts if isinstance(element, ast.Call)]
+
+
+def extract_component_index(code: str) -> dict[str, Any] | None:
+    """Return the statically known metadata of the component defined in `code`, or None if there is none."""
+    try:
+        module = ast.parse(code)
+    except SyntaxError:
+        return None
+    if (class_node := _find_component_class(module)) is None:
+        return None
+
+    assignments = _class_assignments(class_node)
+    index: dict[str, Any] = {"class_name": class_node.name}
+    for attribute in CLASS_ATTRIBUTES:
+        if attribute in assignments and (value := _literal(assignments[attribute])) is not _MISSING:
+            index[attribute] = value
+
+    index["inputs"] = []
+    for call in _calls(assignments.get("inputs")):
+        kwargs = _literal_kwargs(call)
+        if "name" in kwargs:
+            index["inputs"].append({**kwargs, "_input_type": _call_name(call)})
+    index["outputs"] = [
+        kwargs for call in _calls(assignments.get("outputs")) if "name" in (kwargs := _literal_kwargs(call))
+    ]
+    return index
+
+
+def component_key(index: dict[str, Any]) -> str:
+    """The key the full build stores the component under (see `langflow.custom.utils.get_instance_name`)."""
+    return index.get("name") or index["class_name"]
+
+
+def build_stub_template(index: dict[str, Any], code: str) -> dict[str, Any]:
+    """Shape the static index like a frontend node so the component can be listed before it is built."""
+    template: dict[str, Any] = {
+        "_type": "Component",
+        "code": {"type": "code", "name": "code", "value": code, "show": True, "advanced": True, "dynamic": True},
+    }
+    for input_ in index["inputs"]:
+        template[input_["name"]] = {"show": True, **input_}
+    return {
+        "display_name": index.get("display_name") or index["class_name"],
+        "description": index.get("description", ""),
+        "icon": index.get("icon"),
+        "documentation": index.get("documentation", ""),
+        "beta": index.get("beta", False),
+        "legacy": index.get("legacy", False),
+        "template": template,
+        "outputs": [{"types": [], "selected": None, **output} for output in index["outputs"]],
+        "base_classes": [],
+        "lazy_loaded": True,
+    }
@@ -1,10 +1,20 @@
+from __future__ import annotations
+
 import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from langflow.custom.directory_reader import DirectoryReader
+from langflow.custom.directory_reader.manifest import hash_file
 from langflow.template.frontend_node.custom_components import CustomComponentFrontendNode
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.manifest import ComponentTemplateManifest
+
 
 def merge_nested_dicts_with_renaming(dict1, dict2):
     for key, value in dict2.items():
@@ -53,8 +63,14 @@ def build_and_validate_all_files(reader: DirectoryReader, file_list):
     return valid_components, invalid_components
 
 
-async def abuild_and_validate_all_files(reader: DirectoryReader, file_list):
-    """Build and validate all files."""
+async def abuild_and_validate_all_files(reader: DirectoryReader, file_list, workers: int = 0):
+    """Build and validate all files.
+
+    With more than one `workers`, the files are split into contiguous shards that are built in a process pool.
+    """
+    if workers > 1 and len(file_list) > 1:
+        return await abuild_and_validate_files_in_processes(reader, file_list, workers)
+
     data = await reader.abuild_component_menu_list(file_list)
 
     valid_components = reader.filter_loaded_components(data=data, with_errors=False)
@@ -63,6 +79,82 @@ async def abuild_and_validate_all_files(reader: DirectoryReader, file_list):
     return valid_components, invalid_components
 
 
+def _build_and_validate_shard(directory_path: str, file_list: list[str]):
+    """Entry point of the process pool workers; the results are pickled back to the parent process."""
+    reader = DirectoryReader(directory_path, compress_code_field=False)
+    return build_and_validate_all_files(reader, file_list)
+
+
+def _merge_menus(target: dict, source: dict) -> None:
+    for menu in source["menu"]:
+        if existing := next((item for item in target["menu"] if item["name"] == menu["name"]), None):
+            existing["components"].extend(menu["components"])
+        else:
+            target["menu"].append(menu)
+
+
+async def abuild_and_validate_files_in_processes(reader: DirectoryReader, file_list: list[str], workers: int):
+    """Build and validate `file_list` in up to `workers` processes, keeping the order of a serial build."""
+    workers = min(workers, len(file_list))
+    # More shards than workers so that a shard of slow imports does not hold back the whole build
+    shard_count = min(len(file_list), workers * 4)
+    shard_size = -(-len(file_list) // shard_count)
+    shards = [file_list[start : start + shard_size] for start in range(0, len(file_list), shard_size)]
+    logger.debug(f"Building {len(file_list)} component file(s) in {workers} processes ({len(shards)} shards)")
+
+    loop = asyncio.get_running_loop()
+    # Spawned workers do not inherit the parent's threads, locks or event loop
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _build_and_validate_shard, reader.directory_path, shard)
+                for shard in shards
+            )
+        )
+
+    valid_components: dict = {"menu": []}
+    invalid_components: dict = {"menu": []}
+    for valid, invalid in results:
+        _merge_menus(valid_components, valid)
+        _merge_menus(invalid_components, invalid)
+    return valid_components, invalid_components
+
+
+async def abuild_and_validate_changed_files(
+    reader: DirectoryReader, file_list: list[str], manifest: ComponentTemplateManifest, workers: int = 0
+):
+    """Build and validate the files whose content changed since `manifest` was written, reusing the rest."""
+    hashes = await asyncio.to_thread(lambda: {file_path: hash_file(file_path) for file_path in file_list})
+    entries = {file_path: manifest.get(file_path, hashes[file_path]) for file_path in file_list}
+    if changed := [file_path for file_path, entry in entries.items() if entry is None]:
+        logger.debug(f"Rebuilding {len(changed)} of {len(file_list)} component file(s) in {reader.directory_path}")
+        built: dict[str, dict[str, list]] = {file_path: {"valid": [], "invalid": []} for file_path in changed}
+        valid, invalid = await abuild_and_validate_all_files(reader, changed, workers)
+        for key, data in (("valid", valid), ("invalid", invalid)):
+            for menu in data["menu"]:
+                for item in menu["components"]:
+                    file_path = str(Path(menu["path"]) / item[2]["file"])
+                    built.setdefault(file_path, {"valid": [], "invalid": []})[key].append(item)
+        for file_path in changed:
+            manifest.put(file_path, hashes[file_path], **built[file_path])
+            entries[file_path] = built[file_path]
+
+    # Reassemble the menus in file order, as `abuild_and_validate_all_files` would have
+    valid_components: dict = {"menu": []}
+    invalid_components: dict = {"menu": []}
+    for file_path, entry in entries.items():
+        parent = Path(file_path).parent
+        for key, data in (("valid", valid_components), ("invalid", invalid_components)):
+            if not entry[key]:
+                continue
+            menu = reader.find_menu(data, parent.name)
+            if menu is None:
+                menu = {"name": parent.name, "path": str(parent), "components": []}
+                data["menu"].append(menu)
+            menu["components"].extend(tuple(item) for item in entry[key])
+    return valid_components, invalid_components
+
+
 def load_files_from_path(path: str):
     """Load all files from a given path."""
     reader = DirectoryReader(path, compress_code_field=False)
@@ -83,12 +175,23 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+async def abuild_custom_component_list_from_path(
+    path: str, manifest: ComponentTemplateManifest | None = None, workers: int = 0
+):
+    """Build a list of custom components for the langchain from a given path.
+
+    When a `manifest` is given, only the templates of files that are new or changed since it was written are built.
+    With more than one `workers`, the templates are built in a process pool.
+    """
     file_list = await asyncio.to_thread(load_files_from_path, path)
     reader = DirectoryReader(path, compress_code_field=False)
 
-    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+    if manifest is None:
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list, workers)
+    else:
+        valid_components, invalid_components = await abuild_and_validate_changed_files(
+            reader, file_list, manifest, workers
+        )
 
     valid_menu = build_valid_menu(valid_components)
     invalid_menu = build_invalid_menu(invalid_components)
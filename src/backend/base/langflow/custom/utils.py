@@ -15,6 +15,7 @@ from pydantic import BaseModel
 
 from langflow.custom import CustomComponent
 from langflow.custom.custom_component.component import Component
+from langflow.custom.directory_reader.manifest import ComponentTemplateManifest
 from langflow.custom.directory_reader.utils import (
     abuild_custom_component_list_from_path,
     build_custom_component_list_from_path,
@@ -485,8 +486,14 @@ def build_custom_components(components_paths: list[str]):
     return custom_components_from_file
 
 
-async def abuild_custom_components(components_paths: list[str]):
-    """Build custom components from the specified paths."""
+async def abuild_custom_components(
+    components_paths: list[str], manifest: ComponentTemplateManifest | None = None, workers: int = 0
+):
+    """Build custom components from the specified paths.
+
+    When a `manifest` is given, templates of unchanged files are reused from it and it is saved afterwards.
+    With more than one `workers`, templates that need building are built in a process pool.
+    """
     if not components_paths:
         return {}
 
@@ -498,7 +505,7 @@ async def abuild_custom_components(components_paths: list[str]):
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(path_str, manifest, workers)
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
@@ -507,6 +514,9 @@ async def abuild_custom_components(components_paths: list[str]):
             )
         processed_paths.add(path_str)
 
+    if manifest is not None:
+        logger.debug(f"Reused {manifest.hits} component file(s) from the template manifest, built {manifest.misses}")
+        await asyncio.to_thread(manifest.save)
     return custom_components_from_file
 
 
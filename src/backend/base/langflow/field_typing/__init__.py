@@ -1,36 +1,39 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .constants import (
-    AgentExecutor,
-    BaseChatMemory,
-    BaseChatModel,
-    BaseDocumentCompressor,
-    BaseLanguageModel,
-    BaseLLM,
-    BaseLoader,
-    BaseMemory,
-    BaseOutputParser,
-    BasePromptTemplate,
-    BaseRetriever,
-    Callable,
-    Chain,
-    ChatPromptTemplate,
-    Code,
-    Data,
-    Document,
-    Embeddings,
-    LanguageModel,
-    NestedDict,
-    Object,
-    PromptTemplate,
-    Retriever,
-    Text,
-    TextSplitter,
-    Tool,
-    VectorStore,
-)
 from .range_spec import RangeSpec
 
+# The constants import langchain and pandas, so they are only imported when one of them is used
+if TYPE_CHECKING:
+    from .constants import (
+        AgentExecutor,
+        BaseChatMemory,
+        BaseChatModel,
+        BaseDocumentCompressor,
+        BaseLanguageModel,
+        BaseLLM,
+        BaseLoader,
+        BaseMemory,
+        BaseOutputParser,
+        BasePromptTemplate,
+        BaseRetriever,
+        Callable,
+        Chain,
+        ChatPromptTemplate,
+        Code,
+        Data,
+        Document,
+        Embeddings,
+        LanguageModel,
+        NestedDict,
+        Object,
+        PromptTemplate,
+        Retriever,
+        Text,
+        TextSplitter,
+        Tool,
+        VectorStore,
+    )
+
 
 def _import_input_class():
     from langflow.template.field.base import Input
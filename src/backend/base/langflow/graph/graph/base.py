@@ -36,12 +36,13 @@ from langflow.graph.schema import InterfaceComponentTypes, RunOutputs
 from langflow.graph.utils import log_vertex_build
 from langflow.graph.vertex.base import Vertex, VertexStates
 from langflow.graph.vertex.schema import NodeData, NodeTypeEnum
+from langflow.graph.vertex.spill import ResultSpillManager
 from langflow.graph.vertex.vertex_types import ComponentVertex, InterfaceVertex, StateVertex
 from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -133,6 +134,7 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self._result_spill_manager: ResultSpillManager | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -682,7 +684,21 @@ class Graph:
 
         return async_end_traces_func
 
+    @property
+    def result_spill_manager(self) -> ResultSpillManager:
+        """The manager accounting for the memory held by this run's vertex outputs."""
+        if getattr(self, "_result_spill_manager", None) is None:
+            try:
+                limit_mb = get_settings_service().settings.vertex_results_memory_limit
+            except Exception:  # noqa: BLE001
+                limit_mb = 0
+            self._result_spill_manager = ResultSpillManager(threshold=limit_mb * 1024 * 1024)
+        return cast("ResultSpillManager", self._result_spill_manager)
+
     async def end_all_traces(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        # The spilled outputs stay on disk while the graph (e.g. in the chat cache) still references them
+        if getattr(self, "_result_spill_manager", None) is not None:
+            self.result_spill_manager.end_run()
         if not self.tracing_service:
             return
         self._end_time = datetime.now(timezone.utc)
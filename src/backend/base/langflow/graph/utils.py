@@ -5,7 +5,6 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-import pandas as pd
 from loguru import logger
 
 from langflow.interface.utils import extract_input_variables_from_prompt
@@ -19,6 +18,7 @@ from langflow.services.database.models.vertex_builds.crud import log_vertex_buil
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
 from langflow.services.database.utils import session_getter
 from langflow.services.deps import get_db_service, get_settings_service
+from langflow.utils.lazy_imports import is_instance_of
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -131,7 +131,7 @@ async def log_transaction(
             try:
                 result_dict = source.result.model_dump()
                 for key, value in result_dict.items():
-                    if isinstance(value, pd.DataFrame):
+                    if is_instance_of(value, "pandas", "DataFrame"):
                         result_dict[key] = value.to_dict()
                 outputs = result_dict
             except Exception as e:  # noqa: BLE001
@@ -108,6 +108,7 @@ class Vertex:
         ]
         self._incoming_edges: list[CycleEdge] | None = None
         self._outgoing_edges: list[CycleEdge] | None = None
+        self._component_loaded = False
 
     @property
     def is_loop(self) -> bool:
@@ -181,6 +182,9 @@ class Vertex:
     def set_artifacts(self) -> None:
         pass
 
+    def spill_large_results(self) -> None:
+        """Move outputs that exceed the run's memory budget to disk. Only component vertices spill."""
+
     @property
     def edges(self) -> list[CycleEdge]:
         return self.graph.get_vertex_edges(self.id)
@@ -714,14 +718,15 @@ class Vertex:
         event_manager: EventManager | None = None,
         **kwargs,
     ) -> Any:
-        # Add lazy loading check at the beginning
-        # Check if we need to fully load this component first
-        from langflow.interface.components import ensure_component_loaded
-        from langflow.services.deps import get_settings_service
+        if not self._component_loaded:
+            # In lazy mode, materialize this component's template the first time the vertex is built
+            from langflow.interface.components import ensure_component_loaded
+            from langflow.services.deps import get_settings_service
 
-        if get_settings_service().settings.lazy_load_components:
-            component_name = self.id.split("-")[0]
-            await ensure_component_loaded(self.vertex_type, component_name, get_settings_service())
+            settings_service = get_settings_service()
+            if settings_service.settings.lazy_load_components:
+                await ensure_component_loaded(self.vertex_type, self.base_name, settings_service)
+            self._component_loaded = True
 
         # Continue with the original implementation
         async with self._lock:
@@ -763,6 +768,7 @@ class Vertex:
                     self.steps_ran.append(step)
 
             self.finalize_build()
+            self.spill_large_results()
 
         return await self.get_requester_result(requester)
 
@@ -6,7 +6,6 @@ import ast
 import os
 from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from loguru import logger
 
 from langflow.schema.data import Data
@@ -244,6 +243,8 @@ class ParameterHandler:
                         params[field_name] = bool(val)
             case "table" | "tools":
                 if isinstance(val, list) and all(isinstance(item, dict) for item in val):
+                    import pandas as pd
+
                     params[field_name] = pd.DataFrame(val)
                 else:
                     msg = f"Invalid value type {type(val)} for field {field_name}"
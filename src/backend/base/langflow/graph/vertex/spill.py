@@ -0,0 +1,230 @@
+"""Spill oversized vertex outputs to disk.
+
+Vertex results live on the vertex, on its component and on cached graphs for the whole run. When a run
+holds more `DataFrame` or `list[Data]` output than the configured budget, further outputs of those types are
+written to a temporary file (Arrow IPC when pyarrow is available, pickle otherwise) and replaced by a
+`SpilledResult` handle that downstream vertices load on access. The serialized copies the vertex keeps for the UI
+(artifacts and output logs) are cut down to the preview rows; the handle is serialized from its preview when at most
+that many rows are asked for, and read back in full otherwise (e.g. by `/run`).
+
+An output is spilled once its component has produced it: spilling bounds the memory a run retains across its
+vertices, not the peak memory of the component producing the output. The files are deleted once nothing references
+them anymore, that is once the graph holding the handles is evicted from the cache or the flow is rebuilt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.schema.data import Data
+from langflow.serialization.constants import MAX_ITEMS_LENGTH
+from langflow.utils.lazy_imports import is_instance_of
+
+if TYPE_CHECKING:
+    from langflow.schema.dataframe import DataFrame
+
+SPILL_DIR_PREFIX = "langflow_spill_"
+
+
+def estimate_result_size(value: Any) -> int:
+    """Estimate the in-memory size of a spillable result in bytes, or 0 if it cannot be spilled."""
+    if is_instance_of(value, "langflow.schema.dataframe", "DataFrame"):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if is_data_list(value):
+        return sum(sys.getsizeof(item.text_key) + _dict_size(item.data) for item in value)
+    return 0
+
+
+def _dict_size(data: dict) -> int:
+    return sys.getsizeof(data) + sum(sys.getsizeof(key) + sys.getsizeof(val) for key, val in data.items())
+
+
+def is_data_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, Data) for item in value)
+
+
+class SpillDirectory:
+    """A temporary directory deleted once neither its manager nor any handle to its files references it."""
+
+    def __init__(self) -> None:
+        self.path = Path(tempfile.mkdtemp(prefix=SPILL_DIR_PREFIX))
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+
+    def remove(self) -> None:
+        self._finalizer()
+
+
+class SpilledResult:
+    """A lazy handle to a vertex output stored on disk.
+
+    The handle keeps its directory, and so its file, alive. A pickled handle (e.g. a graph stored in a pickling cache)
+    does not: it can only be loaded while the original handles exist.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fmt: str,
+        nbytes: int,
+        preview: Any,
+        text_key: str = "text",
+        directory: SpillDirectory | None = None,
+        rows: int = 0,
+    ) -> None:
+        self.path = path
+        self.format = fmt
+        self.nbytes = nbytes
+        self.preview = preview
+        # Number of rows of the output, of which `preview` holds the first MAX_ITEMS_LENGTH
+        self.rows = rows
+        self.text_key = text_key
+        self._directory = directory
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, "_directory": None}
+
+    def load(self) -> Any:
+        """Read the output back into memory, memory-mapping Arrow files where possible."""
+        if not self.path.exists():
+            msg = (
+                f"The spilled output at {self.path} is no longer available. "
+                "Rebuild the upstream component to recompute it."
+            )
+            raise ValueError(msg)
+        from langflow.schema.dataframe import DataFrame
+
+        if self.format == "arrow":
+            import pyarrow as pa
+
+            with pa.memory_map(str(self.path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+            return DataFrame(table.to_pandas(), text_key=self.text_key)
+        with self.path.open("rb") as f:
+            value = pickle.load(f)  # noqa: S301
+        # pandas does not pickle the DataFrame subclass' private attributes
+        return DataFrame(value, text_key=self.text_key) if is_instance_of(value, "pandas", "DataFrame") else value
+
+    def __repr__(self) -> str:
+        return f"SpilledResult(path='{self.path}', format='{self.format}', nbytes={self.nbytes}, rows={self.rows})"
+
+
+class ResultSpillManager:
+    """Accounts for the memory held by a run's outputs and spills them once `threshold` bytes is exceeded.
+
+    A `threshold` of 0 disables spilling.
+    """
+
+    def __init__(self, threshold: int = 0) -> None:
+        self.threshold = threshold
+        self.in_memory_bytes = 0
+        self.spilled_bytes = 0
+        self._lock = threading.Lock()
+        self._directory: SpillDirectory | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def _get_directory(self) -> SpillDirectory:
+        if self._directory is None:
+            self._directory = SpillDirectory()
+        return self._directory
+
+    def maybe_spill(self, value: Any) -> Any:
+        """Return `value` unchanged, or a `SpilledResult` if keeping it would exceed the run's budget."""
+        if not self.enabled:
+            return value
+        size = estimate_result_size(value)
+        if size == 0:
+            return value
+        with self._lock:
+            if self.in_memory_bytes + size <= self.threshold:
+                self.in_memory_bytes += size
+                return value
+        try:
+            handle = self.spill(value, size)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning("Could not spill vertex output to disk, keeping it in memory")
+            with self._lock:
+                self.in_memory_bytes += size
+            return value
+        with self._lock:
+            self.spilled_bytes += size
+        return handle
+
+    def spill(self, value: DataFrame | list[Data], size: int) -> SpilledResult:
+        directory = self._get_directory()
+        path = directory.path / uuid.uuid4().hex
+        text_key = "text"
+        if is_instance_of(value, "langflow.schema.dataframe", "DataFrame"):
+            from langflow.schema.dataframe import DataFrame
+
+            text_key = value.text_key
+            preview: Any = DataFrame(value.head(MAX_ITEMS_LENGTH), text_key=text_key)
+            if self._write_arrow(value, path):
+                return SpilledResult(
+                    path, "arrow", size, preview, text_key=text_key, directory=directory, rows=len(value)
+                )
+        else:
+            preview = value[:MAX_ITEMS_LENGTH]
+        with path.open("wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return SpilledResult(path, "pickle", size, preview, text_key=text_key, directory=directory, rows=len(value))
+
+    @staticmethod
+    def _write_arrow(value: DataFrame, path: Path) -> bool:
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return False
+        try:
+            table = pa.Table.from_pandas(value, preserve_index=True)
+            with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        except (pa.ArrowException, TypeError, ValueError):
+            # Object columns holding arbitrary Python values cannot be represented in Arrow
+            path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def end_run(self) -> None:
+        """Reset the accounting for the next run.
+
+        The files spilled so far stay as long as the handles that reference them, which the next run replaces as it
+        rebuilds the vertices.
+        """
+        with self._lock:
+            self._directory = None
+            self.in_memory_bytes = 0
+            self.spilled_bytes = 0
+
+    def cleanup(self) -> None:
+        """Delete every file spilled by this manager now, even if handles still reference them."""
+        if self._directory is not None:
+            self._directory.remove()
+        self.end_run()
+
+
+def truncate_rows(value: Any) -> Any:
+    """Cut a serialized copy of a spilled output (a list of rows) down to the preview rows, noting how many are left."""
+    if isinstance(value, list) and len(value) > MAX_ITEMS_LENGTH:
+        return [*value[:MAX_ITEMS_LENGTH], f"... [truncated {len(value) - MAX_ITEMS_LENGTH} items]"]
+    return value
+
+
+async def load_spilled(value: Any) -> Any:
+    """Materialize `value` if it is a `SpilledResult`, otherwise return it as is."""
+    if isinstance(value, SpilledResult):
+        return await asyncio.to_thread(value.load)
+    return value
@@ -13,6 +13,7 @@ from langflow.graph.schema import CHAT_COMPONENTS, RECORDS_COMPONENTS, Interface
 from langflow.graph.utils import UnbuiltObject, log_vertex_build, rewrite_file_path
 from langflow.graph.vertex.base import Vertex
 from langflow.graph.vertex.exceptions import NoComponentInstanceError
+from langflow.graph.vertex.spill import SpilledResult, load_spilled, truncate_rows
 from langflow.schema import Data
 from langflow.schema.artifact import ArtifactType
 from langflow.schema.message import Message
@@ -77,6 +78,58 @@ class ComponentVertex(Vertex):
         for key, value in self.built_object.items():
             self.add_result(key, value)
 
+    def spill_large_results(self) -> None:
+        """Replace oversized outputs with on-disk handles once the run exceeds its memory budget.
+
+        Every reference to the output (vertex results, built object, build result, component results and output
+        value) is swapped for the handle, and the serialized copies kept for the UI (artifacts and output logs) are
+        cut down to the preview rows, so the data can be freed. Frozen vertices keep their outputs in memory because
+        they outlive the run.
+        """
+        spill_manager = self.graph.result_spill_manager
+        if not spill_manager.enabled or self.frozen:
+            return
+        for key, value in list(self.results.items()):
+            handle = spill_manager.maybe_spill(value)
+            if not isinstance(handle, SpilledResult):
+                continue
+            self.results[key] = handle
+            if isinstance(self.built_object, dict) and key in self.built_object:
+                self.built_object[key] = handle
+            if isinstance(self.built_result, dict) and key in self.built_result:
+                self.built_result[key] = handle
+            if self.result is not None and isinstance(self.result.results, dict) and key in self.result.results:
+                self.result.results[key] = handle
+            if self.custom_component is not None:
+                if key in self.custom_component._results:
+                    self.custom_component._results[key] = handle
+                output = getattr(self.custom_component, "_outputs_map", {}).get(key)
+                if output is not None and output.value is value:
+                    output.value = handle
+            self._truncate_serialized_copies(key)
+            logger.debug(f"Spilled output '{key}' of {self.display_name} ({handle.nbytes} bytes) to {handle.path}")
+
+    def _truncate_serialized_copies(self, key: str) -> None:
+        """Cut the artifacts and output logs of a spilled output down to its preview rows."""
+        artifacts = [self.artifacts.get(key)] if isinstance(self.artifacts, dict) else []
+        if self.custom_component is not None:
+            artifacts.append(self.custom_component._artifacts.get(key))
+        for artifact in artifacts:
+            if isinstance(artifact, dict) and "raw" in artifact:
+                artifact["raw"] = truncate_rows(artifact["raw"])
+        raw_copies = [self.artifacts_raw]
+        output_logs = [self.outputs_logs]
+        if self.result is not None:
+            raw_copies.append(self.result.artifacts)
+            output_logs.append(self.result.outputs)
+        for raw in raw_copies:
+            if isinstance(raw, dict) and key in raw:
+                raw[key] = truncate_rows(raw[key])
+        for outputs in output_logs:
+            output_log = outputs.get(key) if isinstance(outputs, dict) else None
+            if isinstance(output_log, dict) and "message" in output_log:
+                output_log["message"] = truncate_rows(output_log["message"])
+
     def get_edge_with_target(self, target_id: str) -> Generator[CycleEdge, None, None]:
         """Get the edge with the target id.
 
@@ -148,6 +201,7 @@ class ComponentVertex(Vertex):
                 raise ValueError(msg)
             msg = f"Result not found for {edge.source_handle.name} in {edge}"
             raise ValueError(msg)
+        result = await load_spilled(result)
         if flow_id:
             await self._log_transaction_async(source=self, target=requester, flow_id=str(flow_id), status="success")
         return result
@@ -0,0 +1,234 @@
+"""Synchronization of file-backed flows (flows with an `fs_path`) from their files into the database.
+
+The paths of the file-backed flows are kept in an in-memory index that is refreshed from the database at a slow
+cadence, and updated immediately when a flow is saved with an `fs_path`. Changes are picked up from file system
+notifications (via `watchfiles`) and applied in debounced batches; when notifications are unavailable or
+disabled, the indexed files are polled with `stat` instead of re-reading every flow from the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import anyio
+import orjson
+from loguru import logger
+from sqlmodel import col, select
+
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.deps import get_settings_service, session_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# How long to wait for a burst of file events to settle before applying them
+WATCH_DEBOUNCE_MS = 500
+SYNCED_FIELDS = ("name", "description", "data", "locked")
+
+
+def normalize_flow_path(path: str) -> str:
+    return str(Path(path).expanduser().resolve())
+
+
+class FlowFileIndex:
+    """Maps the files of file-backed flows to their flow ids, with the last synced modification times."""
+
+    def __init__(self) -> None:
+        self.flow_ids: dict[str, UUID] = {}
+        self.mtimes: dict[str, float] = {}
+        self.refreshed_at: float | None = None
+        self._changed: asyncio.Event | None = None
+        self._changed_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def changed(self) -> asyncio.Event:
+        """Set when a path is added, so that the watcher starts watching its directory.
+
+        The event is created in the running loop: the index is created at import time, outside of any loop, and
+        may be used by several loops in turn (e.g. one per test).
+        """
+        loop = asyncio.get_running_loop()
+        if self._changed is None or self._changed_loop is not loop:
+            self._changed = asyncio.Event()
+            self._changed_loop = loop
+        return self._changed
+
+    def _notify_change(self) -> None:
+        # Without a running loop, no watcher waits for the event
+        with contextlib.suppress(RuntimeError):
+            self.changed.set()
+
+    def track(self, flow_id: UUID, fs_path: str) -> None:
+        path = normalize_flow_path(fs_path)
+        # A flow whose path changed is only tracked under its new path
+        for old_path in [old for old, old_id in self.flow_ids.items() if old_id == flow_id and old != path]:
+            self.discard(old_path)
+        if self.flow_ids.get(path) != flow_id:
+            self.flow_ids[path] = flow_id
+            self._notify_change()
+
+    def discard(self, path: str) -> None:
+        self.flow_ids.pop(path, None)
+        self.mtimes.pop(path, None)
+
+    def directories(self) -> set[str]:
+        return {str(Path(path).parent) for path in self.flow_ids if Path(path).parent.is_dir()}
+
+    def refresh_due(self, interval: float) -> bool:
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at >= interval
+
+    async def refresh(self) -> None:
+        """Reload the path -> flow id mapping, selecting only those two columns."""
+        async with session_scope() as session:
+            stmt = select(Flow.id, Flow.fs_path).where(col(Flow.fs_path).is_not(None))
+            rows = (await session.exec(stmt)).all()
+        flow_ids = {normalize_flow_path(fs_path): flow_id for flow_id, fs_path in rows if fs_path}
+        if set(flow_ids) - set(self.flow_ids):
+            self._notify_change()
+        for path in set(self.flow_ids) - set(flow_ids):
+            self.mtimes.pop(path, None)
+        self.flow_ids = flow_ids
+        self.refreshed_at = time.monotonic()
+
+    async def modified_paths(self, paths: Iterable[str] | None = None) -> list[str]:
+        """Return the indexed `paths` (all by default) whose files changed since they were last synced."""
+        modified = []
+        for path in list(self.flow_ids) if paths is None else paths:
+            if path not in self.flow_ids:
+                continue
+            try:
+                mtime = (await anyio.Path(path).stat()).st_mtime
+            except FileNotFoundError:
+                continue
+            except OSError:
+                logger.opt(exception=True).debug(f"Could not stat flow file {path}")
+                continue
+            if mtime > self.mtimes.get(path, 0):
+                modified.append(path)
+        return modified
+
+
+flow_file_index = FlowFileIndex()
+
+
+async def track_flow_file(flow: Flow) -> None:
+    """Register the file a committed flow was just written to, so its changes are synced without a refresh."""
+    if not flow.fs_path:
+        return
+    flow_file_index.track(flow.id, flow.fs_path)
+    path = normalize_flow_path(flow.fs_path)
+    # The file already matches the database
+    with contextlib.suppress(OSError):
+        flow_file_index.mtimes[path] = (await anyio.Path(path).stat()).st_mtime
+
+
+async def sync_flow_files(index: FlowFileIndex, paths: Iterable[str]) -> None:
+    """Apply the content of the flow files at `paths` to their flows, in a single transaction."""
+    # The files are only marked as synced once the transaction is committed, so that a failed commit is retried
+    synced: dict[str, float] = {}
+    async with session_scope() as session:
+        for path in paths:
+            if (flow_id := index.flow_ids.get(path)) is None:
+                continue
+            try:
+                file_path = anyio.Path(path)
+                mtime = (await file_path.stat()).st_mtime
+                update_data = orjson.loads(await file_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                continue
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error while handling flow file {path}")
+                continue
+            flow = await session.get(Flow, flow_id)
+            if flow is None:
+                index.discard(path)
+                continue
+            try:
+                for field_name in SYNCED_FIELDS:
+                    if new_value := update_data.get(field_name):
+                        setattr(flow, field_name, new_value)
+                if folder_id := update_data.get("folder_id"):
+                    flow.folder_id = UUID(folder_id)
+                session.add(flow)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Couldn't update flow {flow_id} in database from path {path}")
+            synced[path] = mtime
+    index.mtimes.update(synced)
+
+
+async def _sync_modified(index: FlowFileIndex, paths: Iterable[str] | None = None) -> None:
+    try:
+        if modified := await index.modified_paths(paths):
+            logger.debug(f"Syncing {len(modified)} flow file(s) into the database")
+            await sync_flow_files(index, modified)
+    except Exception:  # noqa: BLE001
+        logger.exception("Error while syncing flows from the file system")
+
+
+async def _refresh_if_due(index: FlowFileIndex, refresh_interval: float) -> None:
+    if not index.refresh_due(refresh_interval):
+        return
+    try:
+        await index.refresh()
+    except Exception:  # noqa: BLE001
+        logger.exception("Error while loading the file-backed flows from the database")
+
+
+async def poll_flow_files(index: FlowFileIndex, polling_interval: float, refresh_interval: float) -> None:
+    while True:
+        await _refresh_if_due(index, refresh_interval)
+        await _sync_modified(index)
+        await asyncio.sleep(polling_interval)
+
+
+async def watch_flow_files(index: FlowFileIndex, refresh_interval: float) -> None:
+    from watchfiles import awatch
+
+    while True:
+        await _refresh_if_due(index, refresh_interval)
+        index.changed.clear()
+        if not (directories := index.directories()):
+            await _sync_modified(index)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(index.changed.wait(), timeout=refresh_interval)
+            continue
+
+        # Catch up on anything that changed while the directories were not watched. The task first runs once
+        # `awatch` has registered its watches, so no change can fall between the check and the watch.
+        catch_up = asyncio.create_task(_sync_modified(index))
+        try:
+            # The watcher is restarted whenever new paths are indexed, so that their directories are watched too
+            async for changes in awatch(
+                *directories,
+                stop_event=index.changed,
+                debounce=WATCH_DEBOUNCE_MS,
+                rust_timeout=int(refresh_interval * 1000),
+                yield_on_timeout=True,
+                recursive=False,
+            ):
+                changed_paths = {normalize_flow_path(path) for _, path in changes}
+                await _sync_modified(index, changed_paths & set(index.flow_ids))
+                if index.refresh_due(refresh_interval):
+                    break
+        finally:
+            await catch_up
+
+
+async def sync_flows_from_fs() -> None:
+    """Keep file-backed flows in sync with their files, watching for changes when possible and polling otherwise."""
+    settings = get_settings_service().settings
+    polling_interval = settings.fs_flows_polling_interval / 1000
+    refresh_interval = settings.fs_flows_index_refresh_interval / 1000
+    if settings.fs_flows_watch:
+        try:
+            await watch_flow_files(flow_file_index, refresh_interval)
+        except ImportError:
+            logger.debug("watchfiles is not installed, polling flow files instead")
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning("Watching flow files failed, polling them instead")
+    await poll_flow_files(flow_file_index, polling_interval, refresh_interval)
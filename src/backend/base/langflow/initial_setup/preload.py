@@ -0,0 +1,105 @@
+"""Startup work done once in the gunicorn master before the workers are forked.
+
+With `preload_app` enabled, the master runs the database startup steps and builds the component types dict,
+then releases everything that must not cross a fork (database engines, caches, event-loop bound objects).
+Workers inherit the types dict, the imported component modules and the settings copy-on-write, and their
+lifespan skips the steps the master already performed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gc
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from filelock import FileLock
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from tempfile import TemporaryDirectory
+
+LEADER_LOCK_FILENAME = ".startup.lock"
+
+
+@dataclass
+class PreloadState:
+    done: bool = False
+    # Kept alive so the bundle directories outlive the preload step; removed when the master exits
+    temp_dirs: list[TemporaryDirectory] = field(default_factory=list)
+
+
+preload_state = PreloadState()
+
+
+def is_preloaded() -> bool:
+    """Whether this process was forked from a master that already ran the startup steps."""
+    return preload_state.done
+
+
+@contextlib.contextmanager
+def startup_leader_lock(config_dir: str | None) -> Iterator[None]:
+    """Hold an exclusive file lock in `config_dir` so concurrent masters run the database steps one at a time."""
+    if not config_dir:
+        yield
+        return
+    lock_path = Path(config_dir) / LEADER_LOCK_FILENAME
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with FileLock(lock_path):
+        yield
+
+
+async def release_services_before_fork() -> None:
+    """Tear down every service except settings, so that workers create their own connections and caches."""
+    from langflow.interface.components import component_cache
+    from langflow.services.manager import service_manager
+    from langflow.services.schema import ServiceType
+
+    for service_name, service in list(service_manager.services.items()):
+        if service_name == ServiceType.SETTINGS_SERVICE:
+            continue
+        try:
+            await service.teardown()
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Error tearing down {service_name} before forking workers")
+        service_manager.services.pop(service_name, None)
+    # Locks are bound to the preload event loop
+    component_cache.load_locks.clear()
+
+
+async def apreload(*, fix_migration: bool = False) -> None:
+    from langflow.initial_setup.setup import (
+        create_or_update_starter_projects,
+        initialize_super_user_if_needed,
+        load_flows_from_directory,
+    )
+    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.main import load_bundles_with_error_handling
+    from langflow.services.deps import get_settings_service
+    from langflow.services.utils import initialize_services
+
+    settings_service = get_settings_service()
+    started_at = time.perf_counter()
+    with startup_leader_lock(settings_service.settings.config_dir):
+        await initialize_services(fix_migration=fix_migration)
+        await initialize_super_user_if_needed()
+        temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
+        settings_service.settings.components_path.extend(bundles_components_paths)
+        all_types_dict = await get_and_cache_all_types_dict(settings_service)
+        await create_or_update_starter_projects(all_types_dict)
+        await load_flows_from_directory()
+    await release_services_before_fork()
+    preload_state.temp_dirs.extend(temp_dirs)
+    preload_state.done = True
+    logger.info(f"Preloaded Sochflow in the master process in {time.perf_counter() - started_at:.2f}s")
+
+
+def preload_in_master(server: Any = None) -> None:  # noqa: ARG001
+    """Gunicorn `on_starting` hook that runs the shared startup work before any worker is forked."""
+    asyncio.run(apreload())
+    # Keep the preloaded objects out of future collections so the GC does not touch (and copy) their pages
+    gc.freeze()
@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import os
@@ -23,7 +24,7 @@ from emoji import demojize, purely_emoji
 from loguru import logger
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload
-from sqlmodel import col, select
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.base.constants import FIELD_FORMAT_ATTRIBUTES, NODE_FORMAT_ATTRIBUTES, ORJSON_OPTIONS
@@ -37,6 +38,8 @@ from langflow.services.deps import get_settings_service, get_storage_service, ge
 from langflow.template.field.prompt import DEFAULT_PROMPT_INTUT_TYPES
 from langflow.utils.util import escape_json_dump
 
+STARTER_PROJECTS_SYNC_FILENAME = "starter_projects_sync.json"
+
 # In the folder ./starter_projects we have a few JSON files that represent
 # starter projects. We want to load these into the database so that users
 # can use them as a starting point for their own projects.
@@ -56,7 +59,8 @@ def update_projects_components_with_latest_component_versions(project_data, all_
         node_data = node.get("data").get("node")
         node_type = node.get("data").get("type")
 
-        if node_type in all_types_dict_flat:
+        # Static stubs from lazy loading do not carry enough of the template to update a project from
+        if node_type in all_types_dict_flat and not all_types_dict_flat[node_type].get("lazy_loaded"):
             latest_node = all_types_dict_flat.get(node_type)
             latest_template = latest_node.get("template")
             node_data["template"]["code"] = latest_template["code"]
@@ -661,13 +665,6 @@ async def get_all_flows_similar_to_project(session: AsyncSession, folder_id: UUI
     return list((await session.exec(stmt)).first().flows)
 
 
-async def delete_start_projects(session, folder_id) -> None:
-    flows = await get_all_flows_similar_to_project(session, folder_id)
-    for flow in flows:
-        await session.delete(flow)
-    await session.commit()
-
-
 async def folder_exists(session, folder_name):
     stmt = select(Folder).where(Folder.name == folder_name)
     folder = (await session.exec(stmt)).first()
@@ -870,19 +867,112 @@ async def find_existing_flow(session, flow_id, flow_endpoint_name):
     return None
 
 
+def get_component_codes(all_types_dict: dict) -> dict[str, str]:
+    """Map each component name to the code of its current template."""
+    return {
+        name: ((component.get("template") or {}).get("code") or {}).get("value") or ""
+        for category in all_types_dict.values()
+        for name, component in category.items()
+    }
+
+
+def starter_project_fingerprint(project: dict, component_codes: dict[str, str], *, update_components: bool) -> str:
+    """Hash everything that determines the synced state of a starter project.
+
+    That is the project itself, the Langflow version and, when projects are updated to the latest component
+    versions, the code of the components the project uses.
+    """
+    from langflow.custom.directory_reader.manifest import manifest_version
+
+    digest = hashlib.sha256()
+    digest.update(f"{manifest_version()}:{int(update_components)}".encode())
+    digest.update(orjson.dumps(project, option=orjson.OPT_SORT_KEYS))
+    if update_components:
+        node_types = {node.get("data", {}).get("type") for node in (project.get("data") or {}).get("nodes", [])}
+        for node_type in sorted(filter(None, node_types)):
+            digest.update(f"{node_type}\x00{component_codes.get(node_type, '')}\x00".encode())
+    return digest.hexdigest()
+
+
+async def load_starter_projects_sync_state(config_dir: str | None) -> dict[str, str]:
+    if not config_dir:
+        return {}
+    path = anyio.Path(config_dir) / STARTER_PROJECTS_SYNC_FILENAME
+    try:
+        return orjson.loads(await path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+async def save_starter_projects_sync_state(config_dir: str | None, state: dict[str, str]) -> None:
+    if not config_dir:
+        return
+    path = anyio.Path(config_dir) / STARTER_PROJECTS_SYNC_FILENAME
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+    try:
+        await tmp_path.write_bytes(orjson.dumps(state, option=orjson.OPT_SORT_KEYS))
+        await tmp_path.replace(path)
+    except OSError:
+        logger.opt(exception=True).warning(f"Could not save the starter projects sync state to {path}")
+
+
 async def create_or_update_starter_projects(all_types_dict: dict, *, do_create: bool = True) -> None:
     """Create or update starter projects.
 
+    Each project's fingerprint (see `starter_project_fingerprint`) is saved in the config directory after it is
+    synced. Projects whose fingerprint did not change and that are still in the database are skipped, so a
+    restart without changes neither rewrites the project files nor touches the database.
+
     Args:
         all_types_dict (dict): Dictionary containing all component types and their templates
         do_create (bool, optional): Whether to create new projects. Defaults to True.
     """
+    settings_service = get_settings_service()
+    config_dir = settings_service.settings.config_dir
+    do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
+    sync_state = await load_starter_projects_sync_state(config_dir)
+    new_sync_state: dict[str, str] = {}
     async with session_scope() as session:
         new_folder = await create_starter_folder(session)
         starter_projects = await load_starter_projects()
-        await delete_start_projects(session, new_folder.id)
         await copy_profile_pictures()
+
+        existing_flows: dict[str, Flow] = {}
+        for flow in await get_all_flows_similar_to_project(session, new_folder.id):
+            if flow.name in existing_flows:
+                # Left behind by concurrent syncs of earlier versions
+                await session.delete(flow)
+            else:
+                existing_flows[flow.name] = flow
+
+        component_codes = get_component_codes(all_types_dict) if do_update_starter_projects else {}
+        changed_projects = []
         for project_path, project in starter_projects:
+            fingerprint = starter_project_fingerprint(
+                project, component_codes, update_components=do_update_starter_projects
+            )
+            project_name = project.get("name")
+            if (
+                project_name
+                and sync_state.get(project_name) == fingerprint
+                and (not do_create or project_name in existing_flows)
+            ):
+                new_sync_state[project_name] = fingerprint
+            else:
+                changed_projects.append((project_path, project))
+
+        if changed_projects and do_update_starter_projects and settings_service.settings.lazy_load_components:
+            # The starter projects are updated from full templates, so build the ones they use
+            from langflow.interface.components import ensure_components_loaded
+
+            node_types = {
+                node.get("data", {}).get("type")
+                for _, project in changed_projects
+                for node in (project.get("data") or {}).get("nodes", [])
+            }
+            await ensure_components_loaded(filter(None, node_types), settings_service)
+
+        for project_path, project in changed_projects:
             (
                 project_name,
                 project_description,
@@ -894,7 +984,6 @@ async def create_or_update_starter_projects(all_types_dict: dict, *, do_create:
                 project_gradient,
                 project_tags,
             ) = get_project_data(project)
-            do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
             if do_update_starter_projects:
                 updated_project_data = update_projects_components_with_latest_component_versions(
                     project_data.copy(), all_types_dict
@@ -905,9 +994,9 @@ async def create_or_update_starter_projects(all_types_dict: dict, *, do_create:
                     # We also need to update the project data in the file
                     await update_project_file(project_path, project, updated_project_data)
             if do_create and project_name and project_data:
-                existing_flows = await get_all_flows_similar_to_project(session, new_folder.id)
-                for existing_project in existing_flows:
+                if (existing_project := existing_flows.pop(project_name, None)) is not None:
                     await session.delete(existing_project)
+                    await session.flush()
 
                 create_new_project(
                     session=session,
@@ -922,6 +1011,20 @@ async def create_or_update_starter_projects(all_types_dict: dict, *, do_create:
                     project_tags=project_tags,
                     new_folder_id=new_folder.id,
                 )
+            if project_name:
+                # `update_project_file` stored the updated data in `project`, which is what the file now contains
+                new_sync_state[project_name] = starter_project_fingerprint(
+                    project, component_codes, update_components=do_update_starter_projects
+                )
+
+        # Remove starter projects that no longer ship with Langflow
+        project_names = {project.get("name") for _, project in starter_projects}
+        for name, flow in existing_flows.items():
+            if name not in project_names:
+                await session.delete(flow)
+
+    if new_sync_state != sync_state:
+        await save_starter_projects_sync_state(config_dir, new_sync_state)
 
 
 async def initialize_super_user_if_needed() -> None:
@@ -976,37 +1079,3 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
         msg = "Failed to get or create default folder"
         raise ValueError(msg) from e
     return FolderRead.model_validate(folder_obj, from_attributes=True)
-
-
-async def sync_flows_from_fs():
-    flow_mtimes = {}
-    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
-    while True:
-        try:
-            async with session_scope() as session:
-                stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                flows = (await session.exec(stmt)).all()
-                for flow in flows:
-                    mtime = flow_mtimes.setdefault(flow.id, 0)
-                    path = anyio.Path(flow.fs_path)
-                    try:
-                        if await path.exists():
-                            new_mtime = (await path.stat()).st_mtime
-                            if new_mtime > mtime:
-                                update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                try:
-                                    for field_name in ("name", "description", "data", "locked"):
-                                        if new_value := update_data.get(field_name):
-                                            setattr(flow, field_name, new_value)
-                                    if folder_id := update_data.get("folder_id"):
-                                        flow.folder_id = UUID(folder_id)
-                                    await session.commit()
-                                    await session.refresh(flow)
-                                except Exception:  # noqa: BLE001
-                                    logger.exception(f"Couldn't update flow {flow.id} in database from path {path}")
-                                flow_mtimes[flow.id] = new_mtime
-                    except Exception:  # noqa: BLE001
-                        logger.exception(f"Error while handling flow file {path}")
-        except Exception:  # noqa: BLE001
-            logger.exception("Error while syncing flows from database")
-        await asyncio.sleep(fs_flows_polling_interval)
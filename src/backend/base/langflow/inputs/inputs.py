@@ -2,7 +2,6 @@ import warnings
 from collections.abc import AsyncIterator, Iterator
 from typing import Any, TypeAlias, get_args
 
-from pandas import DataFrame
 from pydantic import Field, field_validator, model_validator
 
 from langflow.inputs.validators import CoalesceBool
@@ -10,6 +9,7 @@ from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageBase
 from langflow.template.field.base import Input
+from langflow.utils.lazy_imports import is_instance_of
 
 from .input_mixin import (
     AuthMixin,
@@ -46,7 +46,7 @@ class TableInput(BaseInputMixin, MetadataTraceMixin, TableMixin, ListableInputMi
         if isinstance(v, dict | Data):
             v = [v]
         # Automatically convert DataFrame into a list of dictionaries.
-        if isinstance(v, DataFrame):
+        if is_instance_of(v, "pandas", "DataFrame"):
             v = v.to_dict(orient="records")
         # Verify the value is now a list.
         if not isinstance(v, list):
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from langflow.custom.directory_reader import DirectoryReader
+from langflow.custom.directory_reader.manifest import MANIFEST_FILENAME, ComponentTemplateManifest
+from langflow.custom.directory_reader.static_index import build_stub_template, component_key, extract_component_index
+from langflow.custom.directory_reader.utils import abuild_and_validate_all_files
 from langflow.custom.utils import abuild_custom_components
+from langflow.utils.compression import build_precompressed_payload
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from langflow.services.settings.service import SettingsService
+    from langflow.utils.compression import PrecompressedPayload
 
 
 # Create a class to manage component cache instead of using globals
@@ -17,6 +26,14 @@ class ComponentCache:
     def __init__(self):
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Component name -> (category, file path), filled by the static index in lazy mode
+        self.component_files: dict[str, tuple[str, str]] = {}
+        self.load_locks: dict[str, asyncio.Lock] = {}
+        # Serialized and compressed `all_types_dict`, tagged with the `version` it was built from
+        self.all_types_payload: PrecompressedPayload | None = None
+        self.all_types_payload_version = -1
+        # Bumped whenever `all_types_dict` changes
+        self.version = 0
 
 
 # Singleton instance
@@ -36,245 +53,154 @@ async def get_and_cache_all_types_dict(
             component_cache.all_types_dict = await aget_component_metadata(settings_service.settings.components_path)
         else:
             # Traditional full loading
-            component_cache.all_types_dict = await aget_all_types_dict(settings_service.settings.components_path)
+            component_cache.all_types_dict = await aget_all_types_dict(
+                settings_service.settings.components_path,
+                manifest=await aget_component_manifest(settings_service),
+                workers=settings_service.settings.component_build_workers,
+            )
 
         # Log loading stats
-        component_count = sum(len(comps) for comps in component_cache.all_types_dict.get("components", {}).values())
+        component_count = sum(len(comps) for comps in component_cache.all_types_dict.values())
         logger.debug(f"Loaded {component_count} components")
+        component_cache.version += 1
+        await aget_all_types_payload(settings_service)
 
     return component_cache.all_types_dict
 
 
-async def aget_all_types_dict(components_paths: list[str]):
+async def aget_all_types_payload(settings_service: SettingsService) -> PrecompressedPayload:
+    """Get the types dictionary serialized and compressed, rebuilding it only after the dictionary changed."""
+    all_types_dict = await get_and_cache_all_types_dict(settings_service)
+    version = component_cache.version
+    if component_cache.all_types_payload is None or component_cache.all_types_payload_version != version:
+        payload = await asyncio.to_thread(build_precompressed_payload, all_types_dict)
+        # Another request may have changed the dictionary while this one was compressing it
+        if component_cache.version == version:
+            component_cache.all_types_payload = payload
+            component_cache.all_types_payload_version = version
+        return payload
+    return component_cache.all_types_payload
+
+
+async def aget_all_types_dict(
+    components_paths: list[str], manifest: ComponentTemplateManifest | None = None, workers: int = 0
+):
     """Get all types dictionary with full component loading."""
-    return await abuild_custom_components(components_paths=components_paths)
+    return await abuild_custom_components(components_paths=components_paths, manifest=manifest, workers=workers)
 
 
-async def aget_component_metadata(components_paths: list[str]):
-    """Get just the metadata for all components without loading full templates."""
-    # This builds a skeleton of the all_types_dict with just basic component info
-
-    components_dict: dict = {"components": {}}
-
-    # Get all component types
-    component_types = await discover_component_types(components_paths)
-    logger.debug(f"Discovered {len(component_types)} component types: {', '.join(component_types)}")
-
-    # For each component type directory
-    for component_type in component_types:
-        components_dict["components"][component_type] = {}
-
-        # Get list of components in this type
-        component_names = await discover_component_names(component_type, components_paths)
-        logger.debug(f"Found {len(component_names)} components for type {component_type}")
-
-        # Create stub entries with just basic metadata
-        for name in component_names:
-            # Get minimal metadata for component
-            metadata = await get_component_minimal_metadata(component_type, name, components_paths)
-
-            if metadata:
-                components_dict["components"][component_type][name] = metadata
-                # Mark as needing full loading
-                components_dict["components"][component_type][name]["lazy_loaded"] = True
-
-    return components_dict
-
-
-async def discover_component_types(components_paths: list[str]) -> list[str]:
-    """Discover available component types by scanning directories."""
-    component_types: set[str] = set()
-
-    for path in components_paths:
-        path_obj = Path(path)
-        if not path_obj.exists():
-            continue
-
-        for item in path_obj.iterdir():
-            # Only include directories that don't start with _ or .
-            if item.is_dir() and not item.name.startswith(("_", ".")):
-                component_types.add(item.name)
-
-    # Add known types that might not be in directories
-    standard_types = {
-        "agents",
-        "chains",
-        "embeddings",
-        "llms",
-        "memories",
-        "prompts",
-        "tools",
-        "retrievers",
-        "textsplitters",
-        "toolkits",
-        "utilities",
-        "vectorstores",
-        "custom_components",
-        "documentloaders",
-        "outputparsers",
-        "wrappers",
-    }
-
-    component_types.update(standard_types)
-
-    return sorted(component_types)
-
-
-async def discover_component_names(component_type: str, components_paths: list[str]) -> list[str]:
-    """Discover component names for a specific type by scanning directories."""
-    component_names: set[str] = set()
-
-    for path in components_paths:
-        type_dir = Path(path) / component_type
-
-        if type_dir.exists():
-            for filename in type_dir.iterdir():
-                # Get Python files that don't start with __
-                if filename.name.endswith(".py") and not filename.name.startswith("__"):
-                    component_name = filename.name[:-3]  # Remove .py extension
-                    component_names.add(component_name)
-
-    return sorted(component_names)
-
-
-async def get_component_minimal_metadata(component_type: str, component_name: str, components_paths: list[str]):
-    """Extract minimal metadata for a component without loading its full implementation."""
-    # Create a more complete metadata structure that the UI needs
-    metadata = {
-        "display_name": component_name.replace("_", " ").title(),
-        "name": component_name,
-        "type": component_type,
-        "description": f"A {component_type} component (not fully loaded)",
-        "template": {
-            "_type": component_type,
-            "inputs": {},
-            "outputs": {},
-            "output_types": [],
-            "documentation": f"A {component_type} component",
-            "display_name": component_name.replace("_", " ").title(),
-            "base_classes": [component_type],
-        },
-    }
-
-    # Try to find the file to verify it exists
-    component_path = None
-    for path in components_paths:
-        candidate_path = Path(path) / component_type / f"{component_name}.py"
-        if candidate_path.exists():
-            component_path = candidate_path
-            break
-
-    if not component_path:
+async def aget_component_manifest(settings_service: SettingsService) -> ComponentTemplateManifest | None:
+    """Load the on-disk template manifest, unless disabled or running in dev mode where base classes change."""
+    settings = settings_service.settings
+    if not settings.cache_component_templates or settings.dev or not settings.config_dir:
         return None
+    manifest = ComponentTemplateManifest(Path(settings.config_dir) / MANIFEST_FILENAME)
+    return await asyncio.to_thread(manifest.load)
+
 
-    return metadata
+async def aget_component_metadata(components_paths: list[str]):
+    """Build the types dictionary from a static index of the component files, without executing them.
+
+    Each entry is a stub marked with `lazy_loaded` that `ensure_component_loaded` replaces with the full
+    template the first time the component is opened or executed.
+    """
+    return await asyncio.to_thread(_build_static_types_dict, components_paths)
+
+
+def _build_static_types_dict(components_paths: list[str]) -> dict[str, dict[str, Any]]:
+    types_dict: dict[str, dict[str, Any]] = {}
+    for path in dict.fromkeys(str(path) for path in components_paths):
+        for file_path in DirectoryReader(path).get_files():
+            try:
+                code = Path(file_path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                logger.debug(f"Could not read component file {file_path}")
+                continue
+            if (index := extract_component_index(code)) is None:
+                continue
+            category = Path(file_path).parent.name
+            name = component_key(index)
+            types_dict.setdefault(category, {})[name] = build_stub_template(index, code)
+            component_cache.component_files[name] = (category, file_path)
+    return types_dict
 
 
 async def ensure_component_loaded(component_type: str, component_name: str, settings_service: SettingsService):
-    """Ensure a component is fully loaded if it was only partially loaded."""
-    # If already fully loaded, return immediately
-    component_key = f"{component_type}:{component_name}"
-    if component_key in component_cache.fully_loaded_components:
-        return
+    """Ensure a component is fully loaded if it was only partially loaded.
 
-    # If we don't have a cache or the component doesn't exist in the cache, nothing to do
-    if (
-        not component_cache.all_types_dict
-        or "components" not in component_cache.all_types_dict
-        or component_type not in component_cache.all_types_dict["components"]
-        or component_name not in component_cache.all_types_dict["components"][component_type]
-    ):
+    `component_type` may be the component's category or, as for vertices, its type; the category is looked up
+    in the static index.
+    """
+    if component_name in component_cache.fully_loaded_components:
+        return
+    if not settings_service.settings.lazy_load_components or component_cache.all_types_dict is None:
+        return
+    if component_name not in component_cache.component_files:
+        # Not one of the indexed component files (e.g. a custom component defined only in a flow)
+        component_cache.fully_loaded_components[component_name] = True
         return
 
-    # Check if component is marked for lazy loading
-    if component_cache.all_types_dict["components"][component_type][component_name].get("lazy_loaded", False):
-        logger.debug(f"Fully loading component {component_type}:{component_name}")
-
-        # Load just this specific component
-        full_component = await load_single_component(
-            component_type, component_name, settings_service.settings.components_path
-        )
-
-        if full_component:
-            # Replace the stub with the fully loaded component
-            component_cache.all_types_dict["components"][component_type][component_name] = full_component
-            # Remove lazy_loaded flag if it exists
-            if "lazy_loaded" in component_cache.all_types_dict["components"][component_type][component_name]:
-                del component_cache.all_types_dict["components"][component_type][component_name]["lazy_loaded"]
-
-            # Mark as fully loaded
-            component_cache.fully_loaded_components[component_key] = True
-            logger.debug(f"Component {component_type}:{component_name} fully loaded")
-        else:
-            logger.warning(f"Failed to fully load component {component_type}:{component_name}")
-
-
-async def load_single_component(component_type: str, component_name: str, components_paths: list[str]):
-    """Load a single component fully."""
-    from langflow.custom.utils import get_single_component_dict
-
+    lock = component_cache.load_locks.setdefault(component_name, asyncio.Lock())
+    async with lock:
+        if component_name in component_cache.fully_loaded_components:
+            return
+        category, file_path = component_cache.component_files[component_name]
+        logger.debug(f"Fully loading component {category}:{component_name} ({component_type})")
+        full_component = await load_single_component(file_path, component_name)
+        if full_component is None:
+            logger.warning(f"Failed to fully load component {category}:{component_name}")
+            return
+        component_cache.all_types_dict.setdefault(category, {})[component_name] = full_component
+        component_cache.fully_loaded_components[component_name] = True
+        component_cache.version += 1
+
+
+async def ensure_components_loaded(component_names: Iterable[str], settings_service: SettingsService) -> None:
+    """Materialize the templates of several components, e.g. those used by the starter projects."""
+    for component_name in component_names:
+        await ensure_component_loaded(component_name, component_name, settings_service)
+
+
+async def load_single_component(file_path: str, component_name: str) -> dict[str, Any] | None:
+    """Build the full template of the component defined in `file_path`."""
+    path = Path(file_path)
+    reader = DirectoryReader(str(path.parent.parent), compress_code_field=False)
     try:
-        # Delegate to a more specific function that knows how to load
-        # a single component of a specific type
-        return await get_single_component_dict(component_type, component_name, components_paths)
-    except (ImportError, ModuleNotFoundError) as e:
-        # Handle issues with importing the component or its dependencies
-        logger.error(f"Import error loading component {component_type}:{component_name}: {e!s}")
-        return None
-    except (AttributeError, TypeError) as e:
-        # Handle issues with component structure or type errors
-        logger.error(f"Component structure error for {component_type}:{component_name}: {e!s}")
-        return None
-    except FileNotFoundError as e:
-        # Handle missing files
-        logger.error(f"File not found for component {component_type}:{component_name}: {e!s}")
-        return None
-    except ValueError as e:
-        # Handle invalid values or configurations
-        logger.error(f"Invalid configuration for component {component_type}:{component_name}: {e!s}")
-        return None
-    except (KeyError, IndexError) as e:
-        # Handle data structure access errors
-        logger.error(f"Data structure error for component {component_type}:{component_name}: {e!s}")
-        return None
-    except RuntimeError as e:
-        # Handle runtime errors
-        logger.error(f"Runtime error loading component {component_type}:{component_name}: {e!s}")
-        logger.debug("Full traceback for runtime error", exc_info=True)
-        return None
-    except OSError as e:
-        # Handle OS-related errors (file system, permissions, etc.)
-        logger.error(f"OS error loading component {component_type}:{component_name}: {e!s}")
+        valid_components, _ = await abuild_and_validate_all_files(reader, [file_path])
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).error(f"Error loading component {component_name} from {file_path}")
         return None
+    for menu in valid_components["menu"]:
+        for name, template, _ in menu["components"]:
+            if name == component_name:
+                return template
+    return None
 
 
 # Also add a utility function to load specific component types
 async def get_type_dict(component_type: str, settings_service: SettingsService | None = None):
-    """Get a specific component type dictionary, loading if needed."""
+    """Get a specific component type dictionary.
+
+    In lazy mode the entries of components that were not opened or executed yet are static stubs.
+    """
     if settings_service is None:
         # Import here to avoid circular imports
         from langflow.services.deps import get_settings_service
 
         settings_service = get_settings_service()
 
-    # Make sure all_types_dict is loaded (at least partially)
-    if component_cache.all_types_dict is None:
-        await get_and_cache_all_types_dict(settings_service)
-
-    # Check if component type exists in the cache
-    if (
-        component_cache.all_types_dict
-        and "components" in component_cache.all_types_dict
-        and component_type in component_cache.all_types_dict["components"]
-    ):
-        # If in lazy mode, ensure all components of this type are fully loaded
-        if settings_service.settings.lazy_load_components:
-            for component_name in list(component_cache.all_types_dict["components"][component_type].keys()):
-                await ensure_component_loaded(component_type, component_name, settings_service)
+    all_types_dict = await get_and_cache_all_types_dict(settings_service)
+    return all_types_dict.get(component_type, {})
 
-        return component_cache.all_types_dict["components"][component_type]
 
-    return {}
+async def get_component_template(component_name: str, settings_service: SettingsService) -> dict[str, Any] | None:
+    """Return the full template of a component, materializing it first in lazy mode."""
+    all_types_dict = await get_and_cache_all_types_dict(settings_service)
+    await ensure_component_loaded(component_name, component_name, settings_service)
+    for category in all_types_dict.values():
+        if component_name in category:
+            return category[component_name]
+    return None
 
 
 # TypeError: unhashable type: 'list'
@@ -24,6 +24,7 @@ async def aload_flow_from_json(
     env_file: str | None = None,
     cache: str | None = None,
     disable_logs: bool | None = True,
+    embedded: bool = False,
 ) -> Graph:
     """Load a flow graph from a JSON file or a JSON object.
 
@@ -37,6 +38,8 @@ async def aload_flow_from_json(
         cache (Optional[str]): Optional cache path to update the flow settings.
         disable_logs (Optional[bool], default=True): Optional flag to disable logs during flow processing.
             If log_level or log_file are set, disable_logs is not used.
+        embedded (bool, default=False): Run with in-memory stand-ins for the database, variable and tracing
+            services, without a database file. Global variables are read from the environment.
 
     Returns:
         Graph: The loaded flow graph as a Graph object.
@@ -58,6 +61,12 @@ async def aload_flow_from_json(
 
     # Update settings with cache and components path
     await update_settings(cache=cache)
+    user_id = None
+    if embedded:
+        from langflow.services.flow.embedded import EMBEDDED_USER_ID, setup_embedded_services
+
+        await setup_embedded_services()
+        user_id = str(EMBEDDED_USER_ID)
 
     if isinstance(flow, str | Path):
         async with async_open(Path(flow), encoding="utf-8") as f:
@@ -74,7 +83,7 @@ async def aload_flow_from_json(
     if tweaks is not None:
         graph_data = process_tweaks(graph_data, tweaks)
 
-    return Graph.from_payload(graph_data)
+    return Graph.from_payload(graph_data, user_id=user_id)
 
 
 def load_flow_from_json(
@@ -86,6 +95,7 @@ def load_flow_from_json(
     env_file: str | None = None,
     cache: str | None = None,
     disable_logs: bool | None = True,
+    embedded: bool = False,
 ) -> Graph:
     """Load a flow graph from a JSON file or a JSON object.
 
@@ -99,6 +109,8 @@ def load_flow_from_json(
         cache (Optional[str]): Optional cache path to update the flow settings.
         disable_logs (Optional[bool], default=True): Optional flag to disable logs during flow processing.
             If log_level or log_file are set, disable_logs is not used.
+        embedded (bool, default=False): Run with in-memory stand-ins for the database, variable and tracing
+            services, without a database file. Global variables are read from the environment.
 
     Returns:
         Graph: The loaded flow graph as a Graph object.
@@ -116,6 +128,7 @@ def load_flow_from_json(
             env_file=env_file,
             cache=cache,
             disable_logs=disable_logs,
+            embedded=embedded,
         )
     )
 
@@ -135,6 +148,7 @@ async def arun_flow_from_json(
     cache: str | None = None,
     disable_logs: bool | None = True,
     fallback_to_env_vars: bool = False,
+    embedded: bool = False,
 ) -> list[RunOutputs]:
     """Run a flow from a JSON file or dictionary.
 
@@ -153,6 +167,8 @@ async def arun_flow_from_json(
         disable_logs (Optional[bool], optional): Whether to disable logs. Defaults to True.
         fallback_to_env_vars (bool, optional): Whether Global Variables should fallback to environment variables if
             not found. Defaults to False.
+        embedded (bool, optional): Whether to run with in-memory stand-ins for the database, variable and tracing
+            services, without a database file. Global variables are read from the environment. Defaults to False.
 
     Returns:
         List[RunOutputs]: A list of RunOutputs objects representing the results of running the flow.
@@ -168,6 +184,7 @@ async def arun_flow_from_json(
         env_file=env_file,
         cache=cache,
         disable_logs=disable_logs,
+        embedded=embedded,
     )
     result = await run_graph(
         graph=graph,
@@ -197,6 +214,7 @@ def run_flow_from_json(
     cache: str | None = None,
     disable_logs: bool | None = True,
     fallback_to_env_vars: bool = False,
+    embedded: bool = False,
 ) -> list[RunOutputs]:
     """Run a flow from a JSON file or dictionary.
 
@@ -219,6 +237,8 @@ def run_flow_from_json(
         disable_logs (Optional[bool], optional): Whether to disable logs. Defaults to True.
         fallback_to_env_vars (bool, optional): Whether Global Variables should fallback to environment variables if
             not found. Defaults to False.
+        embedded (bool, optional): Whether to run with in-memory stand-ins for the database, variable and tracing
+            services, without a database file. Global variables are read from the environment. Defaults to False.
 
     Returns:
         List[RunOutputs]: A list of RunOutputs objects representing the results of running the flow.
@@ -238,5 +258,6 @@ def run_flow_from_json(
             cache=cache,
             disable_logs=disable_logs,
             fallback_to_env_vars=fallback_to_env_vars,
+            embedded=embedded,
         )
     )
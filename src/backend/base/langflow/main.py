@@ -24,23 +24,32 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 
 from langflow.api import health_check_router, log_router, router
 from langflow.api.v1.mcp_projects import init_mcp_servers
+from langflow.initial_setup.flow_sync import sync_flows_from_fs
+from langflow.initial_setup.preload import is_preloaded
 from langflow.initial_setup.setup import (
     create_or_update_starter_projects,
     initialize_super_user_if_needed,
     load_bundles_from_urls,
     load_flows_from_directory,
-    sync_flows_from_fs,
 )
 from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
 from langflow.middleware import ContentSizeLimitMiddleware
 from langflow.services.deps import (
+    get_loop_monitor_service,
     get_queue_service,
     get_settings_service,
     get_telemetry_service,
 )
 from langflow.services.utils import initialize_services, teardown_services
+from langflow.utils.startup_profile import (
+    STARTUP_PROFILE_FILENAME,
+    process_report_path,
+    start_startup_profiling,
+    startup_phase,
+    stop_startup_profiling,
+)
 
 if TYPE_CHECKING:
     from tempfile import TemporaryDirectory
@@ -110,9 +119,22 @@ async def load_bundles_with_error_handling():
         return [], []
 
 
-def get_lifespan(*, fix_migration=False, version=None):
-    telemetry_service = get_telemetry_service()
+async def write_startup_profile() -> None:
+    """Write the startup profile report, if the startup was profiled, and stop profiling."""
+    if (profiler := stop_startup_profiling()) is None:
+        return
+    settings = get_settings_service().settings
+    path = settings.startup_profile_path or Path(settings.config_dir or ".") / STARTUP_PROFILE_FILENAME
+    path = process_report_path(path, settings.workers)
+    try:
+        path = await asyncio.to_thread(profiler.write_report, path)
+    except OSError:
+        logger.exception(f"Could not write the startup profile to {path}")
+        return
+    logger.info(f"Startup profile written to {path}")
+
 
+def get_lifespan(*, fix_migration=False, version=None):
     @asynccontextmanager
     async def lifespan(_app: FastAPI):
         configure(async_file=True)
@@ -127,58 +149,82 @@ def get_lifespan(*, fix_migration=False, version=None):
         sync_flows_from_fs_task = None
         try:
             start_time = asyncio.get_event_loop().time()
+            if get_settings_service().settings.profile_startup:
+                start_startup_profiling()
+
+            # Workers forked from a preloaded master skip the steps the master already performed
+            preloaded = is_preloaded()
+            if preloaded:
+                logger.debug("Using the startup state preloaded by the master process")
 
             logger.debug("Initializing services")
-            await initialize_services(fix_migration=fix_migration)
+            with startup_phase("initialize_services"):
+                await initialize_services(fix_migration=fix_migration, setup_database=not preloaded)
             logger.debug(f"Services initialized in {asyncio.get_event_loop().time() - start_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Setting up LLM caching")
-            setup_llm_caching()
+            with startup_phase("setup_llm_caching"):
+                setup_llm_caching()
             logger.debug(f"LLM caching setup in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            logger.debug("Initializing super user")
-            await initialize_super_user_if_needed()
-            logger.debug(f"Super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s")
+            if not preloaded:
+                current_time = asyncio.get_event_loop().time()
+                logger.debug("Initializing super user")
+                with startup_phase("initialize_super_user"):
+                    await initialize_super_user_if_needed()
+                logger.debug(f"Super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            logger.debug("Loading bundles")
-            temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
-            get_settings_service().settings.components_path.extend(bundles_components_paths)
-            logger.debug(f"Bundles loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
+                current_time = asyncio.get_event_loop().time()
+                logger.debug("Loading bundles")
+                with startup_phase("load_bundles"):
+                    temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
+                get_settings_service().settings.components_path.extend(bundles_components_paths)
+                logger.debug(f"Bundles loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Caching types")
-            all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+            with startup_phase("cache_types"):
+                all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
             logger.debug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
-            current_time = asyncio.get_event_loop().time()
-            logger.debug("Creating/updating starter projects")
-            await create_or_update_starter_projects(all_types_dict)
-            logger.debug(f"Starter projects updated in {asyncio.get_event_loop().time() - current_time:.2f}s")
+            if not preloaded:
+                current_time = asyncio.get_event_loop().time()
+                logger.debug("Creating/updating starter projects")
+                with startup_phase("starter_projects"):
+                    await create_or_update_starter_projects(all_types_dict)
+                logger.debug(f"Starter projects updated in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Starting telemetry service")
-            telemetry_service.start()
+            with startup_phase("start_telemetry"):
+                # Looked up here rather than when the app is created: a preloading master tears down its instance
+                get_telemetry_service().start()
             logger.debug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
+            # Sample the lag of the event loop and record the callbacks that block it, reported by /monitor/loop
+            get_loop_monitor_service().start()
+
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading flows")
-            await load_flows_from_directory()
-            sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
-            queue_service = get_queue_service()
-            if not queue_service.is_started():  # Start if not already started
-                queue_service.start()
+            with startup_phase("load_flows"):
+                if not preloaded:
+                    await load_flows_from_directory()
+                sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
+                queue_service = get_queue_service()
+                if not queue_service.is_started():  # Start if not already started
+                    queue_service.start()
             logger.debug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading mcp servers for projects")
-            await init_mcp_servers()
+            with startup_phase("init_mcp_servers"):
+                await init_mcp_servers()
             logger.debug(f"mcp servers loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             total_time = asyncio.get_event_loop().time() - start_time
             logger.debug(f"Total initialization time: {total_time:.2f}s")
+            await write_startup_profile()
             yield
 
         except Exception as exc:
@@ -1,12 +1,14 @@
 import asyncio
+import base64
 import json
 from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import and_, delete, or_
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -16,6 +18,56 @@ from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
 
 
+def encode_message_cursor(message: MessageTable) -> str:
+    """Return an opaque cursor pointing at `message`, to fetch the messages that follow it."""
+    return base64.urlsafe_b64encode(f"{message.timestamp.isoformat()}|{message.id}".encode()).decode()
+
+
+def decode_message_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        timestamp, message_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", maxsplit=1)
+        return datetime.fromisoformat(timestamp), UUID(message_id)
+    except ValueError as exc:
+        msg = f"Invalid message cursor: {cursor}"
+        raise ValueError(msg) from exc
+
+
+def order_messages(
+    stmt, order_by: str | None, order: str | None, *, cursor: str | None = None, paginated: bool = False
+):
+    """Order by `order_by`; when `paginated`, resume after `cursor` (keyset pagination on timestamp and id).
+
+    Many messages share a timestamp, so paginated reads are ordered by timestamp then id, and the cursor holds both:
+    a page boundary can fall between messages of the same timestamp, and the id tiebreak resumes the next page right
+    after the last message read, without skipping or repeating any. Combined with the (session_id, timestamp) and
+    (flow_id, timestamp) indexes, reading a page of a session or flow is an index range scan.
+    """
+    descending = order == "DESC"
+    paginated = paginated or cursor is not None
+    if paginated and order_by != "timestamp":
+        msg = "Cursor pagination is only supported when ordering by timestamp"
+        raise ValueError(msg)
+    if cursor:
+        timestamp, message_id = decode_message_cursor(cursor)
+        if descending:
+            after_cursor = or_(
+                col(MessageTable.timestamp) < timestamp,
+                and_(col(MessageTable.timestamp) == timestamp, col(MessageTable.id) < message_id),
+            )
+        else:
+            after_cursor = or_(
+                col(MessageTable.timestamp) > timestamp,
+                and_(col(MessageTable.timestamp) == timestamp, col(MessageTable.id) > message_id),
+            )
+        stmt = stmt.where(after_cursor)
+    if order_by:
+        columns = [getattr(MessageTable, order_by)]
+        if paginated:
+            columns.append(MessageTable.id)
+        stmt = stmt.order_by(*(column.desc() if descending else column.asc() for column in columns))
+    return stmt
+
+
 def _get_variable_query(
     sender: str | None = None,
     sender_name: str | None = None,
@@ -24,6 +76,9 @@ def _get_variable_query(
     order: str | None = "DESC",
     flow_id: UUID | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
+    *,
+    paginated: bool = False,
 ):
     stmt = select(MessageTable).where(MessageTable.error == False)  # noqa: E712
     if sender:
@@ -34,9 +89,7 @@ def _get_variable_query(
         stmt = stmt.where(MessageTable.session_id == session_id)
     if flow_id:
         stmt = stmt.where(MessageTable.flow_id == flow_id)
-    if order_by:
-        col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
-        stmt = stmt.order_by(col)
+    stmt = order_messages(stmt, order_by, order, cursor=cursor, paginated=paginated)
     if limit:
         stmt = stmt.limit(limit)
     return stmt
@@ -99,6 +152,32 @@ async def aget_messages(
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+async def aget_messages_page(
+    sender: str | None = None,
+    sender_name: str | None = None,
+    session_id: str | UUID | None = None,
+    order_by: str | None = "timestamp",
+    order: str | None = "DESC",
+    flow_id: UUID | None = None,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> tuple[list[Message], str | None]:
+    """Retrieves a page of messages, like `aget_messages`, and the cursor of the next page.
+
+    Pages are ordered by timestamp then id, so the first page must come from this function too. The next cursor
+    is None once a page is not full, i.e. there are no more messages. Pass it back as `cursor`, with the same
+    filters and order, to retrieve the next page.
+    """
+    async with session_scope() as session:
+        stmt = _get_variable_query(
+            sender, sender_name, session_id, order_by, order, flow_id, limit, cursor, paginated=True
+        )
+        rows = list(await session.exec(stmt))
+    next_cursor = encode_message_cursor(rows[-1]) if limit and len(rows) == limit else None
+    return [await Message.create(**row.model_dump()) for row in rows], next_cursor
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
@@ -1,6 +1,23 @@
-from .data import Data
-from .dataframe import DataFrame
-from .dotdict import dotdict
-from .message import Message
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .data import Data
+    from .dataframe import DataFrame
+    from .dotdict import dotdict
+    from .message import Message
+
+# `DataFrame` imports pandas, so it is only imported when used
+_dynamic_imports = {
+    "Data": "data",
+    "DataFrame": "dataframe",
+    "dotdict": "dotdict",
+    "Message": "message",
+}
 
 __all__ = ["Data", "DataFrame", "Message", "dotdict"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
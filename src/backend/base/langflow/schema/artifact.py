@@ -6,10 +6,10 @@ from loguru import logger
 from pydantic import BaseModel
 
 from langflow.schema.data import Data
-from langflow.schema.dataframe import DataFrame
 from langflow.schema.encoders import CUSTOM_ENCODERS
 from langflow.schema.message import Message
 from langflow.serialization.serialization import serialize
+from langflow.utils.lazy_imports import is_instance_of
 
 
 class ArtifactType(str, Enum):
@@ -41,7 +41,10 @@ def get_artifact_type(value, build_result=None) -> str:
         case dict():
             result = ArtifactType.OBJECT
 
-        case list() | DataFrame():
+        case list():
+            result = ArtifactType.ARRAY
+
+        case _ if is_instance_of(value, "langflow.schema.dataframe", "DataFrame"):
             result = ArtifactType.ARRAY
     if result == ArtifactType.UNKNOWN and (
         (build_result and isinstance(build_result, Generator))
@@ -68,7 +71,10 @@ def post_process_raw(raw, artifact_type: str):
     if artifact_type == ArtifactType.STREAM.value:
         raw = ""
     elif artifact_type == ArtifactType.ARRAY.value:
-        raw = raw.to_dict(orient="records") if isinstance(raw, DataFrame) else _to_list_of_dicts(raw)
+        if is_instance_of(raw, "langflow.schema.dataframe", "DataFrame"):
+            raw = raw.to_dict(orient="records")
+        else:
+            raw = _to_list_of_dicts(raw)
     elif artifact_type == ArtifactType.UNKNOWN.value and raw is not None:
         if isinstance(raw, BaseModel | dict):
             try:
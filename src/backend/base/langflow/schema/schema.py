@@ -6,9 +6,9 @@ from pydantic import BaseModel
 from typing_extensions import TypedDict
 
 from langflow.schema.data import Data
-from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
 from langflow.serialization.serialization import serialize
+from langflow.utils.lazy_imports import is_instance_of
 
 INPUT_FIELD_NAME = "input_value"
 
@@ -52,7 +52,10 @@ def get_type(payload):
         case dict():
             result = LogType.OBJECT
 
-        case list() | DataFrame():
+        case list():
+            result = LogType.ARRAY
+
+        case _ if is_instance_of(payload, "langflow.schema.dataframe", "DataFrame"):
             result = LogType.ARRAY
 
         case str():
@@ -108,7 +111,7 @@ def build_output_logs(vertex, result) -> dict:
                 message = ""
 
             case LogType.ARRAY:
-                if isinstance(message, DataFrame):
+                if is_instance_of(message, "langflow.schema.dataframe", "DataFrame"):
                     message = message.to_dict(orient="records")
                 message = [serialize(item) for item in message]
         name = output.get("name", f"output_{index}")
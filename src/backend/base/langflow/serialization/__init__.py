@@ -1,3 +1,14 @@
-from .serialization import serialize
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .serialization import serialize
+
+_dynamic_imports = {"serialize": "serialization"}
 
 __all__ = ["serialize"]
+
+__getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
@@ -1,17 +1,21 @@
+from __future__ import annotations
+
 from collections.abc import AsyncIterator, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
-import numpy as np
-import pandas as pd
 from langchain_core.documents import Document
 from loguru import logger
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
 
 from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from langflow.utils.lazy_imports import is_instance_of
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # Sentinel variable to signal a failed serialization.
@@ -116,6 +120,16 @@ def _truncate_value(value: Any, max_length: int | None, max_items: int | None) -
     return value
 
 
+def _serialize_spilled_result(obj: Any, max_length: int | None, max_items: int | None) -> Any:
+    """Serialize a vertex output spilled to disk, reading it back only when more than its preview is asked for."""
+    if max_items is None or max_items > MAX_ITEMS_LENGTH:
+        return serialize(obj.load(), max_length, max_items)
+    serialized = serialize(obj.preview, max_length, max_items)
+    if isinstance(serialized, list) and isinstance(obj.preview, list) and obj.rows > max_items:
+        serialized = [*serialized[:max_items], f"... [truncated {obj.rows - max_items} items]"]
+    return serialized
+
+
 def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: int | None) -> list[dict]:
     """Serialize pandas DataFrame to a dictionary format."""
     if max_items is not None and len(obj) > max_items:
@@ -135,11 +149,13 @@ def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | N
 
 def _is_numpy_type(obj: Any) -> bool:
     """Check if an object is a numpy type by checking its type's module name."""
-    return hasattr(type(obj), "__module__") and type(obj).__module__ == np.__name__
+    return hasattr(type(obj), "__module__") and type(obj).__module__ == "numpy"
 
 
 def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | None) -> Any:
     """Serialize numpy types."""
+    import numpy as np
+
     try:
         # For single-element arrays
         if obj.size == 1 and hasattr(obj, "item"):
@@ -194,9 +210,11 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return _serialize_pydantic_v1(obj, max_length, max_items)
         case dict():
             return _serialize_dict(obj, max_length, max_items)
-        case pd.DataFrame():
+        case object() if is_instance_of(obj, "pandas", "DataFrame"):
             return _serialize_dataframe(obj, max_length, max_items)
-        case pd.Series():
+        case object() if is_instance_of(obj, "langflow.graph.vertex.spill", "SpilledResult"):
+            return _serialize_spilled_result(obj, max_length, max_items)
+        case object() if is_instance_of(obj, "pandas", "Series"):
             return _serialize_series(obj, max_length, max_items)
         case list() | tuple():
             return _serialize_list_tuple(obj, max_length, max_items)
@@ -213,6 +231,8 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
         case _:
             # Handle numpy numeric types (int, float, bool, complex)
             if hasattr(obj, "dtype"):
+                import numpy as np
+
                 if np.issubdtype(obj.dtype, np.number) and hasattr(obj, "item"):
                     return obj.item()
                 if np.issubdtype(obj.dtype, np.bool_):
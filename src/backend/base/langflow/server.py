@@ -56,6 +56,10 @@ class LangflowApplication(BaseApplication):
 
         self.options["worker_class"] = "langflow.server.LangflowUvicornWorker"
         self.options["logger_class"] = Logger
+        if self.options.pop("preload_app", False):
+            from langflow.initial_setup.preload import preload_in_master
+
+            self.options["on_starting"] = preload_in_master
         self.application = app
         super().__init__()
 
@@ -7,10 +7,11 @@ from diskcache import Cache
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.metrics import CacheInstrumentation
 from langflow.services.cache.utils import CACHE_MISS
 
 
-class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+class AsyncDiskCache(CacheInstrumentation, AsyncBaseCacheService, Generic[AsyncLockType]):
     def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
         self.cache = Cache(cache_dir)
         # Let's clear the cache for now to maintain a similar
@@ -24,11 +25,14 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.expiration_time = expiration_time
 
     async def get(self, key, lock: asyncio.Lock | None = None):
+        started_at = time.perf_counter()
         if not lock:
             async with self.lock:
-                return await asyncio.to_thread(self._get, key)
+                value = await asyncio.to_thread(self._get, key)
         else:
-            return await asyncio.to_thread(self._get, key)
+            value = await asyncio.to_thread(self._get, key)
+        self._record_get(started_at, value)
+        return value
 
     def _get(self, key):
         item = self.cache.get(key, default=None)
@@ -38,6 +42,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             self.cache.delete(key)  # Log before deleting the expired item
+            self._record_delete(item["value"], eviction=True)
         return CACHE_MISS
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
@@ -48,10 +53,14 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._set(key, value)
 
     async def _set(self, key, value) -> None:
+        started_at = time.perf_counter()
         if self.max_size and len(self.cache) >= self.max_size:
-            await asyncio.to_thread(self.cache.cull)
+            culled = await asyncio.to_thread(self.cache.cull)
+            for _ in range(culled or 0):
+                self._record_delete(eviction=True)
         item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
+        self._record_set(started_at, item["value"])
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -61,7 +70,8 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._delete(key)
 
     async def _delete(self, key) -> None:
-        await asyncio.to_thread(self.cache.delete, key)
+        if await asyncio.to_thread(self.cache.delete, key):
+            self._record_delete()
 
     async def clear(self, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -72,6 +82,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def _clear(self) -> None:
         await asyncio.to_thread(self.cache.clear)
+        self._record_clear()
 
     async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -0,0 +1,299 @@
+"""Instrumentation shared by every cache implementation.
+
+Caches record hits, misses, evictions, get/set latencies and approximate stored bytes
+per key namespace. The statistics are kept in-process (see `get_cache_metrics`) and are
+forwarded to the OpenTelemetry meter once the telemetry service attaches an exporter.
+"""
+
+from __future__ import annotations
+
+import bisect
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any, Protocol
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Mapping
+
+
+class CacheNamespace(str, Enum):
+    """Logical groups of cache keys that are reported separately."""
+
+    GRAPHS = "graphs"
+    FROZEN_VERTICES = "frozen_vertices"
+    SHARED_COMPONENT = "component_shared_cache"
+    SESSIONS = "sessions"
+    LLM_RESPONSES = "llm_responses"
+    LLM_SEMANTIC_RESPONSES = "llm_semantic_responses"
+    DEFAULT = "default"
+
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS: tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Bounds of the walk `estimate_size` does through a live object
+SIZE_ESTIMATE_MAX_DEPTH = 6
+SIZE_ESTIMATE_MAX_OBJECTS = 10_000
+# Objects shared by the whole process, which no cached value owns
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+cache_namespace_var: ContextVar[str | None] = ContextVar("cache_namespace", default=None)
+
+
+@contextmanager
+def cache_namespace(namespace: CacheNamespace | str) -> Generator[None, None, None]:
+    """Attribute every cache operation performed inside the block to `namespace`."""
+    token = cache_namespace_var.set(str(getattr(namespace, "value", namespace)))
+    try:
+        yield
+    finally:
+        cache_namespace_var.reset(token)
+
+
+def resolve_namespace(default: str | None = None) -> str:
+    """Return the namespace set by the caller, falling back to the cache's own default."""
+    return cache_namespace_var.get() or default or CacheNamespace.DEFAULT.value
+
+
+def estimate_size(
+    value: Any, *, max_depth: int = SIZE_ESTIMATE_MAX_DEPTH, max_objects: int = SIZE_ESTIMATE_MAX_OBJECTS
+) -> int:
+    """Return an estimate of the number of bytes a cached value occupies.
+
+    Serialized values (bytes/str) are measured exactly. Live objects (graphs, vertices, sessions) are estimated by
+    summing `sys.getsizeof` over the objects they reference, at most `max_depth` levels deep and `max_objects`
+    objects in all, each counted once: a lower bound, cheap enough to take on every set, that follows the growth of
+    the cached values without pickling them.
+    """
+    if isinstance(value, bytes | bytearray | memoryview):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="ignore"))
+
+    size = 0
+    seen: set[int] = set()
+    pending: list[tuple[Any, int]] = [(value, 0)]
+    while pending and len(seen) < max_objects:
+        obj, depth = pending.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        if depth >= max_depth:
+            continue
+        if isinstance(obj, dict):
+            children: Iterable[Any] = (*obj.keys(), *obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset | deque):
+            children = obj
+        elif hasattr(obj, "__dict__"):
+            children = (vars(obj),)
+        else:
+            continue
+        pending.extend((child, depth + 1) for child in children)
+    return size
+
+
+class CacheMetricsExporter(Protocol):
+    def increment_counter(self, metric_name: str, labels: Mapping[str, str], value: float = 1.0) -> None: ...
+
+    def observe_histogram(self, metric_name: str, value: float, labels: Mapping[str, str]) -> None: ...
+
+    def update_gauge(self, metric_name: str, value: float, labels: Mapping[str, str]) -> None: ...
+
+
+class LatencyHistogram:
+    """A fixed-bucket latency histogram."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def to_dict(self) -> dict[str, Any]:
+        bucket_labels = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "buckets": dict(zip(bucket_labels, self.counts, strict=True)),
+        }
+
+
+class NamespaceStats:
+    """Counters for a single cache namespace."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.evictions = 0
+        self.bytes_stored = 0
+        self.get_latency = LatencyHistogram()
+        self.set_latency = LatencyHistogram()
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "sets": self.sets,
+            "deletes": self.deletes,
+            "evictions": self.evictions,
+            "bytes_stored": self.bytes_stored,
+            "get_latency_seconds": self.get_latency.to_dict(),
+            "set_latency_seconds": self.set_latency.to_dict(),
+        }
+
+
+class CacheMetrics:
+    """Thread-safe registry of per-(cache, namespace) statistics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], NamespaceStats] = defaultdict(NamespaceStats)
+        self._exporter: CacheMetricsExporter | None = None
+
+    def attach_exporter(self, exporter: CacheMetricsExporter | None) -> None:
+        """Forward every recorded measurement to `exporter` (e.g. the OpenTelemetry wrapper)."""
+        self._exporter = exporter
+
+    def _export(self, method: str, metric_name: str, value: float, labels: dict[str, str]) -> None:
+        if self._exporter is None:
+            return
+        try:
+            if method == "counter":
+                self._exporter.increment_counter(metric_name, labels, value)
+            elif method == "histogram":
+                self._exporter.observe_histogram(metric_name, value, labels)
+            else:
+                self._exporter.update_gauge(metric_name, value, labels)
+        except Exception:  # noqa: BLE001
+            # Metrics must never break a cache operation
+            logger.opt(exception=True).debug(f"Could not export the cache metric {metric_name}")
+
+    def record_get(self, cache: str, namespace: str, *, hit: bool, latency: float) -> None:
+        labels = {"cache": cache, "namespace": namespace}
+        with self._lock:
+            stats = self._stats[cache, namespace]
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+            stats.get_latency.observe(latency)
+        self._export("counter", "cache_hits" if hit else "cache_misses", 1, labels)
+        self._export("histogram", "cache_get_latency", latency, labels)
+
+    def record_set(self, cache: str, namespace: str, *, latency: float, size: int, replaced_size: int = 0) -> None:
+        labels = {"cache": cache, "namespace": namespace}
+        with self._lock:
+            stats = self._stats[cache, namespace]
+            stats.sets += 1
+            stats.bytes_stored = max(0, stats.bytes_stored + size - replaced_size)
+            stats.set_latency.observe(latency)
+            bytes_stored = stats.bytes_stored
+        self._export("histogram", "cache_set_latency", latency, labels)
+        self._export("gauge", "cache_bytes_stored", bytes_stored, labels)
+
+    def record_delete(self, cache: str, namespace: str, *, size: int = 0, eviction: bool = False) -> None:
+        labels = {"cache": cache, "namespace": namespace}
+        with self._lock:
+            stats = self._stats[cache, namespace]
+            if eviction:
+                stats.evictions += 1
+            else:
+                stats.deletes += 1
+            stats.bytes_stored = max(0, stats.bytes_stored - size)
+            bytes_stored = stats.bytes_stored
+        if eviction:
+            self._export("counter", "cache_evictions", 1, labels)
+        self._export("gauge", "cache_bytes_stored", bytes_stored, labels)
+
+    def record_clear(self, cache: str) -> None:
+        with self._lock:
+            for (cache_name, _), stats in self._stats.items():
+                if cache_name == cache:
+                    stats.bytes_stored = 0
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return `{cache: {namespace: stats}}` as plain JSON-serializable data."""
+        with self._lock:
+            result: dict[str, dict[str, dict[str, Any]]] = {}
+            for (cache, namespace), stats in self._stats.items():
+                result.setdefault(cache, {})[namespace] = stats.to_dict()
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class CacheInstrumentation:
+    """Mixin that gives cache implementations uniform metric recording helpers.
+
+    Subclasses may set `namespace` to attribute operations to a fixed namespace when the
+    caller does not provide one through `cache_namespace`.
+    """
+
+    namespace: str | None = None
+
+    @property
+    def metrics_name(self) -> str:
+        return getattr(self, "name", None) or type(self).__name__
+
+    def _record_get(self, started_at: float, value: Any) -> None:
+        from langflow.services.cache.utils import CacheMiss
+
+        cache_metrics.record_get(
+            self.metrics_name,
+            resolve_namespace(self.namespace),
+            hit=not isinstance(value, CacheMiss),
+            latency=time.perf_counter() - started_at,
+        )
+
+    def _record_set(self, started_at: float, value: Any, replaced: Any = None) -> None:
+        cache_metrics.record_set(
+            self.metrics_name,
+            resolve_namespace(self.namespace),
+            latency=time.perf_counter() - started_at,
+            size=estimate_size(value),
+            replaced_size=estimate_size(replaced) if replaced is not None else 0,
+        )
+
+    def _record_delete(self, value: Any = None, *, eviction: bool = False) -> None:
+        cache_metrics.record_delete(
+            self.metrics_name,
+            resolve_namespace(self.namespace),
+            size=estimate_size(value) if value is not None else 0,
+            eviction=eviction,
+        )
+
+    def _record_clear(self) -> None:
+        cache_metrics.record_clear(self.metrics_name)
+
+
+cache_metrics = CacheMetrics()
+
+
+def get_cache_metrics() -> CacheMetrics:
+    """Return the process-wide cache metrics registry."""
+    return cache_metrics
@@ -16,10 +16,11 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.metrics import CacheInstrumentation
 from langflow.services.cache.utils import CACHE_MISS
 
 
-class ThreadingInMemoryCache(CacheService, Generic[LockType]):
+class ThreadingInMemoryCache(CacheInstrumentation, CacheService, Generic[LockType]):
     """A simple in-memory cache using an OrderedDict.
 
     This cache supports setting a maximum size and expiration time for cached items.
@@ -65,8 +66,11 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         Returns:
             The value associated with the key, or CACHE_MISS if the key is not found or the item has expired.
         """
+        started_at = time.perf_counter()
         with lock or self._lock:
-            return self._get_without_lock(key)
+            value = self._get_without_lock(key)
+        self._record_get(started_at, value)
+        return value
 
     def _get_without_lock(self, key):
         """Retrieve an item from the cache without acquiring the lock."""
@@ -76,9 +80,15 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
                 self._cache.move_to_end(key)
                 # Check if the value is pickled
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
-            self.delete(key)
+            self._evict(key)
         return CACHE_MISS
 
+    def _evict(self, key) -> None:
+        """Remove an expired or least recently used item without acquiring the lock."""
+        item = self._cache.pop(key, None)
+        if item is not None:
+            self._record_delete(item["value"], eviction=True)
+
     def set(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Add an item to the cache.
 
@@ -89,16 +99,19 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             value: The value to cache.
             lock: A lock to use for the operation.
         """
+        started_at = time.perf_counter()
         with lock or self._lock:
+            replaced = None
             if key in self._cache:
                 # Remove existing key before re-inserting to update order
-                self.delete(key)
+                replaced = self._cache.pop(key)["value"]
             elif self.max_size and len(self._cache) >= self.max_size:
                 # Remove least recently used item
-                self._cache.popitem(last=False)
+                self._evict(next(iter(self._cache)))
             # pickle locally to mimic Redis
 
             self._cache[key] = {"value": value, "time": time.time()}
+        self._record_set(started_at, value, replaced)
 
     def upsert(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Inserts or updates a value in the cache.
@@ -139,12 +152,15 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
 
     def delete(self, key, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         with lock or self._lock:
-            self._cache.pop(key, None)
+            item = self._cache.pop(key, None)
+            if item is not None:
+                self._record_delete(item["value"])
 
     def clear(self, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Clear all items from the cache."""
         with lock or self._lock:
             self._cache.clear()
+            self._record_clear()
 
     def contains(self, key) -> bool:
         """Check if the key is in the cache."""
@@ -175,7 +191,7 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
 
 
-class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
+class RedisCache(CacheInstrumentation, ExternalAsyncBaseCacheService, Generic[LockType]):
     """A Redis-based cache implementation.
 
     This cache supports setting an expiration time for cached items.
@@ -241,17 +257,26 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
     async def get(self, key, lock=None):
         if key is None:
             return CACHE_MISS
+        started_at = time.perf_counter()
+        result = await self._get(key)
+        self._record_get(started_at, result)
+        return result
+
+    async def _get(self, key):
         value = await self._client.get(str(key))
         return dill.loads(value) if value else CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
         try:
+            started_at = time.perf_counter()
             if pickled := dill.dumps(value, recurse=True):
                 result = await self._client.setex(str(key), self.expiration_time, pickled)
                 if not result:
                     msg = "RedisCache could not set the value."
                     raise ValueError(msg)
+                # Keys expire server-side, so only latency is tracked for Redis, not stored bytes
+                self._record_set(started_at, None)
         except pickle.PicklingError as exc:
             msg = "RedisCache only accepts values that can be pickled. "
             raise TypeError(msg) from exc
@@ -269,7 +294,8 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         """
         if key is None:
             return
-        existing_value = await self.get(key)
+        # Not a lookup: read without recording a hit or miss
+        existing_value = await self._get(key)
         if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
             value = existing_value
@@ -278,12 +304,14 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
 
     @override
     async def delete(self, key, lock=None) -> None:
-        await self._client.delete(key)
+        if await self._client.delete(key):
+            self._record_delete()
 
     @override
     async def clear(self, lock=None) -> None:
         """Clear all items from the cache."""
         await self._client.flushdb()
+        self._record_clear()
 
     async def contains(self, key) -> bool:
         """Check if the key is in the cache."""
@@ -296,7 +324,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         return f"RedisCache(expiration_time={self.expiration_time})"
 
 
-class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+class AsyncInMemoryCache(CacheInstrumentation, AsyncBaseCacheService, Generic[AsyncLockType]):
     def __init__(self, max_size=None, expiration_time=3600) -> None:
         self.cache: OrderedDict = OrderedDict()
 
@@ -305,8 +333,11 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.expiration_time = expiration_time
 
     async def get(self, key, lock: asyncio.Lock | None = None):
+        started_at = time.perf_counter()
         async with lock or self.lock:
-            return await self._get(key)
+            value = await self._get(key)
+        self._record_get(started_at, value)
+        return value
 
     async def _get(self, key):
         item = self.cache.get(key, None)
@@ -315,29 +346,35 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
                 self.cache.move_to_end(key)
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
-            await self._delete(key)  # Log before deleting the expired item
+            await self._delete(key, eviction=True)  # Log before deleting the expired item
         return CACHE_MISS
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        started_at = time.perf_counter()
         async with lock or self.lock:
-            await self._set(
+            replaced = await self._set(
                 key,
                 value,
             )
+        self._record_set(started_at, value, replaced)
 
-    async def _set(self, key, value) -> None:
-        if self.max_size and len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
+    async def _set(self, key, value):
+        replaced = self.cache.pop(key, None)
+        if self.max_size and replaced is None and len(self.cache) >= self.max_size:
+            _, evicted = self.cache.popitem(last=False)
+            self._record_delete(evicted["value"], eviction=True)
         self.cache[key] = {"value": value, "time": time.time()}
         self.cache.move_to_end(key)
+        return replaced["value"] if replaced is not None else None
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
             await self._delete(key)
 
-    async def _delete(self, key) -> None:
+    async def _delete(self, key, *, eviction: bool = False) -> None:
         if key in self.cache:
-            del self.cache[key]
+            item = self.cache.pop(key)
+            self._record_delete(item["value"], eviction=eviction)
 
     async def clear(self, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
@@ -345,12 +382,15 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def _clear(self) -> None:
         self.cache.clear()
+        self._record_clear()
 
     async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
         await self._upsert(key, value, lock)
 
     async def _upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
-        existing_value = await self.get(key, lock)
+        # Not a lookup: read without recording a hit or miss
+        async with lock or self.lock:
+            existing_value = await self._get(key)
         if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
             value = existing_value
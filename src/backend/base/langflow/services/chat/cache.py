@@ -2,10 +2,10 @@ from collections.abc import Awaitable, Callable
 from contextlib import contextmanager
 from typing import Any
 
-import pandas as pd
 from PIL import Image
 
 from langflow.services.base import Service
+from langflow.utils.lazy_imports import is_instance_of
 
 
 class Subject:
@@ -107,7 +107,7 @@ class CacheService(Subject, Service):
             name (str): The cache key.
             obj (Any): The pandas DataFrame or Series object.
         """
-        if isinstance(obj, pd.DataFrame | pd.Series):
+        if is_instance_of(obj, "pandas", "DataFrame") or is_instance_of(obj, "pandas", "Series"):
             self.add(name, obj.to_csv(), "pandas", extension="csv")
         else:
             msg = "Object is not a pandas DataFrame or Series"
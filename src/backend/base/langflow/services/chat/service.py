@@ -2,12 +2,23 @@ import asyncio
 from collections import defaultdict
 from threading import RLock
 from typing import Any
+from uuid import UUID
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.metrics import CacheNamespace, cache_namespace
 from langflow.services.deps import get_cache_service
 
 
+def _namespace_for_key(key: str) -> CacheNamespace:
+    """Graphs are cached under their flow or run id, frozen vertices under their vertex id."""
+    try:
+        UUID(str(key))
+    except ValueError:
+        return CacheNamespace.FROZEN_VERTICES
+    return CacheNamespace.GRAPHS
+
+
 class ChatService(Service):
     """Service class for managing chat-related operations."""
 
@@ -33,13 +44,14 @@ class ChatService(Service):
             "result": data,
             "type": type(data),
         }
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
-            return await self.cache_service.contains(key)
-        await asyncio.to_thread(
-            self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
-        )
-        return key in self.cache_service
+        with cache_namespace(_namespace_for_key(key)):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+                return await self.cache_service.contains(key)
+            await asyncio.to_thread(
+                self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
+            )
+            return key in self.cache_service
 
     async def get_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
         """Get the cache for a client.
@@ -51,9 +63,10 @@ class ChatService(Service):
         Returns:
             Any: The cached data.
         """
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+        with cache_namespace(_namespace_for_key(key)):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
@@ -62,6 +75,7 @@ class ChatService(Service):
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+        with cache_namespace(_namespace_for_key(key)):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
+            return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
@@ -1,6 +1,15 @@
+from typing import Any
+
+from sqlalchemy import case, or_
+from sqlalchemy.orm import defer
+from sqlmodel import col, select
+
 from langflow.utils.version import get_version_info
 
-from .model import Flow
+from .model import Flow, FlowHeader
+
+# Listing flows only needs these columns; `data` can be megabytes per flow
+FLOW_HEADER_COLUMNS = tuple(name for name in FlowHeader.model_fields if name != "data")
 
 
 def get_webhook_component_in_flow(flow_data: dict):
@@ -40,3 +49,32 @@ def get_outdated_components(flow: Flow):
         if value != lf_version:
             outdated_components.append(key)
     return outdated_components
+
+
+def without_flow_data(stmt):
+    """Load the flows selected by `stmt` without their `data`.
+
+    Accessing `data` on these flows raises, as an async session cannot lazy load it.
+    """
+    return stmt.options(defer(Flow.data, raiseload=True))
+
+
+def select_flow_headers():
+    """Select the `FlowHeader` columns of flows.
+
+    `data` is only read for components, which headers include it for, and for flows that are not known to be
+    components or not, as it is needed to tell.
+    """
+    needs_data = or_(col(Flow.is_component) == True, col(Flow.is_component).is_(None))  # noqa: E712
+    return select(
+        *(getattr(Flow, name) for name in FLOW_HEADER_COLUMNS),
+        case((needs_data, Flow.data), else_=None).label("data"),
+    )
+
+
+def to_flow_header(row: Any) -> FlowHeader:
+    values = dict(row._mapping)
+    if values["is_component"] is None and values["data"]:
+        is_component = values["data"].get("is_component")
+        values["is_component"] = is_component if is_component is not None else len(values["data"].get("nodes", [])) == 1
+    return FlowHeader.model_validate(values)
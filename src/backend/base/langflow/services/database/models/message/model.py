@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
 from pydantic import ConfigDict, field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -125,6 +125,12 @@ class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     category: str = Field(sa_column=Column(Text))
     content_blocks: list[dict | ContentBlock] = Field(default_factory=list, sa_column=Column(JSON))  # type: ignore[assignment]
 
+    # Chat history is read per session or per flow, in timestamp order
+    __table_args__ = (
+        Index("ix_message_session_id_timestamp", "session_id", "timestamp"),
+        Index("ix_message_flow_id_timestamp", "flow_id", "timestamp"),
+    )
+
     # We need to make sure the datetimes have timezone after running session.refresh
     # because we are losing the timezone information when we save the message to the database
     # and when we read it back. We use field_validator to make sure the datetimes have timezone
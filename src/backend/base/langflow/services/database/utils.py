@@ -9,6 +9,8 @@ from loguru import logger
 from sqlmodel import text
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.utils.startup_profile import startup_phase
+
 if TYPE_CHECKING:
     from langflow.services.database.service import DatabaseService
 
@@ -19,10 +21,11 @@ async def initialize_database(*, fix_migration: bool = False) -> None:
 
     database_service: DatabaseService = get_db_service()
     try:
-        if database_service.settings_service.settings.database_connection_retry:
-            await database_service.create_db_and_tables_with_retry()
-        else:
-            await database_service.create_db_and_tables()
+        with startup_phase("database.create_tables"):
+            if database_service.settings_service.settings.database_connection_retry:
+                await database_service.create_db_and_tables_with_retry()
+            else:
+                await database_service.create_db_and_tables()
     except Exception as exc:
         # if the exception involves tables already existing
         # we can ignore it
@@ -31,13 +34,15 @@ async def initialize_database(*, fix_migration: bool = False) -> None:
             logger.exception(msg)
             raise RuntimeError(msg) from exc
     try:
-        await database_service.check_schema_health()
+        with startup_phase("database.check_schema_health"):
+            await database_service.check_schema_health()
     except Exception as exc:
         msg = "Error checking schema health"
         logger.exception(msg)
         raise RuntimeError(msg) from exc
     try:
-        await database_service.run_migrations(fix=fix_migration)
+        with startup_phase("database.migrations"):
+            await database_service.run_migrations(fix=fix_migration)
     except CommandError as exc:
         # if "overlaps with other requested revisions" or "Can't locate revision identified by"
         # are not in the exception, we can't handle it
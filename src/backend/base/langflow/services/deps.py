@@ -16,6 +16,8 @@ if TYPE_CHECKING:
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.llm_cache.service import LLMCacheService
+    from langflow.services.loop_monitor.service import LoopMonitorService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -201,6 +203,17 @@ def get_shared_component_cache_service() -> CacheService:
     return get_service(ServiceType.SHARED_COMPONENT_CACHE_SERVICE, SharedComponentCacheServiceFactory())
 
 
+def get_llm_cache_service() -> LLMCacheService:
+    """Retrieves the LLM response cache service from the service manager.
+
+    Returns:
+        The LLMCacheService instance.
+    """
+    from langflow.services.llm_cache.factory import LLMCacheServiceFactory
+
+    return get_service(ServiceType.LLM_CACHE_SERVICE, LLMCacheServiceFactory())
+
+
 def get_session_service() -> SessionService:
     """Retrieves the session service from the service manager.
 
@@ -247,3 +260,10 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_loop_monitor_service() -> LoopMonitorService:
+    """Retrieves the LoopMonitorService instance from the service manager."""
+    from langflow.services.loop_monitor.factory import LoopMonitorServiceFactory
+
+    return get_service(ServiceType.LOOP_MONITOR_SERVICE, LoopMonitorServiceFactory())
@@ -0,0 +1,111 @@
+"""Embedded execution of flows, without the services of the server.
+
+Batch jobs and serverless functions that run a flow JSON once do not need the database migrations, the superuser,
+the stored variables or the tracers that `langflow run` sets up. `setup_embedded_services` replaces them with
+in-memory stand-ins: a private in-memory SQLite database created straight from the models, variables read from
+memory or the environment, and no tracing, transaction or vertex build logging. Nothing is written to disk.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from typing_extensions import override
+
+from langflow.services.database.service import DatabaseService
+from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.factory import ServiceFactory
+from langflow.services.manager import service_manager
+from langflow.services.schema import ServiceType
+from langflow.services.variable.memory import InMemoryVariableService
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from langflow.services.settings.service import SettingsService
+
+IN_MEMORY_DATABASE_URL = "sqlite+aiosqlite://"
+# Owner of the flows run embedded; no user is created for it
+EMBEDDED_USER_ID = UUID("00000000-0000-0000-0000-00000000e3bd")
+EMBEDDED_SETTINGS = {
+    "transactions_storage_enabled": False,
+    "vertex_builds_storage_enabled": False,
+    "deactivate_tracing": True,
+}
+
+
+class InMemoryDatabaseService(DatabaseService):
+    """A database service backed by a private in-memory SQLite database.
+
+    The tables are created from the models by `create_db_and_tables`; the migrations are never run.
+    """
+
+    @override
+    def _sanitize_database_url(self) -> None:
+        self.database_url = IN_MEMORY_DATABASE_URL
+
+    @override
+    def _create_engine(self) -> AsyncEngine:
+        # Every session shares one connection, as each new connection would open a new, empty database
+        return create_async_engine(
+            self.database_url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+
+
+class InMemoryDatabaseServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(InMemoryDatabaseService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return InMemoryDatabaseService(settings_service)
+
+
+class InMemoryVariableServiceFactory(ServiceFactory):
+    def __init__(self, variables: dict[str, str] | None = None) -> None:
+        super().__init__(InMemoryVariableService)
+        self.variables = variables
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return InMemoryVariableService(settings_service, variables=self.variables)
+
+
+def is_embedded() -> bool:
+    return isinstance(service_manager.services.get(ServiceType.DATABASE_SERVICE), InMemoryDatabaseService)
+
+
+async def setup_embedded_services(variables: dict[str, str] | None = None) -> None:
+    """Switch this process to the in-memory services. Calling it again only updates the `variables`.
+
+    It is meant to be called before anything uses the services: database or variable services that were already
+    created are replaced, and whatever they held is not carried over.
+
+    Args:
+        variables: Global variables available to the flows, looked up before the environment variables.
+    """
+    if is_embedded():
+        if variables:
+            variable_service = service_manager.get(ServiceType.VARIABLE_SERVICE)
+            if isinstance(variable_service, InMemoryVariableService):
+                variable_service.defaults.update(variables)
+        return
+
+    get_settings_service().settings.update_settings(**EMBEDDED_SETTINGS)
+    if not service_manager.factories:
+        service_manager.register_factories()
+    service_manager.register_factory(InMemoryDatabaseServiceFactory())
+    service_manager.register_factory(InMemoryVariableServiceFactory(variables))
+    for service_type in (ServiceType.DATABASE_SERVICE, ServiceType.VARIABLE_SERVICE, ServiceType.TRACING_SERVICE):
+        if service_type in service_manager.services:
+            logger.warning(f"Replacing the {service_type.value} with its embedded counterpart")
+            service_manager.update(service_type)
+
+    await get_db_service().create_db_and_tables()
+    logger.debug("Embedded services are ready")
@@ -17,6 +17,7 @@ from langflow.services.cache.service import AsyncBaseCacheService
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.utils import initialize_database
 from langflow.services.deps import get_cache_service, session_scope
+from langflow.services.flow.embedded import setup_embedded_services
 
 
 class LangflowRunnerExperimental:
@@ -34,10 +35,17 @@ class LangflowRunnerExperimental:
         runner = LangflowRunnerExperimental()
         result = await runner.run(flow="path/to/flow.json", input_value="Hello", session_id=str(uuid.uuid4()))
 
+    With `embedded=True`, flows run against in-memory stand-ins for the database, variable and tracing services
+    (see `langflow.services.flow.embedded`) instead of initializing and migrating a database, and the flow is not
+    stored in the database nor the cache cleared around the run.
+
     """
 
     should_initialize_db: bool = True
 
+    def __init__(self, *, embedded: bool = False) -> None:
+        self.embedded = embedded
+
     async def run(
         self,
         session_id: str,  # UUID required currently
@@ -54,13 +62,17 @@ class LangflowRunnerExperimental:
         self.set_flow_id(session_id, flow_dict)
         # we must modify the flow schema to set the session_id and for load_from_db=True we load the value from env vars
         self.modification(flow_dict, lambda obj, parent, key: self.modify_flow_schema(session_id, obj, parent, key))
-        await self.clear_flow_state(session_id, flow_dict)
-        await self.add_flow_to_db(session_id, flow_dict)
+        # Embedded runs build the graph straight from the dict: the flow is never stored, so there is no row to
+        # delete, and clearing the whole cache would only drop what the other runs of the process still use
+        if not self.embedded:
+            await self.clear_flow_state(session_id, flow_dict)
+            await self.add_flow_to_db(session_id, flow_dict)
         graph = await self.create_graph_from_flow(session_id, flow_dict)
         try:
             result = await self.run_graph(input_value, input_type, output_type, session_id, graph, stream=stream)
         finally:
-            await self.clear_flow_state(session_id, flow_dict)
+            if not self.embedded:
+                await self.clear_flow_state(session_id, flow_dict)
         logger.info(f"Finish Handling {session_id=}")
         return result
 
@@ -112,6 +124,9 @@ class LangflowRunnerExperimental:
             await cascade_delete_flow(session, uuid_obj)
 
     async def init_db_if_needed(self):
+        if self.embedded:
+            await setup_embedded_services()
+            return
         if not await self.database_exists_check() and self.should_initialize_db:
             logger.info("Initializing database...")
             await initialize_database(fix_migration=True)
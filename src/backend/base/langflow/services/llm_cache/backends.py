@@ -0,0 +1,192 @@
+import abc
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+
+
+class LLMCacheBackend(abc.ABC):
+    """Byte storage for cached model responses.
+
+    Args:
+        ttl: Time in seconds after which an entry expires. 0 disables expiration.
+        max_bytes: Maximum number of bytes to keep. 0 disables the limit.
+    """
+
+    def __init__(self, ttl: int = 0, max_bytes: int = 0) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    def _expires_at(self) -> float | None:
+        return time.time() + self.ttl if self.ttl else None
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return the stored value, or None if it is missing or expired."""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value, evicting the least recently used entries if `max_bytes` is exceeded."""
+
+    @abc.abstractmethod
+    def clear(self, prefix: str = "") -> None:
+        """Remove every entry, or only those whose key starts with `prefix`."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend."""
+
+
+class InMemoryLLMCacheBackend(LLMCacheBackend):
+    """LRU in-memory storage bounded by total value size."""
+
+    def __init__(self, ttl: int = 0, max_bytes: int = 0) -> None:
+        super().__init__(ttl=ttl, max_bytes=max_bytes)
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.max_bytes and len(value) > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, self._expires_at())
+            self._size += len(value)
+            while self.max_bytes and self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                self._size = 0
+                return
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._pop(key)
+
+
+class SQLiteLLMCacheBackend(LLMCacheBackend):
+    """Storage in a local SQLite file, shared by every worker on the host."""
+
+    def __init__(self, path: str | Path, ttl: int = 0, max_bytes: int = 0) -> None:
+        super().__init__(ttl=ttl, max_bytes=max_bytes)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)")
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(value)
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.max_bytes and len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), self._expires_at(), now),
+            )
+            if self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        keys = []
+        for key, size in self._conn.execute("SELECT key, size FROM llm_cache ORDER BY accessed_at"):
+            keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", keys)
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            if prefix:
+                self._conn.execute("DELETE FROM llm_cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+            else:
+                self._conn.execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisLLMCacheBackend(LLMCacheBackend):
+    """Storage in Redis, shared by every Sochflow instance.
+
+    Expiration uses Redis TTLs. The byte limit is left to the server's `maxmemory` policy.
+    """
+
+    def __init__(self, url: str | None = None, host="localhost", port=6379, db=0, ttl: int = 0) -> None:
+        super().__init__(ttl=ttl)
+        try:
+            from redis import Redis
+        except ImportError as exc:
+            msg = (
+                "The Redis LLM cache requires the redis-py package."
+                " Please install Langflow with the deploy extra: pip install langflow[deploy]"
+            )
+            raise ImportError(msg) from exc
+        self._client = Redis.from_url(url) if url else Redis(host=host, port=port, db=db)
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.ttl:
+            self._client.setex(key, self.ttl, value)
+        else:
+            self._client.set(key, value)
+
+    def clear(self, prefix: str = "") -> None:
+        # Only remove the keys written by this cache, the database may be shared with the main cache
+        keys = list(self._client.scan_iter(match=f"{prefix or 'llm_cache:'}*"))
+        if keys:
+            self._client.delete(*keys)
+        logger.debug(f"Removed {len(keys)} cached LLM responses from Redis")
+
+    def close(self) -> None:
+        self._client.close()
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import loads
+from loguru import logger
+
+from langflow.services.cache.metrics import CacheInstrumentation, CacheNamespace
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+
+class SemanticIndex:
+    """A brute-force cosine similarity index over normalized float32 vectors.
+
+    Entries are evicted least-recently-used first once `max_entries` is reached, and expire after `ttl` seconds.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: int = 0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[Any, float]] = OrderedDict()
+        self._ids: list[int] = []
+        self._vectors: np.ndarray | None = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: list[float] | np.ndarray) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def search(self, vector: list[float] | np.ndarray, threshold: float) -> Any:
+        """Return the payload of the most similar entry if its similarity reaches `threshold`."""
+        with self._lock:
+            self._expire()
+            if self._vectors is None or not self._ids:
+                return CACHE_MISS
+            similarities = self._vectors @ self._normalize(vector)
+            best = int(np.argmax(similarities))
+            if similarities[best] < threshold:
+                return CACHE_MISS
+            entry_id = self._ids[best]
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][0]
+
+    def add(self, vector: list[float] | np.ndarray, payload: Any) -> None:
+        normalized = self._normalize(vector)
+        with self._lock:
+            if self._vectors is not None and self._vectors.shape[1] != normalized.shape[0]:
+                # The embedding model changed, previous vectors can no longer be compared
+                self._clear()
+            while self.max_entries and len(self._entries) >= self.max_entries:
+                self._remove(next(iter(self._entries)))
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (payload, time.time() + self.ttl if self.ttl else 0)
+            self._ids.append(entry_id)
+            row = normalized[np.newaxis, :]
+            self._vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+
+    def _expire(self) -> None:
+        if not self.ttl:
+            return
+        now = time.time()
+        for entry_id in [entry_id for entry_id, (_, expires_at) in self._entries.items() if expires_at < now]:
+            self._remove(entry_id)
+
+    def _remove(self, entry_id: int) -> None:
+        self._entries.pop(entry_id, None)
+        position = self._ids.index(entry_id)
+        self._ids.pop(position)
+        if self._vectors is not None:
+            self._vectors = np.delete(self._vectors, position, axis=0)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._ids.clear()
+        self._vectors = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+
+def prompt_to_text(prompt: str) -> str:
+    """Turn the serialized prompt LangChain passes to caches into plain text suitable for embedding."""
+    try:
+        messages = loads(prompt)
+    except Exception:  # noqa: BLE001
+        return prompt
+    if isinstance(messages, list):
+        return "\n".join(
+            f"{getattr(message, 'type', '')}: {getattr(message, 'content', message)}" for message in messages
+        )
+    return str(messages)
+
+
+# Query vectors kept between a missed lookup and the update that follows it
+PENDING_VECTORS_LIMIT = 32
+
+
+class SemanticLLMCache(CacheInstrumentation, BaseCache):
+    """A LangChain cache that falls back to the closest previously seen prompt.
+
+    Exact matches are served by `exact_cache`. On an exact miss the prompt is embedded and compared with the
+    prompts cached for the same model parameters; a response is reused when the cosine similarity reaches
+    `threshold`. The vector of a missed prompt is kept for the `update` that follows the model call, so that a miss
+    costs a single embedding.
+    """
+
+    name = "llm_cache_service"
+    namespace = CacheNamespace.LLM_SEMANTIC_RESPONSES.value
+
+    def __init__(
+        self,
+        exact_cache: BaseCache,
+        embedding: Embeddings,
+        indexes: dict[str, SemanticIndex],
+        *,
+        cache_namespace: str = "",
+        threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl: int = 0,
+    ) -> None:
+        self.exact_cache = exact_cache
+        self.embedding = embedding
+        self.indexes = indexes
+        self.cache_namespace = cache_namespace
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._pending_vectors: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _namespace_prefix(self) -> str:
+        # Index keys start with the namespace's own digest, so that `clear` can find the indexes of its namespace
+        return f"{hashlib.sha256(self.cache_namespace.encode()).hexdigest()}:"
+
+    def _index_key(self, llm_string: str) -> str:
+        return f"{self._namespace_prefix()}{hashlib.sha256(llm_string.encode()).hexdigest()}"
+
+    def _get_index(self, llm_string: str) -> SemanticIndex:
+        key = self._index_key(llm_string)
+        if key not in self.indexes:
+            self.indexes[key] = SemanticIndex(max_entries=self.max_entries, ttl=self.ttl)
+        return self.indexes[key]
+
+    def _keep_vector(self, prompt: str, llm_string: str, vector: list[float]) -> None:
+        with self._lock:
+            self._pending_vectors[prompt, llm_string] = vector
+            while len(self._pending_vectors) > PENDING_VECTORS_LIMIT:
+                self._pending_vectors.popitem(last=False)
+
+    def _embed(self, prompt: str, llm_string: str) -> list[float]:
+        """The vector of a prompt, reusing the one computed by a missed lookup."""
+        with self._lock:
+            vector = self._pending_vectors.pop((prompt, llm_string), None)
+        return vector if vector is not None else self.embedding.embed_query(prompt_to_text(prompt))
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        if (result := self.exact_cache.lookup(prompt, llm_string)) is not None:
+            return result
+        started_at = time.perf_counter()
+        value: Any = CACHE_MISS
+        try:
+            vector = self.embedding.embed_query(prompt_to_text(prompt))
+            value = self._get_index(llm_string).search(vector, self.threshold)
+            if value is CACHE_MISS:
+                self._keep_vector(prompt, llm_string, vector)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error searching the semantic LLM cache")
+        self._record_get(started_at, value)
+        return None if value is CACHE_MISS else value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.exact_cache.update(prompt, llm_string, return_val)
+        started_at = time.perf_counter()
+        try:
+            vector = self._embed(prompt, llm_string)
+            self._get_index(llm_string).add(vector, return_val)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error adding to the semantic LLM cache")
+            return
+        self._record_set(started_at, vector)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove the responses cached in this cache's namespace, leaving those of other flows."""
+        self.exact_cache.clear(**kwargs)
+        namespace_prefix = self._namespace_prefix()
+        for key in [key for key in self.indexes if key.startswith(namespace_prefix)]:
+            self.indexes.pop(key).clear()
+        with self._lock:
+            self._pending_vectors.clear()
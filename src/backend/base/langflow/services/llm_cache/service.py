@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.cache.metrics import CacheInstrumentation, CacheNamespace
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.llm_cache.backends import (
+    InMemoryLLMCacheBackend,
+    LLMCacheBackend,
+    RedisLLMCacheBackend,
+    SQLiteLLMCacheBackend,
+)
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+    from langflow.services.llm_cache.semantic import SemanticIndex, SemanticLLMCache
+    from langflow.services.settings.service import SettingsService
+
+KEY_PREFIX = "llm_cache"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a serialized prompt so that insignificant whitespace differences share a cache entry."""
+    return "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+
+
+def namespace_key_prefix(namespace: str) -> str:
+    """The prefix of the keys of a cache namespace, so that a namespace can be cleared on its own."""
+    return f"{KEY_PREFIX}:{hashlib.sha256(namespace.encode('utf-8')).hexdigest()[:16]}:"
+
+
+def build_cache_key(namespace: str, llm_string: str, prompt: str) -> str:
+    """Key a response on the cache namespace, the model provider/name/parameters and the normalized prompt."""
+    digest = hashlib.sha256()
+    for part in (namespace, llm_string, normalize_prompt(prompt)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return f"{namespace_key_prefix(namespace)}{digest.hexdigest()}"
+
+
+class LangflowLLMCache(CacheInstrumentation, BaseCache):
+    """A LangChain cache that stores model responses in the LLM cache service's backend."""
+
+    name = "llm_cache_service"
+    namespace = CacheNamespace.LLM_RESPONSES.value
+
+    def __init__(self, backend: LLMCacheBackend, cache_namespace: str = "") -> None:
+        self.backend = backend
+        self.cache_namespace = cache_namespace
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        started_at = time.perf_counter()
+        result: Any = CACHE_MISS
+        try:
+            if (value := self.backend.get(build_cache_key(self.cache_namespace, llm_string, prompt))) is not None:
+                result = [loads(generation) for generation in json.loads(value)]
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error reading cached LLM response")
+        self._record_get(started_at, result)
+        return None if result is CACHE_MISS else result
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        started_at = time.perf_counter()
+        try:
+            value = json.dumps([dumps(generation) for generation in return_val]).encode("utf-8")
+            self.backend.set(build_cache_key(self.cache_namespace, llm_string, prompt), value)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error caching LLM response")
+            return
+        self._record_set(started_at, value)
+
+    def clear(self, **kwargs: Any) -> None:  # noqa: ARG002
+        """Remove the responses cached in this cache's namespace, which other flows do not share."""
+        self.backend.clear(namespace_key_prefix(self.cache_namespace))
+        self._record_clear()
+
+
+class LLMCacheService(Service):
+    """Holds the backend used by model components that opt into response caching."""
+
+    name = "llm_cache_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        self.settings_service = settings_service
+        self._backend: LLMCacheBackend | None = None
+        self._semantic_indexes: dict[str, SemanticIndex] = {}
+
+    @property
+    def backend(self) -> LLMCacheBackend:
+        if self._backend is None:
+            self._backend = self._create_backend()
+        return self._backend
+
+    def _create_backend(self) -> LLMCacheBackend:
+        settings = self.settings_service.settings
+        ttl = settings.llm_cache_ttl
+        max_bytes = settings.llm_cache_max_bytes
+        if settings.llm_cache_backend == "redis":
+            return RedisLLMCacheBackend(
+                url=settings.redis_url,
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                ttl=ttl,
+            )
+        if settings.llm_cache_backend == "sqlite":
+            path = f"{settings.config_dir}/llm_cache.db"
+            return SQLiteLLMCacheBackend(path, ttl=ttl, max_bytes=max_bytes)
+        return InMemoryLLMCacheBackend(ttl=ttl, max_bytes=max_bytes)
+
+    def get_langchain_cache(self, namespace: str | None = None) -> LangflowLLMCache:
+        """Return a LangChain cache whose entries are isolated to `namespace` (usually the flow id)."""
+        return LangflowLLMCache(self.backend, cache_namespace=namespace or "")
+
+    def get_semantic_cache(
+        self, embedding: Embeddings, namespace: str | None = None, threshold: float = 0.95
+    ) -> SemanticLLMCache:
+        """Return a LangChain cache that also reuses responses to prompts similar to a cached one.
+
+        The vectors are kept in process memory, one index per namespace and model configuration, while exact
+        matches keep using the configured backend.
+        """
+        # Imported here because it needs numpy
+        from langflow.services.llm_cache.semantic import SemanticLLMCache
+
+        settings = self.settings_service.settings
+        return SemanticLLMCache(
+            self.get_langchain_cache(namespace),
+            embedding,
+            self._semantic_indexes,
+            cache_namespace=namespace or "",
+            threshold=threshold,
+            max_entries=settings.llm_semantic_cache_max_entries,
+            ttl=settings.llm_cache_ttl,
+        )
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self._semantic_indexes.clear()
+
+    async def teardown(self) -> None:
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+        self._semantic_indexes.clear()
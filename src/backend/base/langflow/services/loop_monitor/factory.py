@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.loop_monitor.service import LoopMonitorService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+    from langflow.services.telemetry.service import TelemetryService
+
+
+class LoopMonitorServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(LoopMonitorService)
+
+    @override
+    def create(self, settings_service: SettingsService, telemetry_service: TelemetryService):
+        settings = settings_service.settings
+        return LoopMonitorService(
+            enabled=settings.loop_monitor_enabled,
+            threshold=settings.slow_callback_threshold,
+            history=settings.slow_callback_history,
+            exporter=telemetry_service.ot,
+        )
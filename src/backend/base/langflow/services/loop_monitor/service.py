@@ -0,0 +1,185 @@
+"""Event-loop lag and slow callbacks.
+
+Any synchronous work on the event loop (pickling, `jsonable_encoder`, `ast.parse`, validating large rows) delays
+every other request by as much. A watchdog thread pings the loop every `interval` seconds: how late the loop runs the
+ping is its lag. When a ping waits longer than `threshold`, the loop is blocked by a slow callback, and the watchdog
+captures the stack of the loop thread and the name of the task it runs (vertex builds are named after their vertex).
+
+The lag and the slow callbacks are reported by `/monitor/loop` and exported through the telemetry service.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.cache.metrics import LatencyHistogram
+
+if TYPE_CHECKING:
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+# Seconds between two pings of the event loop
+LOOP_LAG_INTERVAL = 0.1
+# Upper bounds (in seconds) of the lag histogram buckets
+LOOP_LAG_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+# Innermost frames kept of the stack of a slow callback
+SLOW_CALLBACK_STACK_LIMIT = 30
+
+
+@dataclass
+class SlowCallback:
+    # The name of the task the loop was running, if the callback was a step of a task
+    task: str | None
+    stack: list[str]
+    # Unix time at which the loop was found blocked
+    detected_at: float
+    # How late the loop ran the ping: at least `threshold`
+    duration: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "task": self.task,
+            "duration_seconds": self.duration,
+            "detected_at": self.detected_at,
+            "stack": self.stack,
+        }
+
+
+class _Ping:
+    def __init__(self) -> None:
+        self.sent_at = time.monotonic()
+        self.lag = 0.0
+        self.done = threading.Event()
+
+
+class LoopMonitorService(Service):
+    name = "loop_monitor_service"
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        interval: float = LOOP_LAG_INTERVAL,
+        threshold: float = 0.1,
+        history: int = 100,
+        exporter: OpenTelemetry | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.interval = interval
+        self.threshold = threshold
+        self.histogram = LatencyHistogram(LOOP_LAG_BUCKETS)
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.slow_callback_count = 0
+        self.slow_callbacks: deque[SlowCallback] = deque(maxlen=history)
+        self._exporter = exporter
+        self._labels = {"worker": str(os.getpid())}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._stopping = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if not self.enabled or (self._watchdog is not None and self._watchdog.is_alive()):
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="loop_monitor", daemon=True)
+        self._watchdog.start()
+        self.set_ready()
+
+    async def teardown(self) -> None:
+        if self._watchdog is None:
+            return
+        self._stopping.set()
+        # The watchdog may be waiting for a ping, which the loop must keep running to answer
+        await asyncio.to_thread(self._watchdog.join)
+        self._watchdog = None
+
+    def _export(self, metric_name: str, value: float) -> None:
+        if self._exporter is None:
+            return
+        try:
+            self._exporter.observe_histogram(metric_name, value, self._labels)
+        except Exception:  # noqa: BLE001
+            # Metrics must never break the monitor
+            self._exporter = None
+
+    def observe(self, lag: float) -> None:
+        with self._lock:
+            self.histogram.observe(lag)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+        self._export("event_loop_lag", lag)
+
+    def _answer(self, ping: _Ping) -> None:
+        """Run on the event loop."""
+        ping.lag = time.monotonic() - ping.sent_at
+        ping.done.set()
+        self.observe(ping.lag)
+
+    def _capture(self) -> SlowCallback:
+        """Capture what the loop thread is running, from the watchdog thread."""
+        task_name = None
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        if task is not None:
+            task_name = task.get_name()
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.extract_stack(frame, limit=SLOW_CALLBACK_STACK_LIMIT).format() if frame else []
+        return SlowCallback(task=task_name, stack=stack, detected_at=time.time())
+
+    def _record(self, slow_callback: SlowCallback) -> None:
+        with self._lock:
+            self.slow_callbacks.append(slow_callback)
+            self.slow_callback_count += 1
+        self._export("event_loop_slow_callbacks", slow_callback.duration)
+        where = f"task {slow_callback.task!r}" if slow_callback.task else "a callback"
+        logger.warning(
+            f"The event loop was blocked for {slow_callback.duration:.3f}s by {where} at:\n"
+            + "".join(slow_callback.stack[-3:])
+        )
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(self.interval):
+            ping = _Ping()
+            try:
+                self._loop.call_soon_threadsafe(self._answer, ping)  # type: ignore[union-attr]
+            except RuntimeError:
+                # The loop is closed
+                return
+            if ping.done.wait(self.threshold):
+                continue
+            slow_callback = self._capture()
+            while not ping.done.wait(self.interval):
+                if self._stopping.is_set():
+                    return
+            slow_callback.duration = ping.lag
+            self._record(slow_callback)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "interval_seconds": self.interval,
+                "last_lag_seconds": self.last_lag,
+                "max_lag_seconds": self.max_lag,
+                "lag_seconds": self.histogram.to_dict(),
+                "slow_callback_threshold_seconds": self.threshold,
+                "slow_callback_count": self.slow_callback_count,
+                "slow_callbacks": [slow_callback.to_dict() for slow_callback in reversed(self.slow_callbacks)],
+            }
@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    LLM_CACHE_SERVICE = "llm_cache_service"
+    LOOP_MONITOR_SERVICE = "loop_monitor_service"
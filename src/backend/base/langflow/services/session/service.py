@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.metrics import CacheNamespace, cache_namespace
 from langflow.services.cache.utils import CacheMiss
 from langflow.services.session.utils import compute_dict_hash, session_id_generator
 
@@ -18,10 +19,11 @@ class SessionService(Service):
 
     async def load_session(self, key, flow_id: str, data_graph: dict | None = None):
         # Check if the data is cached
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            value = await self.cache_service.get(key)
-        else:
-            value = await asyncio.to_thread(self.cache_service.get, key)
+        with cache_namespace(CacheNamespace.SESSIONS):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                value = await self.cache_service.get(key)
+            else:
+                value = await asyncio.to_thread(self.cache_service.get, key)
         if not isinstance(value, CacheMiss):
             return value
 
@@ -34,7 +36,8 @@ class SessionService(Service):
 
         graph = Graph.from_payload(data_graph, flow_id=flow_id)
         artifacts: dict = {}
-        await self.cache_service.set(key, (graph, artifacts))
+        with cache_namespace(CacheNamespace.SESSIONS):
+            await self.cache_service.set(key, (graph, artifacts))
 
         return graph, artifacts
 
@@ -51,13 +54,15 @@ class SessionService(Service):
         return self.build_key(session_id, data_graph=data_graph)
 
     async def update_session(self, session_id, value) -> None:
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.set(session_id, value)
-        else:
-            await asyncio.to_thread(self.cache_service.set, session_id, value)
+        with cache_namespace(CacheNamespace.SESSIONS):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                await self.cache_service.set(session_id, value)
+            else:
+                await asyncio.to_thread(self.cache_service.set, session_id, value)
 
     async def clear_session(self, session_id) -> None:
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.delete(session_id)
-        else:
-            await asyncio.to_thread(self.cache_service.delete, session_id)
+        with cache_namespace(CacheNamespace.SESSIONS):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                await self.cache_service.delete(session_id)
+            else:
+                await asyncio.to_thread(self.cache_service.delete, session_id)
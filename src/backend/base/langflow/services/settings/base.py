@@ -136,7 +136,22 @@ class Settings(BaseSettings):
 
     remove_api_keys: bool = False
     components_path: list[str] = []
+    cache_component_templates: bool = True
+    """If set to True, component templates are stored in a manifest in the config directory and only the
+    templates of new or modified component files are rebuilt at startup. Ignored in dev mode."""
+    component_build_workers: int = 0
+    """The number of processes used to build component templates at startup. 0 or 1 builds them in the
+    server process; on many-core machines a value close to the number of cores shortens full rebuilds."""
     langchain_cache: str = "InMemoryCache"
+    llm_cache_backend: Literal["memory", "sqlite", "redis"] = "memory"
+    """Where model components that enable response caching store their responses. 'sqlite' keeps them in
+    the config directory and 'redis' uses the Redis settings below."""
+    llm_cache_ttl: int = 86400
+    """The time in seconds after which a cached model response expires. 0 disables expiration."""
+    llm_cache_max_bytes: int = 100 * 1024 * 1024
+    """The maximum size in bytes of the memory and SQLite LLM response caches. 0 disables the limit."""
+    llm_semantic_cache_max_entries: int = 1000
+    """The maximum number of prompts kept in each in-memory semantic LLM cache index. 0 disables the limit."""
     load_flows_path: str | None = None
     bundle_urls: list[str] = []
 
@@ -158,6 +173,8 @@ class Settings(BaseSettings):
     like_webhook_url: str | None = "https://api.sochflow.store/flows/trigger/64275852-ec00-45c1-984e-3bff814732da"
 
     storage_type: str = "local"
+    content_addressed_storage: bool = False
+    """If set to True, Sochflow stores identical uploads once, as a blob named after their SHA-256."""
 
     celery_enabled: bool = False
 
@@ -171,6 +188,22 @@ class Settings(BaseSettings):
     """List of environment variables to get from the environment and store in the database."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
+    profile_startup: bool = False
+    """If set to True, the startup phases, module imports and component template builds are timed and written to a
+    JSON report at `startup_profile_path`."""
+    startup_profile_path: str | None = None
+    """Path of the startup profile report. Defaults to `startup_profile.json` in the config directory. With several
+    workers, each worker writes its own report, with its pid before the extension."""
+    loop_monitor_enabled: bool = True
+    """If set to True, Sochflow samples the lag of the event loop and records the callbacks that block it for longer
+    than `slow_callback_threshold`, with their stack (see `/monitor/loop`)."""
+    slow_callback_threshold: float = 0.1
+    """Time in seconds a callback can block the event loop before it is recorded as slow."""
+    slow_callback_history: int = 100
+    """Number of the latest slow callbacks kept by the loop monitor."""
+    preload_app: bool = False
+    """If set to True, the server's master process runs the database startup steps and builds the component
+    types once before forking its workers, which then share that state instead of each repeating the startup."""
     frontend_timeout: int = 0
     """Timeout for the frontend API calls in seconds."""
     user_agent: str = "langflow"
@@ -223,7 +256,14 @@ class Settings(BaseSettings):
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
-    """The polling interval in milliseconds for synchronizing flows from the file system."""
+    """The polling interval in milliseconds for synchronizing flows from the file system, when file system
+    notifications are disabled or unavailable."""
+    fs_flows_watch: bool = True
+    """If set to True, flows saved to the file system are synchronized from file system notifications instead of
+    polling their files. Falls back to polling if `watchfiles` is not installed or the watch fails."""
+    fs_flows_index_refresh_interval: int = 60000
+    """The interval in milliseconds at which the list of flows saved to the file system is reloaded from the
+    database. Flows saved through this server are picked up immediately."""
     ssl_cert_file: str | None = None
     """Path to the SSL certificate file on the local system."""
     ssl_key_file: str | None = None
@@ -245,8 +285,14 @@ class Settings(BaseSettings):
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
     lazy_load_components: bool = False
-    """If set to True, Sochflow will only partially load components at startup and fully load them on demand.
-    This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    """If set to True, Sochflow lists components from a static index of their source files at startup and only
+    builds a component's full template when it is first opened or executed. This significantly reduces startup
+    time but may cause a slight delay when a component is first used."""
+    vertex_results_memory_limit: int = 0
+    """The amount of DataFrame and list of Data outputs, in MB, that a single run keeps in memory. Outputs beyond
+    this budget are spilled to temporary files once produced and loaded on demand by downstream components. This
+    bounds the memory retained by a run, not the peak memory of the component producing an output. 0 disables
+    spilling."""
 
     @field_validator("event_delivery", mode="before")
     @classmethod
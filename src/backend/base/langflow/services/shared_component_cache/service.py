@@ -1,7 +1,9 @@
 from langflow.services.cache import ThreadingInMemoryCache
+from langflow.services.cache.metrics import CacheNamespace
 
 
 class SharedComponentCacheService(ThreadingInMemoryCache):
     """A caching service shared across components."""
 
     name = "shared_component_cache_service"
+    namespace = CacheNamespace.SHARED_COMPONENT.value
@@ -0,0 +1,152 @@
+"""Content-addressed storage of the uploaded files.
+
+With `content_addressed_storage`, an uploaded file is stored once per content: as a blob of the `blobs` folder named
+after its SHA-256 (and extension, which the components use to pick a parser). The `File` rows that share a blob have
+its path, so they are its reference count: the blob is deleted along with the last file that references it.
+
+Counting the references of a blob and writing or deleting it happen under the lock of the blob (`blob_lock`), held
+until the `File` rows are committed, so that an upload never relies on a blob that a deletion is removing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sqlalchemy import func, text
+from sqlmodel import col, select
+
+from langflow.services.database.models.file.model import File
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from langflow.services.storage.service import StorageService
+
+BLOB_FOLDER = "blobs"
+# Seconds during which an unreferenced blob is kept, as the upload that wrote it may not have committed its file yet
+BLOB_GRACE_PERIOD = 60 * 60
+
+# Locks of the blobs this process is saving or releasing
+_blob_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def blob_path(content_hash: str, extension: str = "") -> str:
+    return f"{BLOB_FOLDER}/{content_hash}{extension}"
+
+
+def split_file_path(path: str) -> tuple[str, str]:
+    """The storage folder and file name of a `File.path`."""
+    folder, _, file_name = path.rpartition("/")
+    return folder, file_name
+
+
+async def hash_chunks(chunks: AsyncIterable[bytes]) -> tuple[str, int]:
+    """The SHA-256 hex digest and the size of a stream of bytes."""
+    sha256 = hashlib.sha256()
+    size = 0
+    async for chunk in chunks:
+        sha256.update(chunk)
+        size += len(chunk)
+    return sha256.hexdigest(), size
+
+
+async def count_references(session: AsyncSession, path: str) -> int:
+    stmt = select(func.count()).select_from(File).where(File.path == path)
+    return (await session.exec(stmt)).one()
+
+
+def _advisory_lock_key(path: str) -> int:
+    return int.from_bytes(hashlib.sha256(path.encode()).digest()[:8], "big", signed=True)
+
+
+@asynccontextmanager
+async def blob_lock(session: AsyncSession, path: str) -> AsyncIterator[None]:
+    """Hold the lock of a blob, so that the uploads and deletions of its files are serialized.
+
+    Within a process it is an asyncio lock. On PostgreSQL it is also a transaction-level advisory lock, which
+    serializes the workers and lasts until the transaction of `session` ends, so commit inside the block. Other
+    databases only get the lock of the process.
+    """
+    lock = _blob_locks.get(path)
+    if lock is None:
+        lock = _blob_locks[path] = asyncio.Lock()
+    async with lock:
+        if session.get_bind().dialect.name == "postgresql":
+            stmt = text("SELECT pg_advisory_xact_lock(:key)").bindparams(key=_advisory_lock_key(path))
+            await session.exec(stmt)
+        yield
+
+
+async def save_blob(
+    session: AsyncSession, storage_service: StorageService, path: str, chunks: AsyncIterable[bytes]
+) -> bool:
+    """Store a blob unless a file already references it. Returns whether it was written.
+
+    It is called under `blob_lock`, which is held until the file referencing the blob is committed.
+    """
+    if await count_references(session, path):
+        return False
+    await storage_service.save_file_stream(*split_file_path(path), chunks)
+    return True
+
+
+async def release_blob(session: AsyncSession, storage_service: StorageService, path: str) -> bool:
+    """Delete a blob if no file references it anymore. Returns whether it was deleted.
+
+    It is called once the deletion of the files that referenced it is committed, and takes `blob_lock` itself: the
+    references are counted again under the lock, so a file committed meanwhile by an upload keeps the blob.
+    """
+    async with blob_lock(session, path):
+        try:
+            if await count_references(session, path):
+                return False
+            await storage_service.delete_file(*split_file_path(path))
+            return True
+        finally:
+            # Ends the transaction, releasing the advisory lock
+            await session.commit()
+
+
+async def _is_recent(storage_service: StorageService, name: str, now: float, grace_period: float) -> bool:
+    try:
+        modified_time = await storage_service.get_file_modified_time(BLOB_FOLDER, name)
+    except (FileNotFoundError, NotImplementedError):
+        # Deleted meanwhile, or of an unknown age
+        return True
+    return now - modified_time < grace_period
+
+
+async def collect_unreferenced_blobs(
+    session: AsyncSession, storage_service: StorageService, *, grace_period: float = BLOB_GRACE_PERIOD
+) -> int:
+    """Delete the blobs that no file references, left behind by uploads or deletions that failed halfway.
+
+    A blob written by an upload is not referenced until the upload commits its file, so only the blobs written more
+    than `grace_period` seconds ago are deleted, each through `release_blob`. Returns the number of blobs deleted.
+    """
+    try:
+        blob_names = [split_file_path(name)[1] for name in await storage_service.list_files(BLOB_FOLDER)]
+    except FileNotFoundError:
+        return 0
+
+    stmt = select(File.path).where(col(File.path).startswith(f"{BLOB_FOLDER}/"))
+    referenced = {split_file_path(path)[1] for path in (await session.exec(stmt)).all()}
+    now = time.time()
+    deleted = 0
+    for name in blob_names:
+        # Names starting with a dot are the temporary files of uploads in progress
+        if name in referenced or name.startswith(".") or await _is_recent(storage_service, name, now, grace_period):
+            continue
+        if await release_blob(session, storage_service, f"{BLOB_FOLDER}/{name}"):
+            deleted += 1
+    if deleted:
+        logger.info(f"Deleted {deleted} unreferenced blobs")
+    return deleted
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -17,6 +26,9 @@ class LocalStorageService(StorageService):
         """Build the full path of a file in the local storage."""
         return str(self.data_dir / flow_id / file_name)
 
+    def get_local_path(self, flow_id: str, file_name: str) -> Path:
+        return Path(self.data_dir / flow_id / file_name)
+
     async def save_file(self, flow_id: str, file_name: str, data: bytes) -> None:
         """Save a file in the local storage.
 
@@ -42,6 +54,58 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage from an iterable of byte chunks, and return its size.
+
+        The chunks are written to a temporary file as they arrive, which is moved in place once complete, so a
+        failed or interrupted upload never leaves a partial file behind.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.{uuid.uuid4().hex}.partial"
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.replace(file_path)
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await partial_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return size
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read the bytes `start` to `end` (inclusive) of a file in the local storage, one chunk at a time."""
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end - start + 1
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -113,7 +177,7 @@ class LocalStorageService(StorageService):
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for local
 
-    async def get_file_size(self, flow_id: str, file_name: str) -> None:
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in the local storage."""
         # Get the file size from the file path
         file_path = self.data_dir / flow_id / file_name
@@ -124,3 +188,11 @@ class LocalStorageService(StorageService):
 
         file_size_stat = await file_path.stat()
         return file_size_stat.st_size
+
+    async def get_file_modified_time(self, flow_id: str, file_name: str) -> float:
+        """Get the time at which a file of the local storage was last written."""
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+        return (await file_path.stat()).st_mtime
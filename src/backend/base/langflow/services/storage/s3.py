@@ -1,8 +1,19 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# Every part of a multipart upload but the last must be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -36,6 +47,98 @@ class S3StorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in folder {folder}")
             raise
 
+    async def save_file_stream(self, folder: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket with a multipart upload, buffering one part at a time.
+
+        Returns:
+            The size of the file.
+        """
+        key = f"{folder}/{file_name}"
+        upload = await asyncio.to_thread(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+        upload_id = upload["UploadId"]
+        parts: list[dict] = []
+        size = 0
+        buffer = bytearray()
+
+        async def upload_part(body: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    await upload_part(bytes(buffer))
+                    buffer.clear()
+            # The last part may be smaller, and an empty file is a single empty part
+            if buffer or not parts:
+                await upload_part(bytes(buffer))
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            await asyncio.to_thread(
+                self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {folder}.")
+        return size
+
+    async def get_file_stream(
+        self,
+        folder: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read the bytes `start` to `end` (inclusive) of a file with a ranged GET, one chunk at a time."""
+        kwargs = {"Bucket": self.bucket, "Key": f"{folder}/{file_name}"}
+        # A range starting at 0 is not satisfiable for an empty object, so whole-file reads are not ranged
+        if start or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **kwargs)
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            raise
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def _head_object(self, folder: str, file_name: str) -> dict:
+        try:
+            return await asyncio.to_thread(self.s3_client.head_object, Bucket=self.bucket, Key=f"{folder}/{file_name}")
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                msg = f"File {file_name} not found in folder {folder}"
+                raise FileNotFoundError(msg) from exc
+            raise
+
+    async def get_file_size(self, folder: str, file_name: str) -> int:
+        return (await self._head_object(folder, file_name))["ContentLength"]
+
+    async def get_file_modified_time(self, folder: str, file_name: str) -> float:
+        return (await self._head_object(folder, file_name))["LastModified"].timestamp()
+
     async def get_file(self, folder: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
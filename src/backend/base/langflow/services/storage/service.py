@@ -8,10 +8,17 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+    from pathlib import Path
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+# Size of the chunks files are read and written in when streaming them
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -35,6 +42,47 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file from an iterable of byte chunks, and return its size.
+
+        Storages that can write incrementally override this; by default the chunks are joined and saved at once.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return len(data)
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read the bytes `start` to `end` (inclusive, the end of the file by default) of a file, in chunks.
+
+        Storages that can read incrementally override this; by default the whole file is read first.
+        """
+        content = await self.get_file(flow_id, file_name)
+        stop = len(content) if end is None else min(end + 1, len(content))
+        for offset in range(start, stop, chunk_size):
+            yield content[offset : min(offset + chunk_size, stop)]
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        raise NotImplementedError
+
+    async def get_file_modified_time(self, flow_id: str, file_name: str) -> float:
+        """The Unix time at which a file was last written."""
+        raise NotImplementedError
+
+    def get_local_path(self, flow_id: str, file_name: str) -> Path | None:  # noqa: ARG002
+        """The path of a file on the local filesystem, for storages that keep their files there.
+
+        Files with a local path can be sent by the server with `sendfile`, without being read into Python.
+        """
+        return None
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -1,5 +1,61 @@
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
 from langflow.services.storage.constants import EXTENSION_TO_CONTENT_TYPE
 
+_RANGE_PATTERN = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
 
 def build_content_type_from_extension(extension: str):
     return EXTENSION_TO_CONTENT_TYPE.get(extension.lower(), "application/octet-stream")
+
+
+class ByteRange(NamedTuple):
+    start: int
+    end: int
+    """Inclusive, as in `Content-Range`."""
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+
+class RangeNotSatisfiableError(ValueError):
+    pass
+
+
+def parse_range_header(range_header: str | None, size: int) -> ByteRange | None:
+    """Parse an HTTP `Range` header for a file of `size` bytes.
+
+    Returns None when the whole file should be sent: no header, a unit other than bytes, a malformed header or
+    several ranges (which servers may ignore). Raises `RangeNotSatisfiableError` if the range lies beyond the file.
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    if (match := _RANGE_PATTERN.match(ranges)) is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # A suffix range: the last `last` bytes
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            msg = f"Range {range_header} not satisfiable for {size} bytes"
+            raise RangeNotSatisfiableError(msg)
+        return ByteRange(max(size - suffix_length, 0), size - 1)
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        msg = f"Range {range_header} not satisfiable for {size} bytes"
+        raise RangeNotSatisfiableError(msg)
+    return ByteRange(start, end)
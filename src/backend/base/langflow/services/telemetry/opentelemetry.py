@@ -140,6 +140,64 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        cache_labels = {"cache": mandatory_label, "namespace": mandatory_label}
+        self._add_metric(
+            name="cache_hits",
+            description="The number of cache lookups that found a value",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels=cache_labels,
+        )
+        self._add_metric(
+            name="cache_misses",
+            description="The number of cache lookups that did not find a value",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels=cache_labels,
+        )
+        self._add_metric(
+            name="cache_evictions",
+            description="The number of cache items removed because they expired or the cache was full",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels=cache_labels,
+        )
+        self._add_metric(
+            name="cache_get_latency",
+            description="The time spent retrieving an item from the cache",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels=cache_labels,
+        )
+        self._add_metric(
+            name="cache_set_latency",
+            description="The time spent storing an item in the cache",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels=cache_labels,
+        )
+        self._add_metric(
+            name="cache_bytes_stored",
+            description="The approximate number of bytes held in the cache",
+            unit="bytes",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels=cache_labels,
+        )
+        loop_labels = {"worker": mandatory_label}
+        self._add_metric(
+            name="event_loop_lag",
+            description="How late the event loop runs a callback once it is due",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels=loop_labels,
+        )
+        self._add_metric(
+            name="event_loop_slow_callbacks",
+            description="How long the callbacks slower than the threshold blocked the event loop",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels=loop_labels,
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
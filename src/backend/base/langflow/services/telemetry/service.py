@@ -10,6 +10,7 @@ import httpx
 from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.cache.metrics import get_cache_metrics
 from langflow.services.telemetry.opentelemetry import OpenTelemetry
 from langflow.services.telemetry.schema import (
     ComponentPayload,
@@ -39,6 +40,7 @@ class TelemetryService(Service):
         self._stopping = False
 
         self.ot = OpenTelemetry(prometheus_enabled=settings_service.settings.prometheus_enabled)
+        get_cache_metrics().attach_exporter(self.ot)
         self.architecture: str | None = None
         self.worker_task: asyncio.Task | None = None
         # Check for do-not-track settings
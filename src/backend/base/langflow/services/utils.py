@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from filelock import FileLock, Timeout
 from loguru import logger
 from sqlalchemy import delete
 from sqlalchemy import exc as sqlalchemy_exc
@@ -16,14 +18,18 @@ from langflow.services.database.models.vertex_builds.model import VertexBuildTab
 from langflow.services.database.utils import initialize_database
 from langflow.services.schema import ServiceType
 from langflow.services.settings.constants import DEFAULT_SUPERUSER, DEFAULT_SUPERUSER_PASSWORD
+from langflow.services.storage.content_addressed import collect_unreferenced_blobs
 
-from .deps import get_db_service, get_service, get_settings_service
+from .deps import get_db_service, get_service, get_settings_service, get_storage_service
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from langflow.services.settings.manager import SettingsService
 
+# Held in the config dir by the process collecting the unreferenced blobs
+BLOB_COLLECTION_LOCK_FILENAME = ".blob_collection.lock"
+
 
 async def get_or_create_super_user(session: AsyncSession, username, password, is_default):
     from langflow.services.database.models.user.model import User
@@ -227,13 +233,49 @@ async def clean_vertex_builds(settings_service: SettingsService, session: AsyncS
         # Don't re-raise since this is a cleanup task
 
 
-async def initialize_services(*, fix_migration: bool = False) -> None:
-    """Initialize all the services needed."""
+async def clean_unreferenced_blobs(settings_service: SettingsService, session: AsyncSession) -> None:
+    """Delete the blobs of the content-addressed storage that no file references anymore.
+
+    It runs at startup, when other workers may already serve uploads: only the blobs older than the grace period of
+    `collect_unreferenced_blobs` are deleted, and by one process at a time, holding a file lock in the config dir.
+
+    Args:
+        settings_service: The settings service, telling whether the content-addressed storage is enabled
+        session: The database session used to find the referenced blobs
+    """
+    settings = settings_service.settings
+    if not settings.content_addressed_storage:
+        return
+    lock = FileLock(Path(settings.config_dir) / BLOB_COLLECTION_LOCK_FILENAME) if settings.config_dir else None
+    if lock is not None:
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            logger.debug("Another process is collecting the unreferenced blobs")
+            return
+    try:
+        await collect_unreferenced_blobs(session, get_storage_service())
+    except Exception as exc:  # noqa: BLE001
+        logger.error(f"Error cleaning up unreferenced blobs: {exc!s}")
+        # Don't re-raise since this is a cleanup task
+    finally:
+        if lock is not None:
+            lock.release()
+
+
+async def initialize_services(*, fix_migration: bool = False, setup_database: bool = True) -> None:
+    """Initialize all the services needed.
+
+    `setup_database=False` skips migrations and the database bootstrap, e.g. in workers whose master already
+    performed them.
+    """
     cache_service = get_service(ServiceType.CACHE_SERVICE, default=CacheServiceFactory())
     # Test external cache connection
     if isinstance(cache_service, ExternalAsyncBaseCacheService) and not (await cache_service.is_connected()):
         msg = "Cache service failed to connect to external database"
         raise ConnectionError(msg)
+    if not setup_database:
+        return
 
     # Setup the superuser
     await initialize_database(fix_migration=fix_migration)
@@ -248,3 +290,4 @@ async def initialize_services(*, fix_migration: bool = False) -> None:
         logger.warning(f"Error assigning orphaned flows to the superuser: {exc!s}")
     await clean_transactions(settings_service, session)
     await clean_vertex_builds(settings_service, session)
+    await clean_unreferenced_blobs(settings_service, session)
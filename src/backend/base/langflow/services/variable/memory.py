@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from typing_extensions import override
+
+from langflow.services.base import Service
+from langflow.services.database.models.variable.model import Variable, VariableRead
+from langflow.services.variable.base import VariableService
+from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from langflow.services.settings.service import SettingsService
+
+
+class InMemoryVariableService(VariableService, Service):
+    """Keeps the variables in memory, for embedded runs that have no database to store them in.
+
+    Values are kept in plain text for the lifetime of the process. Variables that were not created are read from
+    the environment, so flows that use global variables can be run by setting environment variables of the same name.
+    """
+
+    def __init__(self, settings_service: SettingsService, variables: dict[str, str] | None = None):
+        self.settings_service = settings_service
+        # Variables given upfront are available to every user
+        self.defaults: dict[str, str] = dict(variables or {})
+        self.variables: dict[str, dict[str, Variable]] = {}
+
+    def _user_variables(self, user_id: UUID | str) -> dict[str, Variable]:
+        return self.variables.setdefault(str(user_id), {})
+
+    @override
+    async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
+        # Environment variables are read on demand
+        return
+
+    @override
+    async def get_variable(self, user_id: UUID | str, name: str, field: str, session: AsyncSession) -> str:
+        variable = self._user_variables(user_id).get(name)
+        if variable is None:
+            value = self.defaults.get(name, os.environ.get(name))
+            if value is None:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+            return value
+
+        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
+        return variable.value
+
+    @override
+    async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
+        return list(self._user_variables(user_id))
+
+    @override
+    async def update_variable(self, user_id: UUID | str, name: str, value: str, session: AsyncSession) -> Variable:
+        variable = self._user_variables(user_id).get(name)
+        if variable is None:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+        variable.value = value
+        variable.updated_at = datetime.now(timezone.utc)
+        return variable
+
+    @override
+    async def delete_variable(self, user_id: UUID | str, name: str, session: AsyncSession) -> None:
+        if self._user_variables(user_id).pop(name, None) is None:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+
+    @override
+    async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
+        variables = self._user_variables(user_id)
+        for name, variable in variables.items():
+            if variable.id == variable_id:
+                del variables[name]
+                return
+        msg = f"{variable_id} variable not found."
+        raise ValueError(msg)
+
+    @override
+    async def create_variable(
+        self,
+        user_id: UUID | str,
+        name: str,
+        value: str,
+        *,
+        default_fields: list[str],
+        type_: str,
+        session: AsyncSession,
+    ) -> Variable:
+        variables = self._user_variables(user_id)
+        if name in variables:
+            msg = f"Variable {name} already exists."
+            raise ValueError(msg)
+        variable = Variable(
+            name=name,
+            value=value,
+            type=type_ if type_ == CREDENTIAL_TYPE else GENERIC_TYPE,
+            default_fields=default_fields,
+            user_id=user_id if isinstance(user_id, UUID) else UUID(user_id),
+            created_at=datetime.now(timezone.utc),
+        )
+        variables[name] = variable
+        return variable
+
+    @override
+    async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
+        return [
+            VariableRead.model_validate(variable, from_attributes=True)
+            for variable in self._user_variables(user_id).values()
+        ]
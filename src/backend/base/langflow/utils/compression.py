@@ -1,9 +1,23 @@
+import asyncio
 import gzip
+import hashlib
 import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
-from fastapi import Response
+import orjson
+from fastapi import Request, Response
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+# Preferred first when the client accepts several encodings with the same weight
+PRECOMPRESSED_ENCODINGS = ("br", "zstd", "gzip")
+# Serialized items are buffered up to this size before being compressed and sent
+STREAM_CHUNK_SIZE = 64 * 1024
+# zlib window bits for a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
 
 
 def compress_response(data: Any) -> Response:
@@ -17,3 +31,177 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+@dataclass
+class PrecompressedPayload:
+    """A JSON body encoded once, with its compressed variants and their strong ETags."""
+
+    etag: str
+    """The ETag of the `identity` body."""
+    bodies: dict[str, bytes] = field(default_factory=dict)
+    """Encoding name (`identity`, `gzip`, `br`, `zstd`) -> body bytes."""
+
+    def etag_for(self, encoding: str) -> str:
+        """The ETag of the body in `encoding`: the bodies differ byte for byte, so a strong ETag is per encoding."""
+        if encoding == "identity":
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+
+def _compress(encoding: str, data: bytes) -> bytes | None:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9)
+    try:
+        if encoding == "br":
+            import brotli
+
+            return brotli.compress(data, quality=9)
+        if encoding == "zstd":
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=10).compress(data)
+    except ImportError:
+        pass
+    return None
+
+
+def build_precompressed_payload(data: Any) -> PrecompressedPayload:
+    """Serialize `data` and compress it with every available encoding.
+
+    Meant for large payloads that change rarely, so high compression levels are used. Brotli and zstd are
+    only produced when the `brotli` and `zstandard` packages are installed.
+    """
+    json_data = json.dumps(jsonable_encoder(data)).encode("utf-8")
+    payload = PrecompressedPayload(etag=f'"{hashlib.sha256(json_data).hexdigest()[:32]}"')
+    payload.bodies["identity"] = json_data
+    for encoding in PRECOMPRESSED_ENCODINGS:
+        if (compressed := _compress(encoding, json_data)) is not None:
+            payload.bodies[encoding] = compressed
+    return payload
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def select_encoding(accept_encoding: str, available: list[str] | tuple[str, ...]) -> str:
+    """Pick the best of the `available` encodings for an `Accept-Encoding` header, or `identity`."""
+    accepted = _accepted_encodings(accept_encoding)
+    best, best_quality = "identity", 0.0
+    for encoding in PRECOMPRESSED_ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+def precompressed_response(payload: PrecompressedPayload, request: Request) -> Response:
+    """Serve `payload` in the best encoding the client accepts, or a 304 if the client's copy is current."""
+    encoding = select_encoding(request.headers.get("accept-encoding", ""), tuple(payload.bodies))
+    headers = {"ETag": payload.etag_for(encoding), "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=payload.bodies[encoding], media_type="application/json", headers=headers)
+
+
+async def _aiter(items: AsyncIterable[Any] | Iterable[Any]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _encode_batch(items: list[Any]) -> bytes:
+    return b",".join(orjson.dumps(jsonable_encoder(item)) for item in items)
+
+
+async def iter_json_array(
+    items: AsyncIterable[Any] | Iterable[Any],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    *,
+    offload_batch_size: int | None = None,
+) -> AsyncIterator[bytes]:
+    """Serialize `items` as a JSON array, one item at a time, in chunks of about `chunk_size` bytes.
+
+    With `offload_batch_size`, items are serialized in batches of that size in a worker thread, off the event loop.
+    """
+    buffer = bytearray(b"[")
+    batch: list[Any] = []
+    first = True
+    async for item in _aiter(items):
+        batch.append(item)
+        if offload_batch_size and len(batch) < offload_batch_size:
+            continue
+        if not first:
+            buffer += b","
+        first = False
+        buffer += await asyncio.to_thread(_encode_batch, batch) if offload_batch_size else _encode_batch(batch)
+        batch = []
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if batch:  # The last, partial batch
+        if not first:
+            buffer += b","
+        buffer += await asyncio.to_thread(_encode_batch, batch)
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+async def gzip_stream(chunks: AsyncIterable[bytes], compresslevel: int = 6) -> AsyncIterator[bytes]:
+    """Compress `chunks` into a single gzip stream, incrementally."""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, GZIP_WBITS)
+    async for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
+
+def streaming_json_response(
+    items: AsyncIterable[Any] | Iterable[Any],
+    request: Request | None = None,
+    *,
+    offload_batch_size: int | None = None,
+) -> Response:
+    """Stream `items` as a JSON array, gzipped unless the client does not accept gzip.
+
+    Unlike `compress_response`, the body is never held in memory as a whole: items are serialized and compressed
+    as they are produced, and sent with chunked transfer encoding. See `iter_json_array` for `offload_batch_size`.
+    """
+    body = iter_json_array(items, offload_batch_size=offload_batch_size)
+    headers = {"Vary": "Accept-Encoding"}
+    if request is None or select_encoding(request.headers.get("accept-encoding", ""), ("gzip",)) == "gzip":
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type="application/json", headers=headers)
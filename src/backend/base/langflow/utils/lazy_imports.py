@@ -0,0 +1,62 @@
+"""Deferred imports of expensive modules.
+
+Packages re-export their public names from submodules that can be expensive to import (pandas, numpy,
+langchain integrations, every component of a category). `lazy_imports` builds a module-level `__getattr__`
+(PEP 562) that imports the submodule defining a name the first time it is accessed, so that importing the
+package, or any one of its submodules, does not import all the others:
+
+    if TYPE_CHECKING:
+        from .data import Data
+
+    _dynamic_imports = {"Data": "data"}
+    __all__ = ["Data"]
+    __getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
+
+`is_instance_of` covers the other common reason to import such a module eagerly: `isinstance` checks.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def lazy_imports(
+    package: str, dynamic_imports: dict[str, str], public_names: list[str] | None = None
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return the `__getattr__` and `__dir__` of `package`, which resolve `dynamic_imports` on first access.
+
+    `dynamic_imports` maps each exported name to the submodule (relative to `package`) that defines it.
+    """
+
+    def __getattr__(attr_name: str) -> Any:  # noqa: N807
+        if (module_name := dynamic_imports.get(attr_name)) is None:
+            msg = f"module '{package}' has no attribute '{attr_name}'"
+            raise AttributeError(msg)
+        try:
+            module = importlib.import_module(f".{module_name}", package)
+        except ModuleNotFoundError as exc:
+            msg = f"Could not import '{attr_name}' from '{package}': {exc}"
+            raise AttributeError(msg) from exc
+        value = getattr(module, attr_name)
+        # Cache on the package, so later lookups do not go through `__getattr__` again
+        setattr(sys.modules[package], attr_name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *(public_names or dynamic_imports)})
+
+    return __getattr__, __dir__
+
+
+def is_instance_of(obj: Any, module_name: str, class_name: str) -> bool:
+    """`isinstance` against a class of an optional, heavy module (e.g. pandas), without importing the module.
+
+    An object can only be an instance of the class if its module was already imported.
+    """
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(obj, getattr(module, class_name))
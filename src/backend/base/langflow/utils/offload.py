@@ -0,0 +1,67 @@
+"""Bulk validation and serialization of database rows off the event loop.
+
+Validating hundreds of rows with large JSON columns (flow data, message content, vertex build artifacts) takes tens
+of milliseconds, during which no other request makes progress. These helpers validate and serialize whole lists
+of rows at once with a `TypeAdapter`, in a worker thread.
+
+The worker thread still holds the GIL while validating, but the interpreter switches back to the event loop every
+few milliseconds (`sys.getswitchinterval`) rather than once the whole list is done.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+T = TypeVar("T")
+
+# Below this number of rows, validation costs less than the hop to a worker thread
+OFFLOAD_MIN_ROWS = 64
+
+
+@cache
+def list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+async def _run(func: Callable[..., T], *args, rows: int, **kwargs) -> T:
+    if rows < OFFLOAD_MIN_ROWS:
+        return func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def _dump_rows(model: type[T], rows: Sequence[Any], *, from_attributes: bool) -> bytes:
+    adapter = list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=from_attributes), by_alias=True)
+
+
+async def rows_json_response(
+    model: type[T],
+    rows: Sequence[Any],
+    *,
+    from_attributes: bool = False,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Validate `rows` as a list of `model` and serialize them to a JSON response, in a worker thread.
+
+    The response is what FastAPI would send for a `list[model]` response model, but it is not validated again on
+    the event loop.
+    """
+    body = await _run(_dump_rows, model, rows, rows=len(rows), from_attributes=from_attributes)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def model_json_response(build: Callable[[], BaseModel], *, rows: int) -> Response:
+    """Build a model from rows already fetched and serialize it to a JSON response, in a worker thread."""
+
+    def dump() -> bytes:
+        return build().model_dump_json(by_alias=True).encode()
+
+    return Response(content=await _run(dump, rows=rows), media_type="application/json")
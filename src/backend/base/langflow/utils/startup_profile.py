@@ -0,0 +1,191 @@
+"""Startup profiling for `langflow run --profile-startup`.
+
+Records the duration of the startup phases, the import time of every module imported while profiling (self and
+cumulative, like `python -X importtime`), and the time spent building each component template, and writes them
+to a JSON report. Only the standard library is imported here, so that the import timer can be installed before
+the rest of Sochflow is imported.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+STARTUP_PROFILE_FILENAME = "startup_profile.json"
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_seconds: float = 0.0
+    cumulative_seconds: float = 0.0
+
+
+class ImportTimer:
+    """A meta path finder that times the execution of every module imported while it is installed.
+
+    The loaders found by the other finders are kept; only their `exec_module` is wrapped on the instance, so
+    modules keep their usual loader. Built-in and frozen modules, whose loaders are shared classes, are skipped.
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[str, ImportRecord] = {}
+        # Cumulative time of the children of each import in progress
+        self._children: list[float] = []
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Any = None, target: ModuleType | None = None) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                self._wrap_loader(spec)
+                return spec
+        return None
+
+    def _wrap_loader(self, spec: ModuleSpec) -> None:
+        loader = spec.loader
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return
+        exec_module = loader.exec_module
+        if getattr(exec_module, "_timed", False):
+            return
+
+        def timed_exec_module(module: ModuleType) -> None:
+            self._children.append(0.0)
+            started_at = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                cumulative = time.perf_counter() - started_at
+                children = self._children.pop()
+                if self._children:
+                    self._children[-1] += cumulative
+                self.records[spec.name] = ImportRecord(spec.name, cumulative - children, cumulative)
+
+        timed_exec_module._timed = True  # type: ignore[attr-defined]
+        # Loaders without an instance dict are not timed
+        with contextlib.suppress(AttributeError):
+            loader.exec_module = timed_exec_module  # type: ignore[method-assign]
+
+
+@dataclass
+class StartupProfiler:
+    started_at: float = field(default_factory=time.perf_counter)
+    phases: list[dict[str, Any]] = field(default_factory=list)
+    components: dict[str, float] = field(default_factory=dict)
+    import_timer: ImportTimer = field(default_factory=ImportTimer)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({"name": name, "seconds": round(time.perf_counter() - started_at, 6)})
+
+    def record_component(self, name: str, seconds: float) -> None:
+        self.components[name] = self.components.get(name, 0.0) + seconds
+
+    def report(self) -> dict[str, Any]:
+        imports = sorted(self.import_timer.records.values(), key=lambda record: record.cumulative_seconds, reverse=True)
+        return {
+            "pid": os.getpid(),
+            "python": platform.python_version(),
+            "total_seconds": round(time.perf_counter() - self.started_at, 6),
+            "phases": self.phases,
+            "imports": [
+                {
+                    "module": record.module,
+                    "self_us": round(record.self_seconds * 1e6),
+                    "cumulative_us": round(record.cumulative_seconds * 1e6),
+                }
+                for record in imports
+            ],
+            "components": [
+                {"name": name, "seconds": round(seconds, 6)}
+                for name, seconds in sorted(self.components.items(), key=lambda item: item[1], reverse=True)
+            ],
+        }
+
+    def write_report(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return path
+
+
+def process_report_path(path: str | Path, workers: int) -> Path:
+    """The report path of this process: with several workers, each worker writes its own report, named after its pid."""
+    path = Path(path)
+    if workers == 1:
+        return path
+    return path.with_name(f"{path.stem}.{os.getpid()}{path.suffix}")
+
+
+_profiler: StartupProfiler | None = None
+
+
+def start_startup_profiling() -> StartupProfiler:
+    """Start profiling the startup, timing the imports from now on. Calling it again returns the same profiler."""
+    global _profiler  # noqa: PLW0603
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        _profiler.import_timer.install()
+    return _profiler
+
+
+def stop_startup_profiling() -> StartupProfiler | None:
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None:
+        profiler.import_timer.uninstall()
+    return profiler
+
+
+def get_startup_profiler() -> StartupProfiler | None:
+    return _profiler
+
+
+@contextlib.contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time a startup phase when profiling; a no-op otherwise."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name):
+        yield
+
+
+@contextlib.contextmanager
+def component_build_timer(name: str) -> Iterator[None]:
+    """Time the template build of a component when profiling; a no-op otherwise."""
+    if _profiler is None:
+        yield
+        return
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profiler.record_component(name, time.perf_counter() - started_at)
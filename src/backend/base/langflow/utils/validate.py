@@ -9,8 +9,6 @@ from langchain_core._api.deprecation import LangChainDeprecationWarning
 from loguru import logger
 from pydantic import ValidationError
 
-from langflow.field_typing.constants import CUSTOM_COMPONENT_SUPPORTED_TYPES, DEFAULT_IMPORT_STRING
-
 
 def add_type_ignores() -> None:
     if not hasattr(ast, "TypeIgnore"):
@@ -191,6 +189,8 @@ def create_class(code, class_name):
         "from langflow.custom import CustomComponent",
     )
 
+    from langflow.field_typing.constants import DEFAULT_IMPORT_STRING
+
     code = DEFAULT_IMPORT_STRING + "\n" + code
     try:
         module = ast.parse(code)
@@ -358,6 +358,8 @@ def get_default_imports(code_string):
         "Dict": dict,
         "Union": Union,
     }
+    from langflow.field_typing.constants import CUSTOM_COMPONENT_SUPPORTED_TYPES
+
     langflow_imports = list(CUSTOM_COMPONENT_SUPPORTED_TYPES.keys())
     necessary_imports = find_names_in_code(code_string, langflow_imports)
     langflow_module = importlib.import_module("langflow.field_typing")
@@ -0,0 +1,121 @@
+"""Streaming ZIP archives, written while their entries are still being read."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+
+# Entries read ahead of the one being written
+ZIP_PREFETCH_ENTRIES = 4
+# Chunks buffered per entry being read ahead
+ZIP_PREFETCH_CHUNKS = 4
+
+_END_OF_ENTRY = object()
+
+
+@dataclass
+class ZipEntry:
+    name: str
+    # Opened only when the entry is about to be read, so that a bounded number of entries are read at once
+    open: Callable[[], AsyncIterable[bytes]]
+    # The size, when known upfront, avoids the ZIP64 extra field on small entries
+    size: int | None = None
+
+
+class _ChunkSink(io.RawIOBase):
+    """A write-only, unseekable file: `ZipFile` then writes the sizes after each entry (in data descriptors)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def _read_entry(entry: ZipEntry, queue: asyncio.Queue) -> None:
+    try:
+        async for chunk in entry.open():
+            await queue.put(chunk)
+    except Exception as exc:  # noqa: BLE001
+        await queue.put(exc)
+    else:
+        await queue.put(_END_OF_ENTRY)
+
+
+async def stream_zip(
+    entries: Iterable[ZipEntry],
+    *,
+    compression: int = zipfile.ZIP_STORED,
+    prefetch_entries: int = ZIP_PREFETCH_ENTRIES,
+    prefetch_chunks: int = ZIP_PREFETCH_CHUNKS,
+) -> AsyncIterator[bytes]:
+    """Write a ZIP archive of `entries`, yielding it chunk by chunk as the entries are read.
+
+    The entries are written in order, while up to `prefetch_entries` of the next ones are read concurrently, each
+    buffering at most `prefetch_chunks` chunks. The memory used is bounded whatever the size of the archive.
+    """
+    entries = list(entries)
+    queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=prefetch_chunks) for _ in entries]
+    tasks: list[asyncio.Task] = []
+
+    def read_ahead(until: int) -> None:
+        while len(tasks) < min(until, len(entries)):
+            index = len(tasks)
+            tasks.append(asyncio.create_task(_read_entry(entries[index], queues[index])))
+
+    sink = _ChunkSink()
+    date_time = time.localtime(time.time())[:6]
+    try:
+        with zipfile.ZipFile(sink, "w", compression=compression) as zip_file:
+            for index, entry in enumerate(entries):
+                read_ahead(index + 1 + prefetch_entries)
+                zinfo = zipfile.ZipInfo(entry.name, date_time=date_time)
+                zinfo.compress_type = compression
+                zinfo.external_attr = 0o600 << 16
+                if entry.size is not None:
+                    zinfo.file_size = entry.size
+                with zip_file.open(zinfo, "w", force_zip64=entry.size is None) as destination:
+                    while (chunk := await queues[index].get()) is not _END_OF_ENTRY:
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        destination.write(chunk)
+                        if data := sink.drain():
+                            yield data
+                if data := sink.drain():
+                    yield data
+        # The central directory
+        yield sink.drain()
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+def zip_streaming_response(entries: Iterable[ZipEntry], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_zip(entries),
+        media_type="application/x-zip-compressed",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
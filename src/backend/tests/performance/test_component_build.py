@@ -0,0 +1,26 @@
+import os
+import time
+
+from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
+from langflow.services.settings.base import BASE_COMPONENTS_PATH
+from loguru import logger
+
+
+async def _timed_build(workers: int):
+    started_at = time.perf_counter()
+    components = await abuild_custom_component_list_from_path(BASE_COMPONENTS_PATH, workers=workers)
+    return components, time.perf_counter() - started_at
+
+
+async def test_build_component_templates_pooled_matches_serial():
+    """Benchmark a full rebuild of the bundled component templates in the server process and across a pool."""
+    workers = max(2, os.cpu_count() or 1)
+    serial, serial_seconds = await _timed_build(workers=0)
+    pooled, pooled_seconds = await _timed_build(workers=workers)
+    logger.info(
+        f"serial: {serial_seconds:.2f}s, pooled ({workers} workers): {pooled_seconds:.2f}s, "
+        f"speedup: {serial_seconds / pooled_seconds:.2f}x"
+    )
+
+    assert "vectorstores" in serial
+    assert pooled == serial
@@ -0,0 +1,52 @@
+"""Time budget of the first embedded run of a flow, measured in a fresh interpreter once langflow is imported.
+
+The budget can be tuned per environment with `LANGFLOW_EMBEDDED_STARTUP_BUDGET_SECONDS`.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+EMBEDDED_STARTUP_BUDGET_SECONDS = float(os.getenv("LANGFLOW_EMBEDDED_STARTUP_BUDGET_SECONDS", "1"))
+
+EMBEDDED_RUN_SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+    import json
+    import time
+    import uuid
+
+    from langflow.services.flow.flow_runner import LangflowRunnerExperimental
+
+
+    async def main():
+        runner = LangflowRunnerExperimental(embedded=True)
+        flow = {"data": {"nodes": [], "edges": []}}
+        start = time.perf_counter()
+        await runner.run(flow=flow, input_value="hello", session_id=str(uuid.uuid4()))
+        print(json.dumps({"seconds": time.perf_counter() - start}))
+
+
+    asyncio.run(main())
+    """
+)
+
+
+def test_embedded_first_run_within_budget(tmp_path):
+    """Run a flow embedded in a new process and fail if setting up the services and running it regressed."""
+    env = {**os.environ, "LANGFLOW_CONFIG_DIR": str(tmp_path)}
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", EMBEDDED_RUN_SCRIPT],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    seconds = json.loads(completed.stdout.strip().splitlines()[-1])["seconds"]
+    assert seconds <= EMBEDDED_STARTUP_BUDGET_SECONDS, (
+        f"the first embedded run took {seconds:.2f}s (budget {EMBEDDED_STARTUP_BUDGET_SECONDS}s)"
+    )
@@ -0,0 +1,42 @@
+"""Import time budget of the core run path (`langflow.load`, used by `run_flow_from_json`).
+
+The budget can be tuned per environment with `LANGFLOW_CORE_IMPORT_BUDGET_SECONDS`.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+CORE_IMPORT_BUDGET_SECONDS = float(os.getenv("LANGFLOW_CORE_IMPORT_BUDGET_SECONDS", "5"))
+
+IMPORT_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import sys
+    import time
+
+    started_at = time.perf_counter()
+    import langflow.load  # noqa: F401
+
+    elapsed = time.perf_counter() - started_at
+    heavy = [module for module in ("pandas", "numpy", "langchain", "langchain_community") if module in sys.modules]
+    print(json.dumps({"seconds": elapsed, "heavy_modules": heavy}))
+    """
+)
+
+
+def test_core_run_path_import_within_budget():
+    """Import `langflow.load` in a fresh interpreter and fail if it got slower than the budget."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True, check=True, timeout=120
+    )
+    measurement = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert "pandas" not in measurement["heavy_modules"], (
+        f"pandas should only be imported when a DataFrame is used, imported: {measurement['heavy_modules']}"
+    )
+    assert measurement["seconds"] <= CORE_IMPORT_BUDGET_SECONDS, (
+        f"importing langflow.load took {measurement['seconds']:.2f}s (budget {CORE_IMPORT_BUDGET_SECONDS}s)"
+    )
@@ -0,0 +1,66 @@
+"""Startup time budget, measured with the `--profile-startup` report of a fresh interpreter.
+
+The budgets can be tuned per environment with `LANGFLOW_STARTUP_BUDGET_SECONDS` (whole startup, imports
+included) and `LANGFLOW_IMPORT_BUDGET_SECONDS` (importing `langflow.main`).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+from loguru import logger
+
+STARTUP_BUDGET_SECONDS = float(os.getenv("LANGFLOW_STARTUP_BUDGET_SECONDS", "60"))
+IMPORT_BUDGET_SECONDS = float(os.getenv("LANGFLOW_IMPORT_BUDGET_SECONDS", "15"))
+
+STARTUP_SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+
+    from langflow.utils.startup_profile import start_startup_profiling
+
+    start_startup_profiling()
+
+    from asgi_lifespan import LifespanManager
+    from langflow.main import create_app
+
+
+    async def main():
+        async with LifespanManager(create_app(), startup_timeout=None, shutdown_timeout=None):
+            pass
+
+
+    asyncio.run(main())
+    """
+)
+
+
+def test_startup_within_budget(tmp_path):
+    """Boot the app in a new process and fail if startup or its imports regressed past the budget."""
+    report_path = tmp_path / "startup_profile.json"
+    env = {
+        **os.environ,
+        "LANGFLOW_DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}",
+        "LANGFLOW_CONFIG_DIR": str(tmp_path),
+        "LANGFLOW_PROFILE_STARTUP": "true",
+        "LANGFLOW_STARTUP_PROFILE_PATH": str(report_path),
+    }
+    subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], env=env, check=True, timeout=STARTUP_BUDGET_SECONDS * 5)  # noqa: S603
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    phases = {phase["name"]: phase["seconds"] for phase in report["phases"]}
+    logger.info(f"startup took {report['total_seconds']:.2f}s, phases: {json.dumps(phases, indent=2)}")
+    logger.info(f"slowest imports: {json.dumps(report['imports'][:20], indent=2)}")
+
+    assert {"initialize_services", "cache_types", "database.migrations"} <= phases.keys()
+    assert report["components"], "component template builds should be part of the report"
+
+    main_import = next(record for record in report["imports"] if record["module"] == "langflow.main")
+    assert main_import["cumulative_us"] / 1e6 <= IMPORT_BUDGET_SECONDS, (
+        f"importing langflow.main took {main_import['cumulative_us'] / 1e6:.2f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+    )
+    assert report["total_seconds"] <= STARTUP_BUDGET_SECONDS, (
+        f"startup took {report['total_seconds']:.2f}s (budget {STARTUP_BUDGET_SECONDS}s)"
+    )
@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
-from langflow.api.utils import get_suggestion_message
+import pytest
+from langflow.api.utils import get_suggestion_message, is_not_modified
 from langflow.services.database.models.flow.utils import get_outdated_components
 from langflow.utils.version import get_version_info
 
@@ -43,3 +44,23 @@ def test_get_outdated_components():
         result = get_outdated_components(flow)
         # Assert the result is as expected
         assert result == expected_outdated_components
+
+
+@pytest.mark.parametrize(
+    ("request_headers", "expected"),
+    [
+        ({}, False),
+        ({"if-none-match": '"abc"'}, True),
+        ({"if-none-match": 'W/"abc", "def"'}, True),
+        ({"if-none-match": "*"}, True),
+        ({"if-none-match": '"def"'}, False),
+        ({"if-modified-since": "Mon, 19 Oct 2026 10:00:00 GMT"}, True),
+        ({"if-modified-since": "Mon, 19 Oct 2026 08:00:00 GMT"}, False),
+        ({"if-modified-since": "not a date"}, False),
+        # If-None-Match takes precedence
+        ({"if-none-match": '"def"', "if-modified-since": "Mon, 19 Oct 2026 10:00:00 GMT"}, False),
+    ],
+)
+def test_is_not_modified(request_headers, expected):
+    response_headers = {"etag": '"abc"', "last-modified": "Mon, 19 Oct 2026 09:00:00 GMT"}
+    assert is_not_modified(request_headers, response_headers) is expected
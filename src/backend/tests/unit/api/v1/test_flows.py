@@ -1,6 +1,7 @@
 import tempfile
 import uuid
 
+import orjson
 from anyio import Path
 from fastapi import status
 from httpx import AsyncClient
@@ -185,6 +186,44 @@ async def test_create_flows(client: AsyncClient, logged_in_headers):
     assert len(result) == amount_flows, "The result must have the same amount of flows"
 
 
+async def test_create_flows_resolves_collisions_in_bulk(client: AsyncClient, logged_in_headers):
+    name = f"bulk {uuid.uuid4()}"
+    endpoint_name = f"bulk-{uuid.uuid4()}"
+    flows = [{"name": name, "endpoint_name": endpoint_name, "data": {}} for _ in range(3)]
+
+    response = await client.post("api/v1/flows/batch/", json={"flows": flows}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [flow["name"] for flow in response.json()] == [name, f"{name} (1)", f"{name} (2)"]
+    assert [flow["endpoint_name"] for flow in response.json()] == [
+        endpoint_name,
+        f"{endpoint_name}-1",
+        f"{endpoint_name}-2",
+    ]
+
+    # Collisions with the flows already stored are resolved too
+    response = await client.post("api/v1/flows/batch/", json={"flows": flows[:1]}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()[0]["name"] == f"{name} (3)"
+    assert response.json()[0]["endpoint_name"] == f"{endpoint_name}-3"
+
+
+async def test_import_flows_streams_progress(client: AsyncClient, logged_in_headers):
+    name = f"imported {uuid.uuid4()}"
+    flows = [{"name": f"{name} {index}", "data": {}} for index in range(3)]
+
+    response = await client.post(
+        "api/v1/flows/import/",
+        files={"file": ("flows.json", orjson.dumps({"flows": flows}), "application/json")},
+        headers=logged_in_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    events = [orjson.loads(line) for line in response.text.splitlines()]
+
+    assert events[0] == {"event": "progress", "data": {"imported": 3, "total": 3}}
+    assert events[-1]["event"] == "end"
+    assert [flow["name"] for flow in events[-1]["data"]["flows"]] == [flow["name"] for flow in flows]
+
+
 async def test_read_basic_examples(client: AsyncClient, logged_in_headers):
     response = await client.get("api/v1/flows/basic_examples/", headers=logged_in_headers)
     result = response.json()
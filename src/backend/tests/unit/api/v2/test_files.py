@@ -87,6 +87,13 @@ def max_file_size_upload_10mb_fixture(monkeypatch):
     monkeypatch.undo()
 
 
+@pytest.fixture
+def content_addressed_storage_fixture(monkeypatch):
+    monkeypatch.setenv("LANGFLOW_CONTENT_ADDRESSED_STORAGE", "true")
+    yield
+    monkeypatch.undo()
+
+
 @pytest.fixture(name="files_client")
 async def files_client_fixture(
     monkeypatch,
@@ -156,6 +163,69 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_file_range(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("test.txt", b"test content")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_id = response.json()["id"]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=5-"})
+    assert response.status_code == 206
+    assert response.content == b"content"
+    assert response.headers["content-range"] == "bytes 5-11/12"
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=20-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */12"
+
+
+async def test_download_file_conditional_get(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("test.txt", b"test content")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_id = response.json()["id"]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["last-modified"]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+async def test_upload_same_content_is_stored_once(
+    content_addressed_storage_fixture,  # noqa: ARG001
+    files_client,
+    files_created_api_key,
+):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    uploads = []
+    for name in ("first.txt", "second.txt"):
+        response = await files_client.post("api/v2/files", files={"file": (name, b"same content")}, headers=headers)
+        assert response.status_code == 201
+        uploads.append(response.json())
+
+    assert uploads[0]["path"] == uploads[1]["path"]
+    assert uploads[0]["path"].startswith("blobs/")
+
+    # The blob is kept as long as a file references it
+    response = await files_client.delete(f"api/v2/files/{uploads[0]['id']}", headers=headers)
+    assert response.status_code == 200
+    response = await files_client.get(f"api/v2/files/{uploads[1]['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.content == b"same content"
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
@@ -0,0 +1,40 @@
+from langchain_core.embeddings import Embeddings
+from langflow.base.embeddings.cache import CachedEmbeddings, EmbeddingStore, embedding_model_id
+
+
+class CountingEmbeddings(Embeddings):
+    model = "counting-v1"
+
+    def __init__(self):
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return [float(len(text)), 1.5]
+
+
+def test_only_cache_misses_reach_the_model(tmp_path):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EmbeddingStore(tmp_path / "cache.db"))
+
+    assert embeddings.embed_documents(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    assert embeddings.embed_documents(["bb ", "ccc", "ccc", "a"]) == [[2.0, 0.5], [3.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+    assert model.embedded == ["a", "bb", "ccc"]
+
+
+async def test_queries_are_cached_separately_from_documents(tmp_path):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EmbeddingStore(tmp_path / "cache.db"))
+
+    await embeddings.aembed_documents(["a"])
+    assert await embeddings.aembed_query("a") == [1.0, 1.5]
+    assert await embeddings.aembed_query("a") == [1.0, 1.5]
+    assert model.embedded == ["a", "a"]
+
+
+def test_model_id_includes_model_name():
+    assert embedding_model_id(CountingEmbeddings()).endswith("CountingEmbeddings;model=counting-v1")
@@ -0,0 +1,80 @@
+from textwrap import dedent
+
+from langflow.custom.directory_reader.manifest import (
+    TEMPLATE_SOURCE_PACKAGES,
+    ComponentTemplateManifest,
+    sources_fingerprint,
+)
+from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
+
+COMPONENT_CODE = dedent(
+    """
+    from langflow.custom import Component
+    from langflow.io import MessageTextInput, Output
+    from langflow.schema.message import Message
+
+
+    class EchoComponent(Component):
+        display_name = "{display_name}"
+        inputs = [MessageTextInput(name="text", display_name="Text")]
+        outputs = [Output(display_name="Message", name="message", method="echo")]
+
+        def echo(self) -> Message:
+            return Message(text=self.text)
+    """
+)
+
+
+async def test_manifest_only_rebuilds_changed_files(tmp_path):
+    components_dir = tmp_path / "components" / "custom"
+    components_dir.mkdir(parents=True)
+    component_file = components_dir / "echo.py"
+    component_file.write_text(COMPONENT_CODE.format(display_name="Echo"))
+    manifest_path = tmp_path / "manifest.pkl"
+
+    manifest = ComponentTemplateManifest(manifest_path, version="test")
+    first = await abuild_custom_component_list_from_path(str(tmp_path / "components"), manifest)
+    manifest.save()
+    assert (manifest.hits, manifest.misses) == (0, 1)
+
+    manifest = ComponentTemplateManifest(manifest_path, version="test").load()
+    second = await abuild_custom_component_list_from_path(str(tmp_path / "components"), manifest)
+    assert (manifest.hits, manifest.misses) == (1, 0)
+    assert second == first
+
+    component_file.write_text(COMPONENT_CODE.format(display_name="Echo 2"))
+    manifest = ComponentTemplateManifest(manifest_path, version="test").load()
+    third = await abuild_custom_component_list_from_path(str(tmp_path / "components"), manifest)
+    assert (manifest.hits, manifest.misses) == (0, 1)
+    assert third["custom"]["EchoComponent"]["display_name"] == "Echo 2"
+
+
+def test_manifest_is_discarded_for_another_version(tmp_path):
+    manifest = ComponentTemplateManifest(tmp_path / "manifest.pkl", version="1.0")
+    manifest.put("a.py", "hash", valid=[], invalid=[])
+    manifest.save()
+
+    assert ComponentTemplateManifest(tmp_path / "manifest.pkl", version="1.0").load().files
+    assert not ComponentTemplateManifest(tmp_path / "manifest.pkl", version="2.0").load().files
+
+
+def test_manifest_does_not_store_invalid_components(tmp_path):
+    manifest = ComponentTemplateManifest(tmp_path / "manifest.pkl", version="1.0")
+    manifest.put("a.py", "hash", valid=[], invalid=[("Broken", {"error": "No module named 'optional'"}, {})])
+
+    assert manifest.get("a.py", "hash") is None
+
+
+def test_sources_fingerprint_changes_with_the_template_base_classes(tmp_path):
+    for package in TEMPLATE_SOURCE_PACKAGES:
+        (tmp_path / package).mkdir()
+    inputs_file = tmp_path / "inputs" / "inputs.py"
+    inputs_file.write_text("class MessageTextInput: ...\n")
+    (tmp_path / "components").mkdir()
+    fingerprint = sources_fingerprint(tmp_path)
+
+    (tmp_path / "components" / "echo.py").write_text("# components are tracked by their own content hash\n")
+    assert sources_fingerprint(tmp_path) == fingerprint
+
+    inputs_file.write_text("class MessageTextInput:\n    advanced = True\n")
+    assert sources_fingerprint(tmp_path) != fingerprint
@@ -0,0 +1,54 @@
+from textwrap import dedent
+
+from langflow.custom.directory_reader.static_index import build_stub_template, component_key, extract_component_index
+
+CODE = dedent(
+    """
+    from langflow.base.models.model import LCModelComponent
+    from langflow.io import DropdownInput, MessageTextInput, Output
+
+    MODELS = ["a", "b"]
+
+
+    class EchoModelComponent(LCModelComponent):
+        display_name = "Echo Model"
+        description = "Repeats its input."
+        icon = "Echo"
+        name = "EchoModel"
+
+        inputs = [
+            *LCModelComponent._base_inputs,
+            MessageTextInput(name="prefix", display_name="Prefix", advanced=True),
+            DropdownInput(name="model", display_name="Model", options=MODELS),
+        ]
+        outputs = [Output(display_name="Text", name="text", method="echo")]
+
+        def echo(self):
+            raise RuntimeError("never executed")
+    """
+)
+
+
+def test_extracts_literal_metadata_without_executing_the_module():
+    index = extract_component_index(CODE)
+
+    assert component_key(index) == "EchoModel"
+    assert index["display_name"] == "Echo Model"
+    assert index["inputs"] == [
+        {"name": "prefix", "display_name": "Prefix", "advanced": True, "_input_type": "MessageTextInput"},
+        {"name": "model", "display_name": "Model", "_input_type": "DropdownInput"},
+    ]
+    assert index["outputs"] == [{"display_name": "Text", "name": "text", "method": "echo"}]
+
+
+def test_stub_template_is_marked_lazy_and_keeps_the_code():
+    stub = build_stub_template(extract_component_index(CODE), CODE)
+
+    assert stub["lazy_loaded"] is True
+    assert stub["template"]["code"]["value"] == CODE
+    assert set(stub["template"]) == {"_type", "code", "prefix", "model"}
+
+
+def test_files_without_a_component_class_are_not_indexed():
+    assert extract_component_index("def helper():\n    return 1\n") is None
+    assert extract_component_index("class Broken(:\n") is None
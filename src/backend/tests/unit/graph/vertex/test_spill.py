@@ -0,0 +1,95 @@
+import gc
+import pickle
+
+import pytest
+from langflow.graph.schema import ResultData
+from langflow.graph.vertex.spill import ResultSpillManager, SpilledResult, load_spilled, truncate_rows
+from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame
+from langflow.serialization import serialize
+from langflow.serialization.constants import MAX_ITEMS_LENGTH
+
+
+@pytest.fixture
+def manager():
+    manager = ResultSpillManager(threshold=1024)
+    yield manager
+    manager.cleanup()
+
+
+def test_spilling_is_disabled_without_threshold():
+    manager = ResultSpillManager()
+    frame = DataFrame({"text": ["a" * 10_000]})
+    assert manager.maybe_spill(frame) is frame
+
+
+def test_outputs_within_budget_stay_in_memory(manager):
+    frame = DataFrame({"text": ["a"]})
+    assert manager.maybe_spill(frame) is frame
+    assert manager.in_memory_bytes > 0
+
+
+async def test_dataframe_over_budget_is_spilled_and_reloaded(manager):
+    frame = DataFrame({"text": [f"row {i}" for i in range(1000)], "value": list(range(1000))})
+    handle = manager.maybe_spill(frame)
+
+    assert isinstance(handle, SpilledResult)
+    assert handle.path.exists()
+    assert len(handle.preview) <= 100
+
+    loaded = await load_spilled(handle)
+    assert isinstance(loaded, DataFrame)
+    assert loaded.text_key == "text"
+    assert loaded["value"].tolist() == list(range(1000))
+
+
+async def test_data_list_is_spilled_and_cleaned_up(manager):
+    data = [Data(data={"text": "x" * 100, "index": i}) for i in range(100)]
+    handle = manager.maybe_spill(data)
+    assert isinstance(handle, SpilledResult)
+
+    loaded = await load_spilled(handle)
+    assert [item.data["index"] for item in loaded] == list(range(100))
+
+    manager.cleanup()
+    assert not handle.path.exists()
+    with pytest.raises(ValueError, match="no longer available"):
+        handle.load()
+
+
+async def test_spilled_files_outlive_the_run_while_referenced(manager):
+    data = [Data(data={"text": "x" * 100, "index": i}) for i in range(100)]
+    handle = manager.maybe_spill(data)
+    directory = handle.path.parent
+    manager.end_run()
+
+    assert manager.in_memory_bytes == 0
+    loaded = await load_spilled(pickle.loads(pickle.dumps(handle)))  # noqa: S301
+    assert len(loaded) == 100
+
+    del handle
+    gc.collect()
+    assert not directory.exists()
+
+
+def test_spilled_output_round_trips_through_the_results(manager):
+    data = [Data(data={"text": "x" * 100, "index": i}) for i in range(250)]
+    handle = manager.maybe_spill(data)
+    assert handle.rows == 250
+
+    # /run serializes the results without limits, so the whole output is read back
+    results = ResultData(results={"data": handle}).model_dump()["results"]
+    assert len(results["data"]) == 250
+    assert all(isinstance(item, dict) for item in results["data"])
+
+    # The UI asks for the preview rows only, and is told how many are left out
+    preview = serialize(handle, max_items=MAX_ITEMS_LENGTH)
+    assert len(preview) == MAX_ITEMS_LENGTH + 1
+    assert preview[-1] == f"... [truncated {250 - MAX_ITEMS_LENGTH} items]"
+
+
+def test_truncate_rows_keeps_the_preview_rows():
+    rows = [{"index": i} for i in range(150)]
+    assert truncate_rows(rows) == [*rows[:MAX_ITEMS_LENGTH], "... [truncated 50 items]"]
+    assert truncate_rows(rows[:10]) == rows[:10]
+    assert truncate_rows("text") == "text"
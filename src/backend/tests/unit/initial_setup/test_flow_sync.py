@@ -0,0 +1,50 @@
+import asyncio
+import os
+from uuid import uuid4
+
+from langflow.initial_setup.flow_sync import FlowFileIndex, normalize_flow_path
+
+
+async def test_track_moves_flow_to_its_new_path(tmp_path):
+    index = FlowFileIndex()
+    flow_id = uuid4()
+    old_path, new_path = tmp_path / "old.json", tmp_path / "new.json"
+
+    index.track(flow_id, str(old_path))
+    assert index.changed.is_set()
+    index.changed.clear()
+    index.track(flow_id, str(old_path))
+    assert not index.changed.is_set()
+
+    index.track(flow_id, str(new_path))
+    assert index.flow_ids == {normalize_flow_path(str(new_path)): flow_id}
+    assert index.directories() == {str(tmp_path.resolve())}
+
+
+async def test_modified_paths_only_reports_files_changed_since_last_sync(tmp_path):
+    index = FlowFileIndex()
+    synced, changed, missing = tmp_path / "synced.json", tmp_path / "changed.json", tmp_path / "missing.json"
+    for path in (synced, changed, missing):
+        index.track(uuid4(), str(path))
+    synced.write_text("{}")
+    changed.write_text("{}")
+    index.mtimes[normalize_flow_path(str(synced))] = synced.stat().st_mtime
+    index.mtimes[normalize_flow_path(str(changed))] = changed.stat().st_mtime - 10
+
+    assert await index.modified_paths() == [normalize_flow_path(str(changed))]
+    assert await index.modified_paths([str(tmp_path / "untracked.json")]) == []
+
+    os.utime(synced, (synced.stat().st_atime, synced.stat().st_mtime + 10))
+    assert normalize_flow_path(str(synced)) in await index.modified_paths()
+
+
+def test_changed_event_belongs_to_the_running_loop(tmp_path):
+    index = FlowFileIndex()
+    index.track(uuid4(), str(tmp_path / "a.json"))
+
+    async def track_and_wait(name: str) -> None:
+        index.track(uuid4(), str(tmp_path / name))
+        await asyncio.wait_for(index.changed.wait(), timeout=1)
+
+    asyncio.run(track_and_wait("b.json"))
+    asyncio.run(track_and_wait("c.json"))
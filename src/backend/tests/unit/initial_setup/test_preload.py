@@ -0,0 +1,87 @@
+import threading
+
+from langflow.initial_setup.preload import (
+    LEADER_LOCK_FILENAME,
+    apreload,
+    is_preloaded,
+    preload_state,
+    startup_leader_lock,
+)
+from langflow.main import get_lifespan
+from langflow.services.deps import get_telemetry_service
+from langflow.services.manager import service_manager
+from langflow.services.telemetry.service import TelemetryService
+
+
+def test_is_preloaded_reflects_preload_state(monkeypatch):
+    assert is_preloaded() is False
+    monkeypatch.setattr(preload_state, "done", True)
+    assert is_preloaded() is True
+
+
+def test_startup_leader_lock_serializes_holders(tmp_path):
+    events = []
+
+    def hold_lock(name):
+        with startup_leader_lock(str(tmp_path)):
+            events.append(f"{name}-enter")
+            events.append(f"{name}-exit")
+
+    with startup_leader_lock(str(tmp_path)):
+        other = threading.Thread(target=hold_lock, args=("other",))
+        other.start()
+        other.join(timeout=0.2)
+        # The second holder waits until the first one releases the lock
+        assert other.is_alive()
+        events.append("first-exit")
+    other.join()
+
+    assert events == ["first-exit", "other-enter", "other-exit"]
+    assert (tmp_path / LEADER_LOCK_FILENAME).exists()
+
+
+def test_startup_leader_lock_without_config_dir():
+    with startup_leader_lock(None):
+        pass
+
+
+async def test_lifespan_after_preload_starts_a_live_telemetry_service(monkeypatch, tmp_path):
+    async def noop(*args, **kwargs):  # noqa: ARG001
+        return None
+
+    async def no_bundles():
+        return [], []
+
+    async def no_types(*args, **kwargs):  # noqa: ARG001
+        return {}
+
+    monkeypatch.setenv("LANGFLOW_DATABASE_URL", f"sqlite:///{tmp_path}/test.db")
+    monkeypatch.setenv("LANGFLOW_CONFIG_DIR", str(tmp_path))
+    monkeypatch.setenv("LANGFLOW_DO_NOT_TRACK", "false")
+    monkeypatch.setenv("DO_NOT_TRACK", "false")
+    monkeypatch.setattr(preload_state, "done", False)
+    # Keep the startup to the service lifecycle under test
+    for target in [
+        "langflow.initial_setup.setup.initialize_super_user_if_needed",
+        "langflow.initial_setup.setup.create_or_update_starter_projects",
+        "langflow.initial_setup.setup.load_flows_from_directory",
+        "langflow.main.init_mcp_servers",
+        "langflow.main.sync_flows_from_fs",
+    ]:
+        monkeypatch.setattr(target, noop)
+    monkeypatch.setattr("langflow.main.load_bundles_with_error_handling", no_bundles)
+    monkeypatch.setattr("langflow.interface.components.get_and_cache_all_types_dict", no_types)
+    monkeypatch.setattr("langflow.main.get_and_cache_all_types_dict", no_types)
+    monkeypatch.setattr(TelemetryService, "log_package_version", noop)
+    service_manager.factories.clear()
+    service_manager.services.clear()
+
+    # Gunicorn loads the app, and so builds its lifespan, in the master before the preload hook runs
+    lifespan = get_lifespan()
+    master_telemetry_service = get_telemetry_service()
+    await apreload()
+
+    async with lifespan(None):
+        telemetry_service = get_telemetry_service()
+        assert telemetry_service is not master_telemetry_service
+        assert telemetry_service.running
@@ -0,0 +1,94 @@
+import sys
+
+import pytest
+from langflow.services.cache.metrics import CacheNamespace, cache_namespace, estimate_size, get_cache_metrics
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.shared_component_cache.service import SharedComponentCacheService
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_cache_metrics().reset()
+    yield
+    get_cache_metrics().reset()
+
+
+def test_threading_cache_records_hits_misses_and_evictions():
+    cache = ThreadingInMemoryCache(max_size=1)
+    with cache_namespace(CacheNamespace.SESSIONS):
+        cache.set("a", b"12345")
+        assert cache.get("a") == b"12345"
+        cache.get("missing")
+        cache.set("b", b"1")
+
+    stats = get_cache_metrics().snapshot()["cache_service"]["sessions"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["sets"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes_stored"] == 1
+    assert stats["get_latency_seconds"]["count"] == 2
+
+
+async def test_async_cache_uses_default_namespace_and_tracks_deletes():
+    cache = AsyncInMemoryCache()
+    await cache.set("a", "value")
+    await cache.set("a", "other")
+    await cache.delete("a")
+
+    stats = get_cache_metrics().snapshot()["cache_service"][CacheNamespace.DEFAULT.value]
+    assert stats["sets"] == 2
+    assert stats["deletes"] == 1
+    assert stats["bytes_stored"] == 0
+
+
+def test_shared_component_cache_reports_its_own_namespace():
+    cache = SharedComponentCacheService()
+    cache.get("missing")
+
+    snapshot = get_cache_metrics().snapshot()
+    assert snapshot["shared_component_cache_service"][CacheNamespace.SHARED_COMPONENT.value]["misses"] == 1
+
+
+def test_live_objects_are_sized_and_exporter_survives_errors():
+    class FlakyExporter:
+        calls = 0
+
+        def increment_counter(self, *_args, **_kwargs):
+            self.calls += 1
+            msg = "exporter down"
+            raise RuntimeError(msg)
+
+        observe_histogram = update_gauge = increment_counter
+
+    exporter = FlakyExporter()
+    get_cache_metrics().attach_exporter(exporter)
+    try:
+        cache = ThreadingInMemoryCache()
+        cache.set("graph", {"nodes": list(range(1000))})
+        cache.get("graph")
+    finally:
+        get_cache_metrics().attach_exporter(None)
+
+    stats = get_cache_metrics().snapshot()["cache_service"][CacheNamespace.DEFAULT.value]
+    # The list and its integers are counted, not only the outer dict
+    assert stats["bytes_stored"] > sys.getsizeof(list(range(1000)))
+    assert exporter.calls > 2
+
+
+def test_estimate_size_is_bounded_and_handles_cycles():
+    node: dict = {"payload": "x" * 100}
+    node["self"] = node
+    assert estimate_size(node) >= sys.getsizeof("x" * 100)
+    assert estimate_size([[[1.5]]], max_depth=0) == sys.getsizeof([[[1.5]]])
+
+
+async def test_upsert_is_not_counted_as_a_lookup():
+    cache = AsyncInMemoryCache()
+    await cache.upsert("a", {"first": 1})
+    await cache.upsert("a", {"second": 2})
+
+    assert await cache.get("a") == {"first": 1, "second": 2}
+    stats = get_cache_metrics().snapshot()["cache_service"][CacheNamespace.DEFAULT.value]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 0
@@ -0,0 +1,46 @@
+import pytest
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.flow.utils import select_flow_headers, to_flow_header, without_flow_data
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+COMPONENT_DATA = {"nodes": [{"id": "node"}], "edges": []}
+FLOW_DATA = {"nodes": [{"id": "a"}, {"id": "b"}], "edges": []}
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as setup_session:
+        setup_session.add(Flow(name="component", data=COMPONENT_DATA, is_component=True))
+        setup_session.add(Flow(name="flow", data=FLOW_DATA, is_component=False))
+        setup_session.add(Flow(name="legacy component", data=COMPONENT_DATA, is_component=None))
+        await setup_session.commit()
+    # A new session, so that the flows are not already loaded
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+async def test_select_flow_headers_only_reads_data_of_components(session):
+    rows = (await session.exec(select_flow_headers().order_by(Flow.name))).all()
+    headers = {header.name: header for header in map(to_flow_header, rows)}
+
+    assert headers["component"].data == COMPONENT_DATA
+    assert headers["flow"].data is None
+    assert headers["flow"].is_component is False
+    # Flows that predate `is_component` are classified from their data
+    assert headers["legacy component"].is_component is True
+
+
+async def test_without_flow_data_defers_data(session):
+    flows = (await session.exec(without_flow_data(select(Flow).where(Flow.name == "flow")))).all()
+
+    assert flows[0].name == "flow"
+    with pytest.raises(InvalidRequestError):
+        _ = flows[0].data
@@ -0,0 +1,59 @@
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.deps import get_settings_service
+from langflow.services.flow.embedded import IN_MEMORY_DATABASE_URL, InMemoryDatabaseService
+from langflow.services.variable.constants import CREDENTIAL_TYPE
+from langflow.services.variable.memory import InMemoryVariableService
+from sqlmodel import select
+
+
+@pytest.fixture
+async def database_service():
+    service = InMemoryDatabaseService(get_settings_service())
+    await service.create_db_and_tables()
+    yield service
+    await service.engine.dispose()
+
+
+async def test_in_memory_database_is_shared_by_sessions(database_service):
+    assert database_service.database_url == IN_MEMORY_DATABASE_URL
+    message = MessageTable(text="hello", sender="User", sender_name="User", session_id="session")
+
+    async with database_service.with_session() as session:
+        session.add(message)
+        await session.commit()
+    async with database_service.with_session() as session:
+        stored = (await session.exec(select(MessageTable))).all()
+
+    assert [stored_message.text for stored_message in stored] == ["hello"]
+
+
+async def test_in_memory_variables_fall_back_to_defaults_and_environment(monkeypatch):
+    monkeypatch.setenv("EMBEDDED_TEST_VARIABLE", "from-env")
+    service = InMemoryVariableService(get_settings_service(), variables={"GIVEN": "given"})
+    user_id = uuid4()
+
+    assert await service.get_variable(user_id, "GIVEN", "api_key", session=None) == "given"
+    assert await service.get_variable(user_id, "EMBEDDED_TEST_VARIABLE", "api_key", session=None) == "from-env"
+    with pytest.raises(ValueError, match="variable not found"):
+        await service.get_variable(user_id, "MISSING_EMBEDDED_VARIABLE", "api_key", session=None)
+
+
+async def test_in_memory_variables_crud():
+    service = InMemoryVariableService(get_settings_service())
+    user_id = uuid4()
+
+    await service.create_variable(user_id, "KEY", "secret", default_fields=[], type_=CREDENTIAL_TYPE, session=None)
+    assert await service.get_variable(user_id, "KEY", "api_key", session=None) == "secret"
+    with pytest.raises(TypeError):
+        await service.get_variable(user_id, "KEY", "session_id", session=None)
+
+    await service.update_variable(user_id, "KEY", "rotated", session=None)
+    assert await service.get_variable(user_id, "KEY", "api_key", session=None) == "rotated"
+    assert await service.list_variables(user_id, session=None) == ["KEY"]
+    assert await service.list_variables(uuid4(), session=None) == []
+
+    await service.delete_variable(user_id, "KEY", session=None)
+    assert await service.list_variables(user_id, session=None) == []
@@ -82,3 +82,18 @@ async def test_initialize_database(flow_runner):
     flow_runner.should_initialize_db = True
     await flow_runner.init_db_if_needed()
     assert not flow_runner.should_initialize_db
+
+
+@pytest.mark.asyncio
+async def test_embedded_run_does_not_store_the_flow(sample_flow_dict, monkeypatch):
+    """Embedded runs build the graph from the dict, without storing the flow or clearing the cache."""
+    flow_runner = LangflowRunnerExperimental(embedded=True)
+
+    async def fail(*_args, **_kwargs):
+        pytest.fail("embedded runs must not store the flow or clear the flow state")
+
+    monkeypatch.setattr(flow_runner, "add_flow_to_db", fail)
+    monkeypatch.setattr(flow_runner, "clear_flow_state", fail)
+
+    result = await flow_runner.run(flow=sample_flow_dict, input_value="test input", session_id=str(uuid4()))
+    assert result is not None
@@ -0,0 +1,64 @@
+import pytest
+from langchain_core.outputs import Generation
+from langflow.services.cache.metrics import CacheNamespace, get_cache_metrics
+from langflow.services.llm_cache.backends import InMemoryLLMCacheBackend, SQLiteLLMCacheBackend
+from langflow.services.llm_cache.service import LangflowLLMCache, build_cache_key
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        backend = SQLiteLLMCacheBackend(tmp_path / "llm_cache.db", max_bytes=64)
+    else:
+        backend = InMemoryLLMCacheBackend(max_bytes=64)
+    yield backend
+    backend.close()
+
+
+def test_backend_evicts_least_recently_used_entries_over_byte_limit(backend):
+    backend.set("a", b"x" * 30)
+    backend.set("b", b"y" * 30)
+    assert backend.get("a") == b"x" * 30
+    backend.set("c", b"z" * 30)
+
+    assert backend.get("a") == b"x" * 30
+    assert backend.get("b") is None
+    assert backend.get("c") == b"z" * 30
+
+
+def test_backend_expires_entries(monkeypatch):
+    backend = InMemoryLLMCacheBackend(ttl=10)
+    backend.set("a", b"value")
+    monkeypatch.setattr("langflow.services.llm_cache.backends.time.time", lambda: 10**12)
+    assert backend.get("a") is None
+
+
+def test_cache_key_ignores_trailing_whitespace_and_isolates_namespaces():
+    assert build_cache_key("flow", "llm", "hello  \nworld\n") == build_cache_key("flow", "llm", "hello\nworld")
+    assert build_cache_key("flow", "llm", "hello") != build_cache_key("other", "llm", "hello")
+    assert build_cache_key("flow", "llm", "hello") != build_cache_key("flow", "llm-2", "hello")
+
+
+def test_langchain_cache_clear_only_removes_its_namespace(backend):
+    flow = LangflowLLMCache(backend, cache_namespace="flow")
+    other = LangflowLLMCache(backend, cache_namespace="other")
+    flow.update("prompt", "llm", [Generation(text="a")])
+    other.update("prompt", "llm", [Generation(text="b")])
+
+    flow.clear()
+
+    assert flow.lookup("prompt", "llm") is None
+    assert other.lookup("prompt", "llm") == [Generation(text="b")]
+
+
+def test_langchain_cache_round_trip_records_hit_ratio():
+    get_cache_metrics().reset()
+    cache = LangflowLLMCache(InMemoryLLMCacheBackend(), cache_namespace="flow")
+
+    assert cache.lookup("prompt", "llm") is None
+    cache.update("prompt", "llm", [Generation(text="answer")])
+    assert cache.lookup("prompt", "llm") == [Generation(text="answer")]
+
+    stats = get_cache_metrics().snapshot()["llm_cache_service"][CacheNamespace.LLM_RESPONSES.value]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
@@ -0,0 +1,92 @@
+from langchain_core.embeddings import Embeddings
+from langchain_core.outputs import Generation
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.llm_cache.backends import InMemoryLLMCacheBackend
+from langflow.services.llm_cache.semantic import SemanticIndex, SemanticLLMCache
+from langflow.services.llm_cache.service import LangflowLLMCache
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds text as counts of a few keywords so that similarity is predictable."""
+
+    keywords = ("weather", "paris", "london", "stock")
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        lowered = text.lower()
+        return [float(lowered.count(keyword)) + 0.01 for keyword in self.keywords]
+
+
+def make_cache(indexes=None, backend=None, **kwargs):
+    exact = LangflowLLMCache(
+        backend or InMemoryLLMCacheBackend(), cache_namespace=kwargs.get("cache_namespace", "flow")
+    )
+    return SemanticLLMCache(exact, KeywordEmbeddings(), {} if indexes is None else indexes, **kwargs)
+
+
+def test_index_returns_closest_entry_above_threshold():
+    index = SemanticIndex()
+    index.add([1.0, 0.0], "x")
+    index.add([0.0, 1.0], "y")
+
+    assert index.search([0.9, 0.1], threshold=0.9) == "x"
+    assert index.search([1.0, 1.0], threshold=0.9) is CACHE_MISS
+
+
+def test_index_evicts_least_recently_used_entry():
+    index = SemanticIndex(max_entries=2)
+    index.add([1.0, 0.0, 0.0], "x")
+    index.add([0.0, 1.0, 0.0], "y")
+    assert index.search([1.0, 0.0, 0.0], threshold=0.99) == "x"
+    index.add([0.0, 0.0, 1.0], "z")
+
+    assert len(index) == 2
+    assert index.search([0.0, 1.0, 0.0], threshold=0.99) is CACHE_MISS
+    assert index.search([1.0, 0.0, 0.0], threshold=0.99) == "x"
+
+
+def test_semantic_cache_reuses_response_for_similar_prompt():
+    cache = make_cache(threshold=0.9)
+    cache.update("What is the weather in Paris?", "llm", [Generation(text="Sunny")])
+
+    assert cache.lookup("Tell me the weather in Paris today", "llm") == [Generation(text="Sunny")]
+    assert cache.lookup("What is the weather in London?", "llm") is None
+    assert cache.lookup("Tell me the weather in Paris today", "other-llm") is None
+
+
+def test_semantic_cache_isolates_namespaces():
+    indexes: dict[str, SemanticIndex] = {}
+    make_cache(indexes, cache_namespace="flow-a").update("weather in paris", "llm", [Generation(text="Sunny")])
+
+    assert make_cache(indexes, cache_namespace="flow-b").lookup("paris weather", "llm") is None
+    assert make_cache(indexes, cache_namespace="flow-a").lookup("paris weather", "llm") == [Generation(text="Sunny")]
+
+
+def test_semantic_cache_clear_only_removes_its_namespace():
+    indexes: dict[str, SemanticIndex] = {}
+    backend = InMemoryLLMCacheBackend()
+    flow_a = make_cache(indexes, backend, cache_namespace="flow-a")
+    flow_b = make_cache(indexes, backend, cache_namespace="flow-b")
+    flow_a.update("weather in paris", "llm", [Generation(text="Sunny")])
+    flow_b.update("weather in paris", "llm", [Generation(text="Rainy")])
+
+    flow_a.clear()
+
+    assert flow_a.lookup("weather in paris", "llm") is None
+    assert flow_b.lookup("weather in paris", "llm") == [Generation(text="Rainy")]
+    assert flow_b.lookup("paris weather", "llm") == [Generation(text="Rainy")]
+
+
+def test_semantic_cache_embeds_a_missed_prompt_once():
+    cache = make_cache(threshold=0.9)
+
+    assert cache.lookup("What is the weather in Paris?", "llm") is None
+    cache.update("What is the weather in Paris?", "llm", [Generation(text="Sunny")])
+
+    assert cache.embedding.calls == 1
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+from langflow.services.loop_monitor.service import LoopMonitorService
+
+
+def _block(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_loop_monitor_measures_lag_and_records_slow_callbacks():
+    monitor = LoopMonitorService(interval=0.01, threshold=0.05)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    async def slow_vertex():
+        _block(0.2)
+
+    await asyncio.create_task(slow_vertex(), name="ChatInput-abc Run 0")
+    await asyncio.sleep(0.05)
+    await monitor.teardown()
+
+    assert monitor.histogram.count > 0
+    assert monitor.max_lag >= 0.1
+    snapshot = monitor.snapshot()
+    assert snapshot["slow_callback_count"] == 1
+    slow_callback = snapshot["slow_callbacks"][0]
+    assert slow_callback["task"] == "ChatInput-abc Run 0"
+    assert slow_callback["duration_seconds"] >= 0.1
+    assert "_block" in slow_callback["stack"][-1]
+
+
+async def test_loop_monitor_disabled():
+    monitor = LoopMonitorService(enabled=False)
+    monitor.start()
+    await monitor.teardown()
+
+    assert monitor.histogram.count == 0
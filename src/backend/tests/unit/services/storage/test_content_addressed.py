@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.file.model import File
+from langflow.services.storage.content_addressed import (
+    blob_lock,
+    blob_path,
+    collect_unreferenced_blobs,
+    hash_chunks,
+    release_blob,
+    save_blob,
+)
+from langflow.services.storage.local import LocalStorageService
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+CONTENT = b"same content"
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = MagicMock()
+    settings_service.settings.config_dir = str(tmp_path)
+    return LocalStorageService(MagicMock(), settings_service)
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _add_file(session, path: str, content_hash: str) -> File:
+    file = File(user_id=uuid4(), name=f"file {uuid4()}", path=path, size=len(CONTENT), content_hash=content_hash)
+    session.add(file)
+    await session.commit()
+    return file
+
+
+async def test_blob_is_written_once_and_released_with_its_last_reference(session, storage_service):
+    content_hash, size = await hash_chunks(_chunks(b"same ", b"content"))
+    path = blob_path(content_hash, ".txt")
+    assert size == len(CONTENT)
+
+    assert await save_blob(session, storage_service, path, _chunks(CONTENT))
+    first = await _add_file(session, path, content_hash)
+    assert not await save_blob(session, storage_service, path, _chunks(CONTENT))
+    second = await _add_file(session, path, content_hash)
+
+    await session.delete(first)
+    await session.flush()
+    assert not await release_blob(session, storage_service, path)
+    assert await storage_service.get_file("blobs", f"{content_hash}.txt") == CONTENT
+
+    await session.delete(second)
+    await session.flush()
+    assert await release_blob(session, storage_service, path)
+    assert await storage_service.list_files("blobs") == []
+
+
+async def test_collect_unreferenced_blobs(session, storage_service):
+    referenced_hash, _ = await hash_chunks(_chunks(CONTENT))
+    await save_blob(session, storage_service, blob_path(referenced_hash), _chunks(CONTENT))
+    await _add_file(session, blob_path(referenced_hash), referenced_hash)
+    await storage_service.save_file("blobs", "0" * 64, b"orphan")
+
+    # The orphan may be the blob of an upload yet to commit its file
+    assert await collect_unreferenced_blobs(session, storage_service) == 0
+    assert await collect_unreferenced_blobs(session, storage_service, grace_period=0) == 1
+    assert await storage_service.list_files("blobs") == [referenced_hash]
+
+
+async def test_release_keeps_a_blob_an_upload_relies_on(tmp_path, storage_service):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'files.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    content_hash, _ = await hash_chunks(_chunks(CONTENT))
+    path = blob_path(content_hash)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await save_blob(session, storage_service, path, _chunks(CONTENT))
+        first = await _add_file(session, path, content_hash)
+    blob_found = asyncio.Event()
+
+    async def upload():
+        async with AsyncSession(engine, expire_on_commit=False) as session, blob_lock(session, path):
+            # The blob is referenced by the first file, so it is not written again
+            assert not await save_blob(session, storage_service, path, _chunks(CONTENT))
+            blob_found.set()
+            # The first file is deleted meanwhile
+            await asyncio.sleep(0.1)
+            await _add_file(session, path, content_hash)
+
+    async def delete_first() -> bool:
+        await blob_found.wait()
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await session.delete(await session.get(File, first.id))
+            await session.commit()
+            return await release_blob(session, storage_service, path)
+
+    _, released = await asyncio.gather(upload(), delete_first())
+    await engine.dispose()
+
+    assert not released
+    assert await storage_service.get_file("blobs", content_hash) == CONTENT
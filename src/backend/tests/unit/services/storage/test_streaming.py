@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.utils import ByteRange, RangeNotSatisfiableError, parse_range_header
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = MagicMock()
+    settings_service.settings.config_dir = str(tmp_path)
+    return LocalStorageService(MagicMock(), settings_service)
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_save_file_stream_writes_chunks(storage_service):
+    size = await storage_service.save_file_stream("flow", "file.txt", _chunks(b"hello ", b"world"))
+
+    assert size == 11
+    assert await storage_service.get_file("flow", "file.txt") == b"hello world"
+    assert await storage_service.list_files("flow") == ["file.txt"]
+
+
+async def test_save_file_stream_leaves_no_partial_file_on_failure(storage_service):
+    async def failing_chunks():
+        yield b"hello"
+        msg = "Connection lost"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage_service.save_file_stream("flow", "file.txt", failing_chunks())
+
+    assert [path async for path in anyio.Path(storage_service.data_dir / "flow").iterdir()] == []
+
+
+async def test_get_file_stream_reads_range_in_chunks(storage_service):
+    await storage_service.save_file("flow", "file.txt", b"0123456789")
+
+    whole = [chunk async for chunk in storage_service.get_file_stream("flow", "file.txt", chunk_size=4)]
+    part = [chunk async for chunk in storage_service.get_file_stream("flow", "file.txt", start=3, end=8, chunk_size=4)]
+
+    assert whole == [b"0123", b"4567", b"89"]
+    assert part == [b"3456", b"78"]
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-3", ByteRange(0, 3)),
+        ("bytes=5-", ByteRange(5, 9)),
+        ("bytes=-4", ByteRange(6, 9)),
+        ("bytes=2-100", ByteRange(2, 9)),
+        ("bytes=0-1,4-5", None),
+        ("items=0-3", None),
+        ("bytes=4-2", None),
+    ],
+)
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 10) == expected
+
+
+def test_parse_range_header_beyond_the_file():
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range_header("bytes=10-", 10)
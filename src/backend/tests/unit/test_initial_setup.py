@@ -11,13 +11,14 @@ from httpx import AsyncClient
 from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.initial_setup.setup import (
+    create_or_update_starter_projects,
     detect_github_url,
     get_project_data,
     load_bundles_from_urls,
     load_starter_projects,
     update_projects_components_with_latest_component_versions,
 )
-from langflow.interface.components import aget_all_types_dict
+from langflow.interface.components import aget_all_types_dict, get_and_cache_all_types_dict
 from langflow.services.database.models import Flow
 from langflow.services.database.models.folder.model import Folder
 from langflow.services.deps import get_settings_service, session_scope
@@ -76,6 +77,23 @@ async def test_create_or_update_starter_projects():
         assert num_db_projects == num_projects
 
 
+@pytest.mark.usefixtures("client")
+async def test_create_or_update_starter_projects_skips_unchanged_projects():
+    async def get_starter_flow_ids():
+        async with session_scope() as session:
+            stmt = select(Folder).options(selectinload(Folder.flows)).where(Folder.name == STARTER_FOLDER_NAME)
+            folder = (await session.exec(stmt)).first()
+            return {flow.name: flow.id for flow in folder.flows}
+
+    all_types = await get_and_cache_all_types_dict(get_settings_service())
+    await create_or_update_starter_projects(all_types)
+    flow_ids = await get_starter_flow_ids()
+    await create_or_update_starter_projects(all_types)
+
+    assert await get_starter_flow_ids() == flow_ids
+    assert len(flow_ids) == len(await load_starter_projects())
+
+
 # Some starter projects require integration
 # async def test_starter_projects_can_run_successfully(client):
 #     with session_scope() as session:
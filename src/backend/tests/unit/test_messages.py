@@ -8,6 +8,7 @@ from langflow.memory import (
     add_messages,
     adelete_messages,
     aget_messages,
+    aget_messages_page,
     astore_message,
     aupdate_messages,
     delete_messages,
@@ -75,6 +76,25 @@ async def test_aget_messages():
     assert messages[1].text == "Test message 2"
 
 
+@pytest.mark.usefixtures("client")
+async def test_aget_messages_page_walks_every_message_once():
+    await aadd_messages(
+        [
+            Message(text=f"Paged message {i}", sender="User", sender_name="User", session_id="paged_session")
+            for i in range(5)
+        ]
+    )
+    texts = []
+    cursor = None
+    while True:
+        messages, cursor = await aget_messages_page(session_id="paged_session", limit=2, cursor=cursor)
+        texts.extend(message.text for message in messages)
+        if cursor is None:
+            break
+
+    assert sorted(texts) == [f"Paged message {i}" for i in range(5)]
+
+
 @pytest.mark.usefixtures("client")
 def test_add_messages():
     message = Message(text="New Test message", sender="User", sender_name="User", session_id="new_session_id")
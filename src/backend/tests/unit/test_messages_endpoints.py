@@ -127,3 +127,28 @@ async def test_no_messages_found_with_given_session_id(client, logged_in_headers
 
     assert response.status_code == 404, response.text
     assert response.json()["detail"] == "Not Found"
+
+
+@pytest.mark.usefixtures("session")
+async def test_get_messages_keyset_pagination(client, logged_in_headers, created_messages):
+    pages = []
+    params = {"session_id": "session_id2", "limit": 2}
+    while True:
+        response = await client.get("api/v1/monitor/messages", headers=logged_in_headers, params=params)
+        assert response.status_code == 200, response.text
+        pages.append([message["id"] for message in response.json()])
+        if (cursor := response.headers.get("X-Next-Cursor")) is None:
+            break
+        params["cursor"] = cursor
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert sorted(message_id for page in pages for message_id in page) == sorted(
+        str(message.id) for message in created_messages
+    )
+
+
+async def test_get_messages_invalid_cursor(client, logged_in_headers):
+    response = await client.get(
+        "api/v1/monitor/messages", headers=logged_in_headers, params={"limit": 2, "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400, response.text
@@ -0,0 +1,94 @@
+import gzip
+import json
+
+from langflow.utils.compression import (
+    build_precompressed_payload,
+    gzip_stream,
+    iter_json_array,
+    precompressed_response,
+    select_encoding,
+    streaming_json_response,
+)
+from starlette.requests import Request
+
+
+def make_request(headers: dict[str, str]) -> Request:
+    raw_headers = [(key.lower().encode(), value.encode()) for key, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+def test_build_precompressed_payload_round_trips():
+    data = {"inputs": {"ChatInput": {"display_name": "Chat Input"}}}
+    payload = build_precompressed_payload(data)
+
+    assert json.loads(payload.bodies["identity"]) == data
+    assert json.loads(gzip.decompress(payload.bodies["gzip"])) == data
+    assert payload.etag.startswith('"')
+    assert payload.etag == build_precompressed_payload(data).etag
+    assert payload.etag != build_precompressed_payload({"other": {}}).etag
+
+
+def test_select_encoding():
+    available = ("identity", "gzip", "br")
+    assert select_encoding("gzip, deflate, br", available) == "br"
+    assert select_encoding("gzip;q=1.0, br;q=0.5", available) == "gzip"
+    assert select_encoding("zstd", available) == "identity"
+    assert select_encoding("*", ("identity", "gzip")) == "gzip"
+    assert select_encoding("", available) == "identity"
+
+
+def test_precompressed_response_negotiates_and_revalidates():
+    payload = build_precompressed_payload({"a": 1})
+
+    response = precompressed_response(payload, make_request({"Accept-Encoding": "gzip"}))
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    gzip_etag = response.headers["etag"]
+    assert gzip_etag == payload.etag_for("gzip") != payload.etag
+    assert response.body == payload.bodies["gzip"]
+
+    response = precompressed_response(payload, make_request({}))
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == payload.etag
+    assert response.body == payload.bodies["identity"]
+
+    response = precompressed_response(payload, make_request({"If-None-Match": f"W/{payload.etag}"}))
+    assert response.status_code == 304
+    assert response.body == b""
+
+    # The gzip body is not a valid copy of the identity representation
+    response = precompressed_response(payload, make_request({"If-None-Match": gzip_etag}))
+    assert response.status_code == 200
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_iter_json_array_streams_in_chunks():
+    async def items():
+        for i in range(100):
+            yield {"id": i, "name": f"flow {i}"}
+
+    chunks = [chunk async for chunk in iter_json_array(items(), chunk_size=256)]
+
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == [{"id": i, "name": f"flow {i}"} for i in range(100)]
+    assert json.loads(await collect(iter_json_array([]))) == []
+
+
+async def test_gzip_stream_produces_a_single_gzip_member():
+    body = await collect(gzip_stream(iter_json_array([{"id": i} for i in range(1000)], chunk_size=128)))
+
+    assert json.loads(gzip.decompress(body)) == [{"id": i} for i in range(1000)]
+
+
+async def test_streaming_json_response_honors_accept_encoding():
+    items = [{"id": 1}]
+    gzipped = streaming_json_response(items, make_request({"Accept-Encoding": "gzip"}))
+    identity = streaming_json_response(items, make_request({"Accept-Encoding": "identity"}))
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(await collect(gzipped.body_iterator))) == items
+    assert "content-encoding" not in identity.headers
+    assert json.loads(await collect(identity.body_iterator)) == items
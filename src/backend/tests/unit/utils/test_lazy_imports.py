@@ -0,0 +1,95 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from langflow.utils.lazy_imports import is_instance_of, lazy_imports
+
+
+def assert_not_imported(code: str, *modules: str) -> None:
+    """Run `code` in a fresh interpreter and check that it did not import any of `modules`."""
+    check = textwrap.dedent(code) + textwrap.dedent(
+        f"""
+        import sys
+        imported = [module for module in {list(modules)!r} if module in sys.modules]
+        assert not imported, f"imported eagerly: {{imported}}"
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=False)  # noqa: S603
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_package"
+    package.mkdir()
+    (package / "heavy.py").write_text("LOADED = True\n\n\nclass Heavy:\n    pass\n")
+    (package / "__init__.py").write_text(
+        textwrap.dedent(
+            """
+            from langflow.utils.lazy_imports import lazy_imports
+
+            _dynamic_imports = {"Heavy": "heavy", "Missing": "missing"}
+            __all__ = ["Heavy", "Missing"]
+            __getattr__, __dir__ = lazy_imports(__name__, _dynamic_imports, __all__)
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_package"
+    for name in [name for name in sys.modules if name.startswith("lazy_package")]:
+        del sys.modules[name]
+
+
+def test_lazy_imports_resolves_names_on_first_access(lazy_package):
+    import importlib
+
+    package = importlib.import_module(lazy_package)
+    assert f"{lazy_package}.heavy" not in sys.modules
+    assert "Heavy" in dir(package)
+
+    heavy = package.Heavy
+    assert f"{lazy_package}.heavy" in sys.modules
+    assert vars(package)["Heavy"] is heavy
+
+    with pytest.raises(AttributeError, match="Missing"):
+        _ = package.Missing
+    with pytest.raises(AttributeError, match="Unknown"):
+        _ = package.Unknown
+
+
+def test_lazy_imports_dir_defaults_to_dynamic_imports():
+    _, dir_ = lazy_imports(__name__, {"Lazy": "lazy"})
+    assert "Lazy" in dir_()
+
+
+def test_is_instance_of_does_not_import_the_module():
+    assert is_instance_of({}, "collections", "OrderedDict") is False
+    assert is_instance_of(__import__("collections").OrderedDict(), "collections", "OrderedDict") is True
+    assert is_instance_of(object(), "a_module_that_was_never_imported", "Anything") is False
+    assert "a_module_that_was_never_imported" not in sys.modules
+
+
+def test_schema_and_serialization_do_not_import_pandas():
+    assert_not_imported(
+        """
+        from langflow.schema import Data, Message
+        from langflow.schema.dotdict import dotdict
+        from langflow.serialization import serialize
+
+        assert serialize(Data(data={"a": 1})) is not None
+        """,
+        "pandas",
+        "langflow.schema.dataframe",
+    )
+
+
+def test_component_packages_import_their_modules_on_access():
+    assert_not_imported(
+        """
+        import langflow.components.vectorstores
+        import langflow.components.processing
+        """,
+        "langflow.components.vectorstores.astradb",
+        "langflow.components.processing.split_text",
+    )
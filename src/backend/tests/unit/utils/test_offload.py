@@ -0,0 +1,43 @@
+import orjson
+from langflow.utils import offload
+from langflow.utils.offload import rows_json_response
+from pydantic import BaseModel, field_serializer
+
+
+class Row(BaseModel):
+    id: int
+    payload: dict
+
+    @field_serializer("payload")
+    def serialize_payload(self, payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+
+
+def _rows(count: int) -> list[dict]:
+    return [{"id": index, "payload": {"index": index}} for index in range(count)]
+
+
+async def test_rows_json_response_in_a_worker_thread(monkeypatch):
+    calls = []
+
+    async def to_thread(func, *args, **kwargs):
+        calls.append(func)
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(offload.asyncio, "to_thread", to_thread)
+
+    few = await rows_json_response(Row, _rows(2))
+    many = await rows_json_response(Row, _rows(offload.OFFLOAD_MIN_ROWS))
+
+    assert [row["id"] for row in orjson.loads(few.body)] == [0, 1]
+    assert len(orjson.loads(many.body)) == offload.OFFLOAD_MIN_ROWS
+    # Only the large list is worth the hop to a thread
+    assert len(calls) == 1
+
+
+async def test_rows_json_response_matches_the_model_serialization():
+    response = await rows_json_response(Row, _rows(100), headers={"X-Next-Cursor": "cursor"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "cursor"
+    assert orjson.loads(response.body) == [row.model_dump() for row in map(Row.model_validate, _rows(100))]
@@ -0,0 +1,45 @@
+import json
+import os
+import sys
+
+from langflow.utils.startup_profile import (
+    component_build_timer,
+    get_startup_profiler,
+    process_report_path,
+    start_startup_profiling,
+    startup_phase,
+    stop_startup_profiling,
+)
+
+
+def test_startup_profile_records_phases_imports_and_components(tmp_path):
+    sys.modules.pop("colorsys", None)
+    profiler = start_startup_profiling()
+    try:
+        assert start_startup_profiling() is profiler
+        with startup_phase("imports"):
+            import colorsys  # noqa: F401
+        with component_build_timer("inputs/chat.py"):
+            pass
+    finally:
+        assert stop_startup_profiling() is profiler
+    assert get_startup_profiler() is None
+
+    report = json.loads(profiler.write_report(tmp_path / "report.json").read_text())
+    assert [phase["name"] for phase in report["phases"]] == ["imports"]
+    colorsys_import = next(record for record in report["imports"] if record["module"] == "colorsys")
+    assert 0 <= colorsys_import["self_us"] <= colorsys_import["cumulative_us"]
+    assert [component["name"] for component in report["components"]] == ["inputs/chat.py"]
+
+
+def test_startup_phase_is_a_noop_without_profiling():
+    with startup_phase("ignored"), component_build_timer("ignored"):
+        pass
+    assert get_startup_profiler() is None
+
+
+def test_each_worker_writes_its_own_report(tmp_path):
+    path = tmp_path / "startup_profile.json"
+
+    assert process_report_path(path, workers=1) == path
+    assert process_report_path(path, workers=4) == tmp_path / f"startup_profile.{os.getpid()}.json"
@@ -0,0 +1,61 @@
+import asyncio
+import io
+import zipfile
+
+import pytest
+from langflow.utils.zip_stream import ZipEntry, stream_zip
+
+
+async def _chunks(data: bytes, chunk_size: int = 4):
+    for offset in range(0, len(data), chunk_size):
+        await asyncio.sleep(0)
+        yield data[offset : offset + chunk_size]
+
+
+async def _read_archive(entries, **kwargs) -> zipfile.ZipFile:
+    archive = b"".join([chunk async for chunk in stream_zip(entries, **kwargs)])
+    return zipfile.ZipFile(io.BytesIO(archive))
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+async def test_stream_zip_writes_entries_in_order(compression):
+    entries = [
+        ZipEntry("first.txt", lambda: _chunks(b"hello world")),
+        ZipEntry("second.bin", lambda: _chunks(bytes(range(256)) * 10), size=2560),
+        ZipEntry("empty.txt", lambda: _chunks(b""), size=0),
+    ]
+
+    with await _read_archive(entries, compression=compression, prefetch_entries=1) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ["first.txt", "second.bin", "empty.txt"]
+        assert archive.read("first.txt") == b"hello world"
+        assert archive.read("second.bin") == bytes(range(256)) * 10
+        assert archive.read("empty.txt") == b""
+
+
+async def test_stream_zip_yields_before_reading_every_entry():
+    opened = []
+
+    def entry(name: str) -> ZipEntry:
+        def open_entry():
+            opened.append(name)
+            return _chunks(name.encode() * 100)
+
+        return ZipEntry(name, open_entry)
+
+    stream = stream_zip([entry(f"{index}.txt") for index in range(10)], prefetch_entries=2)
+    await anext(stream)
+    await stream.aclose()
+
+    # The entry being written and the ones read ahead of it
+    assert opened == ["0.txt", "1.txt", "2.txt"]
+
+
+async def test_stream_zip_raises_errors_of_entries():
+    async def failing_chunks():
+        yield b"partial"
+        msg = "Storage unavailable"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError, match="Storage unavailable"):
+        await _read_archive([ZipEntry("file.txt", failing_chunks)])
@@ -1,6 +1,9 @@
 import { NODE_WIDTH } from "@/constants/constants";
+import { api } from "@/controllers/API/api";
+import { getURL } from "@/controllers/API/helpers/constants";
 import { track } from "@/customization/utils/analytics";
 import useFlowStore from "@/stores/flowStore";
+import { useTypesStore } from "@/stores/typesStore";
 import { APIClassType } from "@/types/api";
 import { AllNodeType } from "@/types/flow";
 import { getNodeId } from "@/utils/reactflowUtils";
@@ -8,17 +11,47 @@ import { getNodeRenderType } from "@/utils/utils";
 import { useStoreApi } from "@xyflow/react";
 import { useCallback } from "react";
 
+// With lazy component loading, the sidebar lists stubs without base classes or output types: the full
+// template is fetched once when the component is first added, and replaces the stub in the types store.
+async function resolveLazyComponent(
+  component: APIClassType,
+  type: string,
+): Promise<APIClassType> {
+  if (!component.lazy_loaded) {
+    return component;
+  }
+  try {
+    const response = await api.get<APIClassType>(
+      getURL("ALL", { component: type }),
+    );
+    const fullComponent = response.data;
+    const { data, setTypes } = useTypesStore.getState();
+    const category = Object.keys(data).find((key) => type in data[key]);
+    if (category) {
+      setTypes({
+        ...data,
+        [category]: { ...data[category], [type]: fullComponent },
+      });
+    }
+    return fullComponent;
+  } catch (error) {
+    console.error(`[Types] Error loading component ${type}:`, error);
+    return component;
+  }
+}
+
 export function useAddComponent() {
   const store = useStoreApi();
   const paste = useFlowStore((state) => state.paste);
 
   const addComponent = useCallback(
-    (
+    async (
       component: APIClassType,
       type: string,
       position?: { x: number; y: number },
     ) => {
       track("Component Added", { componentType: component.display_name });
+      component = await resolveLazyComponent(component, type);
 
       const {
         height,